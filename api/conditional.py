@@ -0,0 +1,76 @@
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.http import http_date, parse_etags, parse_http_date_safe
+from rest_framework import status
+from rest_framework.response import Response
+
+
+class ConditionalGetMixin:
+    """
+    ETag / Last-Modified support for `list` and `retrieve`.
+
+    Validators are cheap to compute: `MAX(updated_at)` and `COUNT(*)` over the
+    filtered queryset for lists, the row's own `updated_at` for details. A
+    request whose `If-None-Match` (or, failing that, `If-Modified-Since`)
+    still matches gets a `304` before the serializer ever runs.
+
+    `retrieve` serializes the instance it fetched for the validators rather
+    than calling `super().retrieve()`, which would fetch it again. List
+    response caches (`jobs.caching.AnonymousResponseCacheMixin`) before this
+    mixin, so cache hits skip the validator queries.
+    """
+    last_modified_field = 'updated_at'
+
+    def get_list_validators(self, queryset):
+        """Return `(etag_source, last_modified)` for the filtered list queryset."""
+        stats = queryset.order_by().aggregate(
+            last_modified=Max(self.last_modified_field), total=Count('pk')
+        )
+        return f"{stats['total']}:{stats['last_modified']}", stats['last_modified']
+
+    def get_object_validators(self, instance):
+        """Return `(etag_source, last_modified)` for a single object."""
+        last_modified = getattr(instance, self.last_modified_field)
+        return f"{instance.pk}:{last_modified}", last_modified
+
+    def list(self, request, *args, **kwargs):
+        validators = self.get_list_validators(self.filter_queryset(self.get_queryset()))
+        return self.conditional_response(super().list, validators, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+
+        def render(request, *args, **kwargs):
+            return Response(self.get_serializer(instance).data)
+        return self.conditional_response(render, self.get_object_validators(instance), request, *args, **kwargs)
+
+    def conditional_response(self, handler, validators, request, *args, **kwargs):
+        etag_source, last_modified = validators
+        # The user is part of the tag because querysets are role-scoped.
+        raw = f"{request.get_full_path()}|{request.user.pk}|{etag_source}"
+        etag = f'W/"{hashlib.md5(raw.encode()).hexdigest()}"'
+        last_modified = int(last_modified.timestamp()) if last_modified else None
+
+        if self.is_not_modified(request, etag, last_modified):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = handler(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+
+        response['ETag'] = etag
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(last_modified)
+        return response
+
+    @staticmethod
+    def is_not_modified(request, etag, last_modified):
+        if_none_match = request.headers.get('If-None-Match')
+        if if_none_match:
+            # Weak comparison, as GET conditional requests use.
+            tags = {tag.removeprefix('W/') for tag in parse_etags(if_none_match)}
+            return '*' in tags or etag.removeprefix('W/') in tags
+
+        if_modified_since = parse_http_date_safe(request.headers.get('If-Modified-Since', ''))
+        return bool(last_modified and if_modified_since and last_modified <= if_modified_since)
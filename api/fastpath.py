@@ -0,0 +1,199 @@
+import inspect
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import fields, relations, serializers
+from rest_framework.response import Response
+
+
+class Unsupported(Exception):
+    """The serializer has a field the compiler cannot reproduce exactly."""
+
+
+def _converter(field):
+    # Same result as `field.to_representation` for the values `values()` returns.
+    if hasattr(field, 'preload'):
+        return field.to_representation
+    if isinstance(field, fields.CharField):
+        return str
+    if isinstance(field, fields.IntegerField):
+        return int
+    if isinstance(field, relations.PrimaryKeyRelatedField) and field.pk_field is None:
+        return None
+    return field.to_representation
+
+
+def _takes_only_self(function):
+    parameters = list(inspect.signature(function).parameters.values())[1:]
+    return all(
+        parameter.default is not parameter.empty or parameter.kind in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD)
+        for parameter in parameters
+    )
+
+
+def _forward_relation(model, name):
+    try:
+        model_field = model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return None
+    if model_field.concrete and (model_field.many_to_one or model_field.one_to_one):
+        return model_field
+    return None
+
+
+class CompiledRepresentation:
+    """
+    A serializer's read output, precompiled into per-field mappers over
+    `values()` rows.
+
+    Built by `compile_representation()`; `paths` are the `values()` lookups to
+    fetch and `render(rows)` returns the same dicts the serializer would.
+    """
+
+    def __init__(self, serializer, model, annotations=()):
+        self.paths = {'pk': None}
+        self.annotations = set(annotations)
+        self.preloads = []
+        self.build = self._compile(serializer, model, '', root=True)
+
+    def render(self, rows):
+        build = self.build
+        # Fields with a `preload(values)` hook batch-load what they render.
+        for field, key in self.preloads:
+            field.preload({row[key] for row in rows} - {None})
+        return [build(row) for row in rows]
+
+    def _path(self, path):
+        self.paths[path] = None
+        return path
+
+    def _compile(self, serializer, model, prefix, root=False):
+        hints = getattr(getattr(serializer, 'Meta', None), 'field_columns', {})
+        steps = []
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+            if field.source == '*':
+                raise Unsupported(name)
+            attrs = field.source_attrs
+
+            if isinstance(field, serializers.BaseSerializer):
+                relation = _forward_relation(model, attrs[0])
+                if relation is None or len(attrs) != 1 or isinstance(field, serializers.ListSerializer):
+                    raise Unsupported(name)
+                nested = self._compile(field, relation.related_model, f'{prefix}{relation.name}__')
+                steps.append(self._nested_step(name, self._path(f'{prefix}{relation.name}'), nested))
+            elif root and len(attrs) == 1 and attrs[0] in self.annotations:
+                steps.append(self._value_step(name, field, self._path(attrs[0])))
+            elif name in hints:
+                steps.append(self._method_step(name, field, model, prefix, attrs, hints[name]))
+            elif len(attrs) == 1:
+                step = self._column_step(name, field, model, prefix, attrs[0], root)
+                if step is not None:
+                    steps.append(step)
+            else:
+                raise Unsupported(name)
+
+        def build(row):
+            return {name: get(row) for name, get in steps}
+        return build
+
+    def _nested_step(self, name, key, nested):
+        def get(row):
+            return None if row[key] is None else nested(row)
+        return name, get
+
+    def _column_step(self, name, field, model, prefix, attr, root):
+        try:
+            model_field = model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            if not root and not field.required:
+                # Attributes only set on top-level rows (annotations) are
+                # missing on related objects, where DRF skips the field.
+                return None
+            raise Unsupported(name)
+
+        if model_field.is_relation:
+            # A PrimaryKeyRelatedField, or a plain field reading the `<fk>_id` column.
+            reads_key = isinstance(field, relations.PrimaryKeyRelatedField) or attr == model_field.attname
+            if not reads_key or _forward_relation(model, attr) is None:
+                raise Unsupported(name)
+        return self._value_step(name, field, self._path(f'{prefix}{model_field.name}'))
+
+    def _value_step(self, name, field, key):
+        if hasattr(field, 'preload'):
+            self.preloads.append((field, key))
+        convert = _converter(field)
+        if convert is None:
+            def get(row):
+                return row[key]
+        else:
+            def get(row):
+                value = row[key]
+                return None if value is None else convert(value)
+        return name, get
+
+    def _method_step(self, name, field, model, prefix, attrs, columns):
+        # e.g. `employer.get_full_name` reading `employer__first_name` and
+        # `employer__last_name`: the method runs on a bare stand-in instance.
+        chain = []
+        for attr in attrs:
+            relation = _forward_relation(model, attr)
+            if relation is None:
+                break
+            if relation.null:
+                raise Unsupported(name)
+            chain.append(attr)
+            model = relation.related_model
+        rest = attrs[len(chain):]
+        relation_prefix = '__'.join(chain) + '__' if chain else ''
+        if not rest or any(not column.startswith(relation_prefix) or '__' in column[len(relation_prefix):] for column in columns):
+            raise Unsupported(name)
+
+        keys = {column[len(relation_prefix):]: self._path(f'{prefix}{column}') for column in columns}
+        convert = _converter(field) or (lambda value: value)
+        # A plain method is called directly; anything else goes through DRF.
+        method = getattr(model, rest[0], None) if len(rest) == 1 else None
+        if not inspect.isfunction(method) or not _takes_only_self(method):
+            method = None
+
+        def get(row):
+            # Only the hinted columns are read, so __init__ (defaults,
+            # signals) is skipped.
+            instance = model.__new__(model)
+            instance.__dict__.update({column: row[key] for column, key in keys.items()})
+            value = method(instance) if method else fields.get_attribute(instance, rest)
+            return None if value is None else convert(value)
+        return name, get
+
+
+def compile_representation(serializer, queryset):
+    """A CompiledRepresentation of `serializer`, or None if a field needs the model instance."""
+    try:
+        return CompiledRepresentation(serializer, queryset.model, queryset.query.annotations)
+    except Unsupported:
+        return None
+
+
+class ValuesListMixin:
+    """
+    Serves `list` from `values()` rows through a CompiledRepresentation of
+    the serializer, skipping model instances and per-field serializer
+    dispatch. Output is identical to the serializer's; views fall back to it
+    whenever a selected field cannot be compiled. Writes are unaffected.
+
+    `sparse_required_columns` (see api.fieldsets) are fetched as well, for
+    cursors and ETags.
+    """
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        compiled = compile_representation(self.get_serializer(), queryset)
+        if compiled is None:
+            return super().list(request, *args, **kwargs)
+
+        paths = dict.fromkeys([*compiled.paths, *getattr(self, 'sparse_required_columns', ())])
+        rows = queryset.values(*paths)
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(compiled.render(page))
+        return Response(compiled.render(rows))
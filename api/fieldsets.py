@@ -0,0 +1,130 @@
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import SAFE_METHODS
+
+
+def requested_names(params, name):
+    return [item.strip() for value in params.getlist(name) for item in value.split(',') if item.strip()]
+
+
+class SparseFieldsetSerializerMixin:
+    """
+    `?fields=a,b` / `?omit=c` support for a top-level serializer on reads.
+
+    `Meta.compact_fields` is what a list shows when `?fields=` is not given
+    (`?fields=*` asks for every field). `Meta.field_columns` names the model
+    columns read by fields that are not plain model fields, such as
+    `employer.get_full_name`, so the view can still defer everything else.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get('request')
+        if request is None or request.method not in SAFE_METHODS:
+            return
+
+        params = request.query_params
+        requested, omitted = requested_names(params, 'fields'), requested_names(params, 'omit')
+        unknown = [name for name in requested + omitted if name != '*' and name not in self.fields]
+        if unknown:
+            raise ValidationError({'fields': [f"Unknown field(s): {', '.join(unknown)}."]})
+
+        if requested and '*' not in requested:
+            selected = set(requested)
+        elif not requested and self.context.get('compact') and hasattr(self.Meta, 'compact_fields'):
+            selected = set(self.Meta.compact_fields)
+        else:
+            selected = set(self.fields)
+        for name in list(self.fields):
+            if name not in selected or name in omitted:
+                self.fields.pop(name)
+
+
+def column_paths(serializer, model, prefix=''):
+    """
+    Model paths (`'title'`, `'category__name'`) read by a serializer's fields.
+
+    A path ending in `*` means every column of that model is needed.
+    """
+    hints = getattr(getattr(serializer, 'Meta', None), 'field_columns', {})
+    paths = set()
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+        if name in hints:
+            paths.update(f'{prefix}{path}' for path in hints[name])
+            continue
+        if field.source == '*':
+            paths.add(f'{prefix}*')
+            continue
+        try:
+            model_field = model._meta.get_field(field.source_attrs[0])
+        except FieldDoesNotExist:
+            paths.add(f'{prefix}*')
+            continue
+
+        if not model_field.is_relation:
+            paths.add(f'{prefix}{model_field.name}')
+        elif not (model_field.many_to_one or model_field.one_to_one) or not model_field.concrete:
+            paths.add(f'{prefix}*')
+        elif isinstance(field, serializers.BaseSerializer) and not getattr(field, 'many', False):
+            paths.update(column_paths(field, model_field.related_model, f'{prefix}{model_field.name}__'))
+        elif len(field.source_attrs) > 1:
+            paths.add(f'{prefix}{model_field.name}__*')
+        else:
+            paths.add(f'{prefix}{model_field.attname}')
+    return paths
+
+
+class SparseFieldsetViewMixin:
+    """
+    Pushes the serializer's selected fields down into the queryset on reads.
+
+    Unselected columns are deferred and unused relations are no longer
+    joined, on the model and on every relation the response traverses. List
+    responses use the serializer's compact representation unless `?fields=`
+    asks otherwise; `?export=` downloads (see api.exports) keep the full one.
+
+    `sparse_required_columns` are always loaded, e.g. for ETags or cursors.
+    """
+    sparse_required_columns = ()
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['compact'] = self.action == 'list' and 'export' not in self.request.query_params
+        return context
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.request.method not in SAFE_METHODS or getattr(self, 'swagger_fake_view', False):
+            return queryset
+        serializer = self.get_serializer()
+        if not isinstance(serializer, SparseFieldsetSerializerMixin):
+            return queryset
+        paths = column_paths(serializer, queryset.model) | set(self.sparse_required_columns)
+        return self.restrict_columns(queryset, paths)
+
+    @staticmethod
+    def restrict_columns(queryset, paths):
+        relations = {''}
+        for path in paths:
+            parts = path.split('__')[:-1]
+            relations.update('__'.join(parts[:depth]) + '__' for depth in range(1, len(parts) + 1))
+
+        model, deferred = queryset.model, []
+        for relation in sorted(relations):
+            if f'{relation}*' in paths:
+                continue
+            level = model
+            for name in filter(None, relation.split('__')):
+                level = level._meta.get_field(name).related_model
+            deferred.extend(
+                f'{relation}{field.name}' for field in level._meta.concrete_fields
+                if not field.is_relation and not field.primary_key and f'{relation}{field.name}' not in paths
+            )
+
+        queryset = queryset.select_related(None).defer(*deferred)
+        joined = [relation.rstrip('_') for relation in sorted(relations) if relation]
+        # An empty select_related() would follow every relation.
+        return queryset.select_related(*joined) if joined else queryset
@@ -1,6 +1,22 @@
 from django.contrib import admin
-from applications.models import Application
+from applications.models import Application, ApplicationStatusChange
 
 # Register your models here.
 
+class ApplicationStatusChangeAdmin(admin.ModelAdmin):
+    """Read-only: the log is append-only and written with the transitions themselves."""
+    list_display = ('application', 'from_status', 'to_status', 'changed_by', 'changed_at')
+    list_filter = ('to_status',)
+    readonly_fields = ('application', 'job', 'applicant', 'from_status', 'to_status', 'changed_by', 'changed_at')
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
 admin.site.register(Application)
+admin.site.register(ApplicationStatusChange, ApplicationStatusChangeAdmin)
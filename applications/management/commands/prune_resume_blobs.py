@@ -0,0 +1,50 @@
+# applications/management/commands/prune_resume_blobs.py
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from applications.models import ResumeBlob
+from applications.resumes import get_resume_backend
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete stored resumes no application references any more (deleted applications, "
+        "failed submissions). Recent ones are kept, as a new application may be about to use them."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--min-age-hours', type=int, default=24, help="Only prune resumes stored before this.")
+        parser.add_argument('--batch-size', type=int, default=1000, help="Resumes per DELETE statement.")
+        parser.add_argument('--dry-run', action='store_true', help="Only report how many resumes are unreferenced.")
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(hours=options['min_age_hours'])
+        orphans = ResumeBlob.objects.filter(created_at__lt=cutoff, applications__isnull=True)
+
+        if options['dry_run']:
+            self.stdout.write(f"🔎 {orphans.count()} stored resumes are unreferenced.")
+            return
+
+        backend, pruned = get_resume_backend(), 0
+        while True:
+            digests = list(orphans.order_by('pk').values_list('pk', flat=True)[:options['batch_size']])
+            if not digests:
+                break
+            with transaction.atomic():
+                # Locked and re-checked, in case a new application reused one meanwhile.
+                deleted = list(
+                    ResumeBlob.objects.select_for_update(of=('self',))
+                    .filter(pk__in=digests, applications__isnull=True).values_list('pk', flat=True)
+                )
+                ResumeBlob.objects.filter(pk__in=deleted).delete()
+                # Unlinked while the rows are still locked: a concurrent
+                # store_resume() of the same digest waits for this transaction
+                # and then writes the file afresh (see applications/resumes.py).
+                for digest in deleted:
+                    backend.delete(digest)
+            pruned += len(deleted)
+
+        self.stdout.write(self.style.SUCCESS(f"✅ Pruned {pruned} unreferenced resumes."))
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.7 on 2026-10-17 19:51
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Min, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def remove_duplicate_applications(apps, schema_editor):
+    """Keep the first application per (job, applicant) and recount the affected jobs."""
+    Application = apps.get_model('applications', 'Application')
+    Job = apps.get_model('jobs', 'Job')
+
+    duplicates = (
+        Application.objects.order_by().values('job', 'applicant')
+        .annotate(first_id=Min('id'), total=Count('id')).filter(total__gt=1)
+    )
+    job_ids = set()
+    for row in duplicates.iterator():
+        Application.objects.filter(job_id=row['job'], applicant_id=row['applicant']).exclude(pk=row['first_id']).delete()
+        job_ids.add(row['job'])
+
+    live_count = (
+        Application.objects.filter(job=OuterRef('pk')).exclude(status='withdrawn')
+        .order_by().values('job').annotate(total=Count('id')).values('total')
+    )
+    Job.objects.filter(pk__in=job_ids).update(applications_count=Coalesce(Subquery(live_count), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0003_application_indexes'),
+        ('jobs', '0010_job_trending_score'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_applications, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='application',
+            constraint=models.UniqueConstraint(fields=('job', 'applicant'), name='application_job_applicant_unique'),
+        ),
+        migrations.RemoveIndex(
+            model_name='application',
+            name='application_job_applicant_idx',
+        ),
+    ]
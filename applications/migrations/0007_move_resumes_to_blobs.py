@@ -0,0 +1,74 @@
+import hashlib
+
+from django.db import migrations, transaction
+
+BATCH_SIZE = 1000
+
+
+def move_resumes_to_blobs(apps, schema_editor):
+    """
+    Store each distinct resume once and point applications at it, one batch
+    (and one transaction) at a time so large tables are never locked for
+    long. Batches already moved are skipped if the migration is re-run.
+
+    Only historical models are used, so the text is kept in
+    ResumeBlob.content the way the default database backend of
+    applications.resumes stores it.
+    """
+    Application = apps.get_model('applications', 'Application')
+    ResumeBlob = apps.get_model('applications', 'ResumeBlob')
+
+    last_id = 0
+    while True:
+        batch = list(
+            Application.objects.filter(pk__gt=last_id, resume_blob__isnull=True)
+            .order_by('pk').values_list('pk', 'resume')[:BATCH_SIZE]
+        )
+        if not batch:
+            break
+
+        blobs, applications = {}, []
+        for pk, text in batch:
+            data = text.encode('utf-8')
+            digest = hashlib.sha256(data).hexdigest()
+            if digest not in blobs:
+                blobs[digest] = ResumeBlob(sha256=digest, size=len(data), content=text)
+            applications.append(Application(pk=pk, resume_blob_id=digest))
+
+        with transaction.atomic():
+            ResumeBlob.objects.bulk_create(blobs.values(), ignore_conflicts=True)
+            Application.objects.bulk_update(applications, ['resume_blob'])
+        last_id = batch[-1][0]
+
+
+def copy_resumes_back(apps, schema_editor):
+    Application = apps.get_model('applications', 'Application')
+    ResumeBlob = apps.get_model('applications', 'ResumeBlob')
+
+    last_id = 0
+    while True:
+        batch = list(
+            Application.objects.filter(pk__gt=last_id).order_by('pk').values_list('pk', 'resume_blob_id')[:BATCH_SIZE]
+        )
+        if not batch:
+            break
+        texts = dict(
+            ResumeBlob.objects.filter(pk__in={digest for _, digest in batch}).values_list('pk', 'content')
+        )
+        with transaction.atomic():
+            Application.objects.bulk_update(
+                [Application(pk=pk, resume=texts[digest]) for pk, digest in batch], ['resume'],
+            )
+        last_id = batch[-1][0]
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('applications', '0006_resumeblob'),
+    ]
+
+    operations = [
+        migrations.RunPython(move_resumes_to_blobs, copy_resumes_back),
+    ]
@@ -0,0 +1,28 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0007_move_resumes_to_blobs'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='application',
+            name='resume_blob',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='applications', to='applications.resumeblob'),
+        ),
+        # Lets a rollback re-add the column to existing rows before 0007
+        # copies the text back.
+        migrations.AlterField(
+            model_name='application',
+            name='resume',
+            field=models.TextField(default=''),
+        ),
+        migrations.RemoveField(
+            model_name='application',
+            name='resume',
+        ),
+    ]
@@ -0,0 +1,102 @@
+# Generated by Django 5.2.7 on 2026-10-17 20:05
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+# Weights: applicant skills (A) > resume (B) > applicant experience (C) > cover letter (D).
+# Resume text is only indexed when it is stored in the database (ResumeBlob.content).
+SEARCH_VECTOR_SQL = """
+    setweight(to_tsvector('english', coalesce(
+        (SELECT skills FROM accounts_user WHERE id = {row}applicant_id), '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(
+        (SELECT content FROM applications_resumeblob WHERE sha256 = {row}resume_blob_id), '')), 'B') ||
+    setweight(to_tsvector('english', coalesce(
+        (SELECT experience FROM accounts_user WHERE id = {row}applicant_id), '')), 'C') ||
+    setweight(to_tsvector('english', coalesce({row}cover_letter, '')), 'D')
+"""
+
+CREATE_SEARCH_VECTOR_SQL = [
+    """
+    CREATE OR REPLACE FUNCTION applications_application_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector := {vector};
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql;
+    """.format(vector=SEARCH_VECTOR_SQL.format(row='NEW.')),
+    """
+    CREATE TRIGGER applications_application_search_vector_insert
+    BEFORE INSERT ON applications_application
+    FOR EACH ROW EXECUTE FUNCTION applications_application_search_vector_update();
+    """,
+    # Django's UPDATE lists every column, so only rebuild when an indexed one
+    # actually changed; status changes leave the vector alone.
+    """
+    CREATE TRIGGER applications_application_search_vector_update
+    BEFORE UPDATE OF applicant_id, resume_blob_id, cover_letter ON applications_application
+    FOR EACH ROW
+    WHEN (
+        OLD.applicant_id IS DISTINCT FROM NEW.applicant_id
+        OR OLD.resume_blob_id IS DISTINCT FROM NEW.resume_blob_id
+        OR OLD.cover_letter IS DISTINCT FROM NEW.cover_letter
+    )
+    EXECUTE FUNCTION applications_application_search_vector_update();
+    """,
+    # An applicant editing their skills or experience re-indexes their applications.
+    """
+    CREATE OR REPLACE FUNCTION applications_applicant_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        UPDATE applications_application SET search_vector = {vector} WHERE applicant_id = NEW.id;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql;
+    """.format(vector=SEARCH_VECTOR_SQL.format(row='applications_application.')),
+    """
+    CREATE TRIGGER applications_applicant_search_vector_trigger
+    AFTER UPDATE OF skills, experience ON accounts_user FOR EACH ROW
+    WHEN (OLD.skills IS DISTINCT FROM NEW.skills OR OLD.experience IS DISTINCT FROM NEW.experience)
+    EXECUTE FUNCTION applications_applicant_search_vector_update();
+    """,
+    "UPDATE applications_application SET search_vector = {vector};".format(
+        vector=SEARCH_VECTOR_SQL.format(row='applications_application.')
+    ),
+    "CREATE INDEX applications_application_search_vector_gin ON applications_application USING gin (search_vector);",
+]
+
+DROP_SEARCH_VECTOR_SQL = [
+    "DROP INDEX IF EXISTS applications_application_search_vector_gin;",
+    "DROP TRIGGER IF EXISTS applications_applicant_search_vector_trigger ON accounts_user;",
+    "DROP FUNCTION IF EXISTS applications_applicant_search_vector_update();",
+    "DROP TRIGGER IF EXISTS applications_application_search_vector_update ON applications_application;",
+    "DROP TRIGGER IF EXISTS applications_application_search_vector_insert ON applications_application;",
+    "DROP FUNCTION IF EXISTS applications_application_search_vector_update();",
+]
+
+
+def _run_on_postgres(statements):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != 'postgresql':
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_remove_user_location'),
+        ('applications', '0008_remove_application_resume'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(
+            _run_on_postgres(CREATE_SEARCH_VECTOR_SQL),
+            _run_on_postgres(DROP_SEARCH_VECTOR_SQL),
+        ),
+    ]
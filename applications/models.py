@@ -1,9 +1,25 @@
-from django.db import models
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models, router, transaction
 from django.conf import settings
 from jobs.models import Job
 
 # Create your models here.
 
+class ResumeBlob(models.Model):
+    """
+    One distinct resume, keyed by the SHA-256 of its text and shared by every
+    application that submitted it (see applications/resumes.py). `content`
+    holds the text only with the database backend.
+    """
+    sha256 = models.CharField(max_length=64, primary_key=True)
+    size = models.PositiveIntegerField()
+    content = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Resume {self.sha256[:12]} ({self.size} bytes)"
+
+
 class Application(models.Model):
     PENDING = 'pending'
     REVIEWED = 'reviewed'
@@ -25,11 +41,117 @@ class Application(models.Model):
 
     job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='applications')
     applicant = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='applications')
-    resume = models.TextField()
+    resume_blob = models.ForeignKey(ResumeBlob, on_delete=models.PROTECT, related_name='applications')
     cover_letter = models.TextField(blank=True, null=True)
     portfolio_link = models.CharField(max_length=255, blank=True, null=True)
     applied_at = models.DateTimeField(auto_now_add=True)
     status = models.CharField(max_length=50, choices=STATUS_CHOICES, default=PENDING)
+    # Weighted tsvector over the applicant's skills, resume, experience and
+    # cover letter, kept up to date by database triggers on PostgreSQL
+    # (GIN-indexed, see migration 0009). Left empty on other databases.
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        constraints = [
+            # One application per seeker and job; its index also serves the
+            # has_applied / can_review lookups.
+            models.UniqueConstraint(fields=['job', 'applicant'], name='application_job_applicant_unique'),
+        ]
+        indexes = [
+            # Employer listings per job, newest first.
+            models.Index(fields=['job', '-applied_at'], name='application_job_applied_idx'),
+            # Seeker dashboard counters and recent applications.
+            models.Index(fields=['applicant', 'status'], name='application_applicant_st_idx'),
+            models.Index(fields=['applicant', '-applied_at'], name='application_applicant_dt_idx'),
+        ]
+
+    # Maintained only by the search triggers, so a regular save() must never
+    # write back a possibly stale in-memory value.
+    DB_MAINTAINED_FIELDS = ('search_vector',)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored status so signals can tell which way it moved.
+        instance._loaded_status = instance.__dict__.get('status')
+        return instance
+
+    def save(self, *args, **kwargs):
+        if self._state.adding:
+            return super().save(*args, **kwargs)
+        if kwargs.get('update_fields') is None:
+            skipped = self.get_deferred_fields() | set(self.DB_MAINTAINED_FIELDS)
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in skipped
+            ]
+        if 'status' not in kwargs['update_fields']:
+            return super().save(*args, **kwargs)
+        # The job counters move by the difference from the stored status, so
+        # read it under a row lock and let post_save adjust them before the
+        # lock is released: concurrent saves then apply one change each.
+        using = kwargs.get('using') or router.db_for_write(type(self), instance=self)
+        with transaction.atomic(using=using):
+            stored = self._stored_status(using)
+            if stored is not None:
+                self._loaded_status = stored
+            super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        using = kwargs.get('using') or router.db_for_write(type(self), instance=self)
+        with transaction.atomic(using=using):
+            stored = self._stored_status(using)
+            if stored is None:
+                # Already deleted by a concurrent request, which has
+                # adjusted the counters.
+                return 0, {}
+            self._loaded_status = stored
+            return super().delete(*args, **kwargs)
+
+    def _stored_status(self, using):
+        return (
+            type(self)._base_manager.using(using).select_for_update()
+            .filter(pk=self.pk).values_list('status', flat=True).first()
+        )
+
+    def __str__(self):
+        return f"Application of {self.applicant.email} for {self.job.title}"
+
+class ApplicationStatusChange(models.Model):
+    """
+    Append-only log of application status transitions (see
+    applications/transitions.py), written in the same transaction as the
+    change itself. `from_status` is empty for the entry recorded when the
+    application is submitted. The job and applicant are copied from the
+    application so per-job funnels and per-seeker timelines are index range
+    scans without a join.
+    """
+    application = models.ForeignKey(Application, on_delete=models.CASCADE, related_name='status_changes')
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='application_status_changes')
+    applicant = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='application_status_changes'
+    )
+    from_status = models.CharField(max_length=50, choices=Application.STATUS_CHOICES, blank=True)
+    to_status = models.CharField(max_length=50, choices=Application.STATUS_CHOICES)
+    changed_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name='+'
+    )
+    changed_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            # Per-job funnels: how many applications reached each status, and when.
+            models.Index(fields=['job', 'to_status', 'changed_at'], name='status_change_job_idx'),
+            # Per-seeker timelines, newest first.
+            models.Index(fields=['applicant', '-changed_at'], name='status_change_applicant_idx'),
+            # One application's history.
+            models.Index(fields=['application', 'changed_at'], name='status_change_app_idx'),
+        ]
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise ValueError("Application status changes are append-only.")
+        super().save(*args, **kwargs)
 
     def __str__(self):
-        return f"Application of {self.applicant.email} for {self.job.title}"
\ No newline at end of file
+        return f"Application {self.application_id}: {self.from_status or '-'} -> {self.to_status}"
@@ -0,0 +1,5 @@
+from jobs.paginations import KeysetPagination
+
+
+class ApplicationKeysetPagination(KeysetPagination):
+    timestamp_field = 'applied_at'
@@ -0,0 +1,76 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, F, Window
+from django.db.models.functions import RowNumber
+
+from api.fieldsets import SparseFieldsetViewMixin, column_paths
+from applications.models import Application
+from jobs.caching import normalized_query
+
+
+def pipeline_version(job_id):
+    """Version of a job's cached pipeline; bumped whenever one of its applications changes."""
+    key = f'applications:pipeline-version:{job_id}'
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key, time.time_ns())
+    return version
+
+
+def bump_pipeline_versions(job_ids):
+    """Invalidate the cached pipelines of `job_ids` once the current transaction commits."""
+    def bump():
+        for job_id in set(job_ids):
+            try:
+                cache.incr(f'applications:pipeline-version:{job_id}')
+            except ValueError:
+                pass
+    transaction.on_commit(bump)
+
+
+def job_pipeline(job, serializer_class, context):
+    """
+    Applications of `job` grouped by status, for the `/jobs/{id}/pipeline/`
+    board: every status with its count (one GROUP BY) and its newest
+    `APPLICATION_PIPELINE_PAGE_SIZE` applications (one ROW_NUMBER() query).
+    Cached per job and query string until an application of the job changes.
+    """
+    request = context['request']
+    query = normalized_query(request.query_params)
+    key = f"applications:pipeline:{job.pk}:{pipeline_version(job.pk)}:{hashlib.md5(query.encode()).hexdigest()}"
+    data = cache.get(key)
+    if data is not None:
+        return data
+
+    size = getattr(settings, 'APPLICATION_PIPELINE_PAGE_SIZE', 10)
+    applications = Application.objects.filter(job=job)
+    counts = dict(applications.order_by().values_list('status').annotate(total=Count('id')))
+
+    context = {**context, 'compact': True}
+    paths = column_paths(serializer_class(context=context), Application) | {'status', 'applied_at'}
+    ranked = SparseFieldsetViewMixin.restrict_columns(
+        applications.select_related('applicant', 'job', 'job__employer'), paths,
+    ).annotate(
+        column_rank=Window(RowNumber(), partition_by=F('status'), order_by=(F('applied_at').desc(), F('id').desc())),
+    ).filter(column_rank__lte=size).order_by('-applied_at', '-id')
+
+    rows = list(ranked)
+    cards = {status: [] for status, _ in Application.STATUS_CHOICES}
+    for application, item in zip(rows, serializer_class(rows, many=True, context=context).data):
+        cards[application.status].append(item)
+
+    data = {
+        'job': job.pk,
+        'total': sum(counts.values()),
+        'columns': [
+            {'status': status, 'label': label, 'count': counts.get(status, 0), 'applications': cards[status]}
+            for status, label in Application.STATUS_CHOICES
+        ],
+    }
+    cache.set(key, data, getattr(settings, 'APPLICATION_PIPELINE_CACHE_TIMEOUT', 300))
+    return data
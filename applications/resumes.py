@@ -0,0 +1,106 @@
+import hashlib
+import os
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+from applications.models import ResumeBlob
+
+
+class DatabaseResumeBackend:
+    """Keeps resume text in `ResumeBlob.content`, next to its digest."""
+    stores_inline = True
+
+    def write(self, digest, text):
+        # The ResumeBlob row written by store_resume() carries the text.
+        pass
+
+    def read_many(self, digests):
+        return dict(ResumeBlob.objects.filter(pk__in=digests).values_list('pk', 'content'))
+
+    def delete(self, digest):
+        pass
+
+
+class FileSystemResumeBackend:
+    """
+    Keeps each resume in `<location>/<first two hex digits>/<digest>`.
+
+    Files are written to a temporary name and renamed into place, so a
+    reader never sees a partial resume and concurrent writers of the same
+    digest are harmless.
+    """
+    stores_inline = False
+
+    def __init__(self, location):
+        self.location = Path(location)
+
+    def path(self, digest):
+        return self.location / digest[:2] / digest
+
+    def write(self, digest, text):
+        path = self.path(digest)
+        if path.exists():
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                file.write(text)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def read_many(self, digests):
+        return {digest: self.path(digest).read_text(encoding='utf-8') for digest in digests}
+
+    def delete(self, digest):
+        self.path(digest).unlink(missing_ok=True)
+
+
+@lru_cache(maxsize=None)
+def get_resume_backend():
+    """The backend configured by `RESUME_STORAGE` (database by default)."""
+    config = getattr(settings, 'RESUME_STORAGE', {})
+    backend = import_string(config.get('BACKEND', 'applications.resumes.DatabaseResumeBackend'))
+    return backend(**config.get('OPTIONS', {}))
+
+
+def resume_digest(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def store_resume(text):
+    """
+    Store `text` once and return its SHA-256 digest, the key applications
+    reference it by. Storing the same text again is a no-op.
+
+    Call it in the transaction that saves the referencing application, so
+    `prune_resume_blobs` cannot delete the resume in between.
+    """
+    digest = resume_digest(text)
+    backend = get_resume_backend()
+    with transaction.atomic():
+        # INSERT ... ON CONFLICT DO NOTHING: concurrent uploads of one resume are fine.
+        ResumeBlob.objects.bulk_create(
+            [ResumeBlob(sha256=digest, size=len(text.encode('utf-8')), content=text if backend.stores_inline else '')],
+            ignore_conflicts=True,
+        )
+        if not backend.stores_inline:
+            # Written under the row lock, which a prune of this digest also
+            # holds while it unlinks the file, so the file cannot be removed
+            # once a live row refers to it.
+            ResumeBlob.objects.select_for_update().values_list('pk', flat=True).get(pk=digest)
+            backend.write(digest, text)
+    return digest
+
+
+def load_resumes(digests):
+    """`{digest: text}` for the given digests, in one backend read."""
+    digests = set(digests)
+    return get_resume_backend().read_many(digests) if digests else {}
@@ -0,0 +1,69 @@
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank
+from django.db import connections
+from django.db.models import CharField, F, FloatField, TextField, Value
+from django.db.models.functions import Coalesce, Concat, Replace
+from rest_framework.filters import SearchFilter
+
+from jobs.search import SEARCH_CONFIG
+
+# `&` first, so the entities added for the others are not escaped again.
+HTML_ESCAPES = [('&', '&amp;'), ('<', '&lt;'), ('>', '&gt;'), ('"', '&quot;'), ("'", '&#x27;')]
+
+
+def html_escaped(expression):
+    """`expression` with HTML special characters replaced by entities, in SQL."""
+    for character, entity in HTML_ESCAPES:
+        expression = Replace(expression, Value(character), Value(entity), output_field=TextField())
+    return expression
+
+
+class ApplicationSearchFilter(SearchFilter):
+    """
+    `?q=` relevance-ranked full-text search over the weighted
+    Application.search_vector (see migration 0009).
+
+    Skill matches rank above resume matches, which rank above experience,
+    which rank above the cover letter. Each result carries `search_rank` and
+    a `search_headline`: fragments of its resume and cover letter with the
+    matched words wrapped in `<b>`. Both texts are written by applicants, so
+    they are HTML-escaped before the markers are added: `<b>` is the only
+    markup a headline can contain. The filter only narrows the view's
+    queryset, so role scoping is unchanged; keyset pages (`?cursor=`) keep
+    their newest-first order. On databases other than
+    PostgreSQL it falls back to DRF's `icontains` search over the view's
+    `search_fields`, newest first and without rank or headline.
+    """
+    search_param = 'q'
+    headline_options = {'start_sel': '<b>', 'stop_sel': '</b>', 'max_fragments': 2, 'fragment_delimiter': ' … '}
+
+    @classmethod
+    def is_requested(cls, request):
+        return request is not None and bool(request.query_params.get(cls.search_param, '').strip())
+
+    def filter_queryset(self, request, queryset, view):
+        search_terms = self.get_search_terms(request)
+        # Only lists are searched: get_object() must not 404 on `?q=`.
+        if not search_terms or getattr(view, 'action', None) != 'list':
+            return queryset
+
+        if connections[queryset.db].vendor != 'postgresql':
+            return super().filter_queryset(request, queryset, view).annotate(
+                search_rank=Value(None, output_field=FloatField()),
+                search_headline=Value(None, output_field=CharField()),
+            ).order_by('-applied_at', '-id')
+
+        query = SearchQuery(' '.join(search_terms), config=SEARCH_CONFIG, search_type='websearch')
+        text = html_escaped(Concat(
+            Coalesce('resume_blob__content', Value(''), output_field=TextField()),
+            Value('\n\n'),
+            Coalesce('cover_letter', Value(''), output_field=TextField()),
+            output_field=TextField(),
+        ))
+        return (
+            queryset.filter(search_vector=query)
+            .annotate(
+                search_rank=SearchRank(F('search_vector'), query),
+                search_headline=SearchHeadline(text, query, config=SEARCH_CONFIG, **self.headline_options),
+            )
+            .order_by('-search_rank', '-applied_at', '-id')
+        )
@@ -1,21 +1,133 @@
+from django.conf import settings
+from django.db import models
 from rest_framework import serializers
-from applications.models import Application
+from api.fieldsets import SparseFieldsetSerializerMixin
+from applications.models import Application, ApplicationStatusChange
+from applications.resumes import load_resumes, store_resume
+from applications.transitions import bulk_transition
 from jobs.serializers import SimpleJobDetailSerializer
 from accounts.serializers import SimpleUserDetailSerializer
 
-class ApplicationSerializer(serializers.ModelSerializer):
+class ResumeField(serializers.CharField):
+    """
+    An application's resume text, kept in the content-addressed resume store
+    (applications.resumes) and referenced by `resume_blob_id`.
+
+    The text is only loaded when the field is rendered, once per distinct
+    resume per response; `preload()` fetches many in one backend read.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('source', 'resume_blob_id')
+        super().__init__(**kwargs)
+
+    def preload(self, digests):
+        loaded = self.context.setdefault('resumes', {})
+        loaded.update(load_resumes(set(digests) - loaded.keys()))
+
+    def to_representation(self, digest):
+        loaded = self.context.setdefault('resumes', {})
+        if digest not in loaded:
+            self.preload([digest])
+        return loaded[digest]
+
+class ApplicationListSerializer(serializers.ListSerializer):
+    """Loads the resumes of every listed application in one backend read."""
+
+    def to_representation(self, data):
+        rows = list(data.all() if isinstance(data, models.manager.BaseManager) else data)
+        if 'resume' in self.child.fields:
+            self.child.fields['resume'].preload(row.resume_blob_id for row in rows)
+        return super().to_representation(rows)
+
+class ApplicationSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     applicant = SimpleUserDetailSerializer(read_only=True)
     job = SimpleJobDetailSerializer(read_only=True)
+    resume = ResumeField()
     
     job_employer_name = serializers.ReadOnlyField(source='job.employer.get_full_name') 
+    # Set by applications.search.ApplicationSearchFilter; only listed for `?q=` searches.
+    search_rank = serializers.FloatField(read_only=True, allow_null=True)
+    search_headline = serializers.CharField(read_only=True, allow_null=True)
     
     class Meta:
         model = Application
         fields = [ 
             'id', 'cover_letter', 'resume', 'portfolio_link', 
             'applied_at', 'status', 'job_employer_name',
-            'job', 'applicant' 
+            'job', 'applicant', 'search_rank', 'search_headline',
         ]
         read_only_fields = [
             'id', 'job', 'applicant', 'applied_at', 'job_employer_name',
-        ]
\ No newline at end of file
+        ]
+        # List default: everything but the resume and cover letter text.
+        compact_fields = [
+            'id', 'portfolio_link', 'applied_at', 'status', 'job_employer_name', 'job', 'applicant',
+            'search_rank', 'search_headline',
+        ]
+        field_columns = {
+            'job_employer_name': ['job__employer__first_name', 'job__employer__last_name'],
+            # Annotations, not columns.
+            'search_rank': [],
+            'search_headline': [],
+        }
+        list_serializer_class = ApplicationListSerializer
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if not self.context.get('search'):
+            fields.pop('search_rank')
+            fields.pop('search_headline')
+        return fields
+
+    def create(self, validated_data):
+        return super().create(self.store_resume(validated_data))
+
+    def update(self, instance, validated_data):
+        return super().update(instance, self.store_resume(validated_data))
+
+    @staticmethod
+    def store_resume(validated_data):
+        # Validated as text; stored (once per distinct text) as part of the save.
+        if 'resume_blob_id' in validated_data:
+            validated_data['resume_blob_id'] = store_resume(validated_data['resume_blob_id'])
+        return validated_data
+
+class ApplicationStatusChangeSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ApplicationStatusChange
+        fields = ['id', 'from_status', 'to_status', 'changed_by', 'changed_at']
+        read_only_fields = fields
+
+class ApplicationBulkStatusSerializer(serializers.Serializer):
+    """
+    Moves many applications to one status: `{"ids": [...], "status": "reviewed"}`.
+
+    `context['applications']` is the queryset the user may change. Every id is
+    checked against it with one locking query, and every move against the
+    transition rules (applications.transitions); the change is written with a
+    single UPDATE and logged with a single INSERT. Nothing is written unless
+    every id is valid; errors are keyed by the id's position in `ids`.
+    """
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=getattr(settings, 'APPLICATION_BULK_MAX_ITEMS', 1000),
+    )
+    status = serializers.ChoiceField(choices=Application.STATUS_CHOICES)
+
+    def create(self, validated_data):
+        ids, status = validated_data['ids'], validated_data['status']
+        applications = self.context['applications'].select_for_update(of=('self',)).filter(pk__in=ids)
+        rows = {row[0]: row for row in applications.values_list('pk', 'job_id', 'applicant_id', 'status')}
+
+        errors = {index: ["Application not found."] for index, pk in enumerate(ids) if pk not in rows}
+        if errors:
+            raise serializers.ValidationError({'ids': errors})
+
+        try:
+            return bulk_transition(rows.values(), status, self.context['request'].user)
+        except serializers.ValidationError as exc:
+            raise serializers.ValidationError({
+                'ids': {index: exc.detail[pk] for index, pk in enumerate(ids) if pk in exc.detail}
+            })
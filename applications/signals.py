@@ -0,0 +1,71 @@
+from collections import Counter, defaultdict
+
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from applications.models import Application
+from applications.pipeline import bump_pipeline_versions
+from jobs.caching import bump_cache_version
+from jobs.models import Job
+
+
+def counts_towards_job(status):
+    """Withdrawn applications are not counted in Job.applications_count."""
+    return status != Application.WITHDRAWN
+
+
+def adjust_applications_count(job_id, delta):
+    """
+    Atomically shift a job's live application counter by `delta`.
+
+    `?ordering=applications_count` responses depend on it but updated_at does
+    not move, so the job board cache version is bumped as well.
+    """
+    if delta:
+        Job.objects.filter(pk=job_id).update(
+            applications_count=Greatest(F('applications_count') + delta, 0)
+        )
+        bump_cache_version()
+
+
+def adjust_counts_for_status_change(changes, status):
+    """
+    Fix job counters after a bulk UPDATE moved applications to `status`,
+    which bypasses post_save. `changes` are `(job_id, previous_status)`
+    pairs; jobs needing the same shift are updated together.
+    """
+    deltas = Counter()
+    for job_id, previous in changes:
+        deltas[job_id] += int(counts_towards_job(status)) - int(counts_towards_job(previous))
+    jobs_by_delta = defaultdict(list)
+    for job_id, delta in deltas.items():
+        if delta:
+            jobs_by_delta[delta].append(job_id)
+    for delta, job_ids in jobs_by_delta.items():
+        Job.objects.filter(pk__in=job_ids).update(applications_count=Greatest(F('applications_count') + delta, 0))
+    if jobs_by_delta:
+        bump_cache_version()
+
+
+@receiver(post_save, sender=Application)
+def update_count_on_save(sender, instance, created, **kwargs):
+    previous = None if created else getattr(instance, '_loaded_status', None)
+    if created:
+        adjust_applications_count(instance.job_id, int(counts_towards_job(instance.status)))
+    elif previous is not None:
+        adjust_applications_count(
+            instance.job_id,
+            int(counts_towards_job(instance.status)) - int(counts_towards_job(previous)),
+        )
+    instance._loaded_status = instance.status
+    bump_pipeline_versions([instance.job_id])
+
+
+@receiver(post_delete, sender=Application)
+def update_count_on_delete(sender, instance, **kwargs):
+    status = getattr(instance, '_loaded_status', None) or instance.status
+    if counts_towards_job(status):
+        adjust_applications_count(instance.job_id, -1)
+    bump_pipeline_versions([instance.job_id])
@@ -1,3 +1,553 @@
-from django.test import TestCase
+import csv
+import hashlib
+import io
+import json
+import tempfile
+from datetime import timedelta
+from unittest import skipUnless
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import F
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from applications.models import Application, ApplicationStatusChange, ResumeBlob
+from applications.resumes import get_resume_backend, load_resumes, store_resume
+from applications.search import html_escaped
+from applications.transitions import log_status_change
+from jobs.models import Job, JobCategory
+
+
+class ApplicationAPITestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.employer = User.objects.create_user(email='employer@example.com', password='p', role='employer')
+        cls.other_employer = User.objects.create_user(email='other@example.com', password='p', role='employer')
+        cls.seeker = User.objects.create_user(email='seeker@example.com', password='p', role='seeker')
+        cls.admin = User.objects.create_user(email='admin@example.com', password='p', role='admin')
+        cls.category = JobCategory.objects.create(name='Engineering')
+        cls.job = cls.create_job(cls.employer, 'Backend Developer')
+        cls.other_job = cls.create_job(cls.other_employer, 'Data Engineer')
+
+    @classmethod
+    def create_job(cls, employer, title):
+        return Job.objects.create(
+            employer=employer, title=title, company_name='Acme', description='Build APIs.',
+            requirements='Python', category=cls.category,
+        )
+
+    def client_for(self, user):
+        client = APIClient()
+        client.force_authenticate(user)
+        return client
+
+    def apply(self, job, user=None):
+        return self.client_for(user or self.seeker).post(
+            f'/api/v1/jobs/{job.pk}/applications/', {'resume': 'Python developer', 'cover_letter': 'Hi'}, format='json',
+        )
+
+    @staticmethod
+    def create_application(job, applicant, status=Application.PENDING):
+        return Application.objects.create(
+            job=job, applicant=applicant, status=status, resume_blob_id=store_resume(f'Resume of {applicant.email}'),
+        )
+
+
+class ApplicationKeysetPaginationTests(ApplicationAPITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        for index in range(14):
+            cls.create_application(cls.create_job(cls.employer, f'Role {index}'), cls.seeker)
+        cls.others = cls.create_application(cls.other_job, cls.seeker).pk
+        cls.newest_first = list(
+            cls.seeker.applications.order_by('-applied_at', '-pk').values_list('pk', flat=True)
+        )
+
+    def ids(self, response):
+        return [application['id'] for application in response.data['results']]
+
+    def test_walks_forward_and_back(self):
+        client = self.client_for(self.seeker)
+
+        first = client.get('/api/v1/applications/?cursor=')
+        second = client.get(first.data['next'])
+        back = client.get(second.data['previous'])
+
+        self.assertEqual(self.ids(first), self.newest_first[:12])
+        self.assertEqual(self.ids(second), self.newest_first[12:])
+        self.assertIsNone(second.data['next'])
+        self.assertEqual(self.ids(back), self.newest_first[:12])
+
+    def test_cursor_pages_respect_the_role_queryset(self):
+        response = self.client_for(self.other_employer).get('/api/v1/applications/?cursor=')
+
+        self.assertEqual(self.ids(response), [self.others])
+
+    def test_unpaginated_by_default(self):
+        self.assertEqual(len(self.client_for(self.seeker).get('/api/v1/applications/').data), 15)
+
+
+class ApplyTests(ApplicationAPITestCase):
+
+    def test_apply_counts_and_logs_the_submission(self):
+        response = self.apply(self.job)
+
+        self.assertEqual(response.status_code, 201, response.data)
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.applications_count, 1)
+        self.assertEqual(
+            list(ApplicationStatusChange.objects.filter(application_id=response.data['id'])
+                 .values_list('from_status', 'to_status', 'changed_by')),
+            [('', Application.PENDING, self.seeker.pk)],
+        )
+
+    def test_second_application_to_the_same_job_is_rejected(self):
+        self.assertEqual(self.apply(self.job).status_code, 201)
+
+        response = self.apply(self.job)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('already applied', str(response.data))
+        self.assertEqual(Application.objects.filter(job=self.job, applicant=self.seeker).count(), 1)
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.applications_count, 1)
+
+    def test_only_seekers_can_apply(self):
+        self.assertEqual(self.apply(self.job, self.employer).status_code, 403)
+
+
+class TransitionTests(ApplicationAPITestCase):
+
+    def setUp(self):
+        self.application = self.create_application(self.job, self.seeker)
+
+    def set_status(self, user, status):
+        return self.client_for(user).patch(
+            f'/api/v1/applications/{self.application.pk}/', {'status': status}, format='json',
+        )
+
+    def withdraw(self):
+        return self.client_for(self.seeker).post(f'/api/v1/applications/{self.application.pk}/withdraw/')
+
+    def test_employer_can_move_to_any_status(self):
+        self.assertEqual(self.set_status(self.employer, Application.REJECTED).status_code, 200)
+        self.assertEqual(self.set_status(self.employer, Application.INTERVIEWED).status_code, 200)
+
+        self.application.refresh_from_db()
+        self.assertEqual(self.application.status, Application.INTERVIEWED)
+
+    def test_employer_cannot_update_another_employers_application(self):
+        self.assertEqual(self.set_status(self.other_employer, Application.REJECTED).status_code, 404)
+
+    def test_seeker_cannot_set_status(self):
+        self.assertEqual(self.set_status(self.seeker, Application.ACCEPTED).status_code, 403)
+
+    def test_seeker_can_withdraw_once(self):
+        self.assertEqual(self.withdraw().status_code, 200)
+
+        response = self.withdraw()
+
+        self.assertEqual(response.status_code, 400)
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.applications_count, 0)
+
+    def test_seeker_cannot_withdraw_a_rejected_application(self):
+        self.set_status(self.employer, Application.REJECTED)
+
+        self.assertEqual(self.withdraw().status_code, 400)
+
+    def test_history_lists_changes_oldest_first(self):
+        self.set_status(self.employer, Application.REJECTED)
+        self.set_status(self.employer, Application.INTERVIEWED)
+        self.withdraw()
+
+        response = self.client_for(self.seeker).get(f'/api/v1/applications/{self.application.pk}/history/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [(change['from_status'], change['to_status']) for change in response.data],
+            [
+                (Application.PENDING, Application.REJECTED),
+                (Application.REJECTED, Application.INTERVIEWED),
+                (Application.INTERVIEWED, Application.WITHDRAWN),
+            ],
+        )
+        self.assertEqual(
+            list(self.application.status_changes.order_by('id').values_list('changed_by', flat=True)),
+            [self.employer.pk, self.employer.pk, self.seeker.pk],
+        )
+
+    def test_status_change_without_a_status_is_not_logged(self):
+        response = self.client_for(self.employer).patch(
+            f'/api/v1/applications/{self.application.pk}/', {'portfolio_link': 'https://example.com'}, format='json',
+        )
+
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertFalse(self.application.status_changes.exists())
+
+
+class StatusChangeAdminTests(ApplicationAPITestCase):
+
+    def setUp(self):
+        application = self.create_application(self.job, self.seeker)
+        log_status_change(application, self.seeker)
+        self.change = application.status_changes.get()
+        self.client.force_login(User.objects.create_superuser(email='root@example.com', password='p'))
+
+    def test_history_is_read_only_in_the_admin(self):
+        base = '/admin/applications/applicationstatuschange/'
+
+        self.assertEqual(self.client.get(base).status_code, 200)
+        self.assertEqual(self.client.get(f'{base}{self.change.pk}/change/').status_code, 200)
+        self.assertEqual(self.client.post(f'{base}{self.change.pk}/change/', {'to_status': Application.ACCEPTED}).status_code, 403)
+        self.assertEqual(self.client.post(f'{base}{self.change.pk}/delete/', {'post': 'yes'}).status_code, 403)
+        self.assertEqual(self.client.get(f'{base}add/').status_code, 403)
+        self.change.refresh_from_db()
+        self.assertEqual(self.change.to_status, Application.PENDING)
+
+
+class BulkStatusTests(ApplicationAPITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        seekers = [
+            User.objects.create_user(email=f'seeker{index}@example.com', password='p', role='seeker')
+            for index in range(3)
+        ]
+        second_job = cls.create_job(cls.employer, 'Frontend Developer')
+        cls.mine = [
+            cls.create_application(job, seeker).pk
+            for job in (cls.job, second_job) for seeker in seekers
+        ]
+        cls.others = cls.create_application(cls.other_job, seekers[0]).pk
+
+    def bulk_status(self, user, ids, status):
+        return self.client_for(user).post(
+            '/api/v1/applications/bulk-status/', {'ids': ids, 'status': status}, format='json',
+        )
+
+    def test_moves_every_application_with_one_update(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.bulk_status(self.employer, self.mine, Application.REVIEWED)
+
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(response.data, {'status': Application.REVIEWED, 'updated': len(self.mine)})
+        updates = [query for query in queries.captured_queries if query['sql'].startswith('UPDATE "applications_application"')]
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(
+            ApplicationStatusChange.objects.filter(
+                application__in=self.mine, from_status=Application.PENDING, to_status=Application.REVIEWED,
+                changed_by=self.employer,
+            ).count(),
+            len(self.mine),
+        )
+
+    def test_errors_point_at_their_items_and_nothing_is_written(self):
+        response = self.bulk_status(self.employer, [*self.mine, self.others], Application.REVIEWED)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(list(response.data['ids']), [len(self.mine)])
+        self.assertFalse(Application.objects.filter(status=Application.REVIEWED).exists())
+
+    def test_withdrawing_adjusts_job_counters(self):
+        response = self.bulk_status(self.admin, self.mine[:2], Application.WITHDRAWN)
+
+        self.assertEqual(response.status_code, 200, response.data)
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.applications_count, 1)
+
+    def test_seekers_cannot_bulk_update(self):
+        self.assertEqual(self.bulk_status(self.seeker, self.mine[:1], Application.REVIEWED).status_code, 403)
+
+
+class ApplicationCounterTests(ApplicationAPITestCase):
+    """Job.applications_count counts every application that is not withdrawn."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.second_seeker = User.objects.create_user(email='second@example.com', password='p', role='seeker')
+
+    def setUp(self):
+        self.application = self.create_application(self.job, self.seeker)
+        self.second = self.create_application(self.job, self.second_seeker)
+
+    def applications_count(self):
+        return Job.objects.values_list('applications_count', flat=True).get(pk=self.job.pk)
+
+    def set_status(self, status):
+        return self.client_for(self.employer).patch(
+            f'/api/v1/applications/{self.application.pk}/', {'status': status}, format='json',
+        )
+
+    def test_create_counts_every_status_but_withdrawn(self):
+        self.create_application(self.other_job, self.seeker, status=Application.WITHDRAWN)
+
+        self.assertEqual(self.applications_count(), 2)
+        self.assertEqual(Job.objects.values_list('applications_count', flat=True).get(pk=self.other_job.pk), 0)
+
+    def test_status_transitions_move_the_count_in_and_out_of_withdrawn(self):
+        self.assertEqual(self.set_status(Application.REJECTED).status_code, 200)
+        self.assertEqual(self.applications_count(), 2)
+
+        self.assertEqual(self.set_status(Application.WITHDRAWN).status_code, 200)
+        self.assertEqual(self.applications_count(), 1)
+
+        self.assertEqual(self.set_status(Application.REVIEWED).status_code, 200)
+        self.assertEqual(self.applications_count(), 2)
+
+    def test_withdrawal_uncounts_the_application(self):
+        response = self.client_for(self.seeker).post(f'/api/v1/applications/{self.application.pk}/withdraw/')
+
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(self.applications_count(), 1)
+
+    def test_bulk_status_moves_the_count_both_ways(self):
+        url = '/api/v1/applications/bulk-status/'
+        ids = [self.application.pk, self.second.pk]
+        client = self.client_for(self.employer)
+
+        client.post(url, {'ids': ids, 'status': Application.WITHDRAWN}, format='json')
+        self.assertEqual(self.applications_count(), 0)
+
+        client.post(url, {'ids': ids[:1], 'status': Application.REVIEWED}, format='json')
+        self.assertEqual(self.applications_count(), 1)
+
+    def test_saving_stale_instances_counts_each_change_once(self):
+        first, stale = Application.objects.get(pk=self.application.pk), Application.objects.get(pk=self.application.pk)
+
+        first.status = Application.WITHDRAWN
+        first.save()
+        # Loaded as pending, but the row lock shows it was withdrawn already.
+        stale.status = Application.WITHDRAWN
+        stale.save()
+
+        self.assertEqual(self.applications_count(), 1)
+
+    def test_delete_uncounts_the_application_once(self):
+        stale = Application.objects.get(pk=self.application.pk)
+
+        self.application.delete()
+        self.assertEqual(stale.delete(), (0, {}))
+
+        self.assertEqual(self.applications_count(), 1)
+
+    def test_deleting_a_withdrawn_application_keeps_the_count(self):
+        self.application.status = Application.WITHDRAWN
+        self.application.save()
+
+        self.application.delete()
+
+        self.assertEqual(self.applications_count(), 1)
+
+    def test_cascade_delete_uncounts_the_applicants_applications(self):
+        self.second_seeker.delete()
+
+        self.assertEqual(self.applications_count(), 1)
+
+    def test_recount_repairs_drifted_counters(self):
+        Job.objects.update(applications_count=7)
+
+        call_command('recount_applications', stdout=io.StringIO())
+
+        self.assertEqual(self.applications_count(), 2)
+        self.assertEqual(Job.objects.values_list('applications_count', flat=True).get(pk=self.other_job.pk), 0)
+
+
+class ApplicationExportTests(ApplicationAPITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        for index in range(3):
+            job = cls.create_job(cls.employer if index % 2 else cls.other_employer, f'Role {index}')
+            cls.create_application(job, cls.seeker)
+
+    def get(self, query):
+        return self.client_for(self.seeker).get(f'/api/v1/applications/{query}')
+
+    def test_streamed_list_matches_the_list(self):
+        listed = json.loads(self.get('').content)
+
+        self.assertEqual(len(listed), 3)
+        self.assertEqual(json.loads(b''.join(self.get('?no_pagination').streaming_content)), listed)
+
+    def test_downloads_keep_every_field(self):
+        # Lists are rendered from values() rows, downloads by the serializer;
+        # downloads keep every field, like `?fields=*`.
+        exported = b''.join(self.get('?export=ndjson').streaming_content).decode().splitlines()
+
+        self.assertEqual([json.loads(line) for line in exported], json.loads(self.get('?fields=*').content))
+
+    def test_csv_export_has_one_row_per_application(self):
+        response = self.get('?export=csv')
+
+        rows = list(csv.DictReader(io.StringIO(b''.join(response.streaming_content).decode())))
+
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        self.assertEqual(sorted(int(row['id']) for row in rows), sorted(self.seeker.applications.values_list('pk', flat=True)))
+
+    def test_sparse_fieldsets_apply_to_list_detail_and_export(self):
+        listed = self.get('?fields=id,status').data
+        exported = b''.join(self.get('?export=ndjson&fields=id,status').streaming_content).decode().splitlines()
+
+        self.assertEqual([set(row) for row in listed], [{'id', 'status'}] * 3)
+        self.assertEqual([json.loads(line) for line in exported], json.loads(json.dumps(listed)))
+        self.assertEqual(self.get(f"{listed[0]['id']}/?fields=status").data, {'status': Application.PENDING})
+        self.assertEqual(self.get('?fields=nope').status_code, 400)
+
+
+@override_settings(APPLICATION_PIPELINE_PAGE_SIZE=2)
+class PipelineTests(ApplicationAPITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        seekers = [
+            User.objects.create_user(email=f'seeker{index}@example.com', password='p', role='seeker')
+            for index in range(4)
+        ]
+        cls.pending = [cls.create_application(cls.job, seeker).pk for seeker in seekers[:3]]
+        cls.rejected = cls.create_application(cls.job, seekers[3], status=Application.REJECTED).pk
+        cls.create_application(cls.other_job, seekers[0])
+
+    def setUp(self):
+        cache.clear()
+        self.client = self.client_for(self.employer)
+
+    def pipeline(self):
+        return self.client.get(f'/api/v1/jobs/{self.job.pk}/pipeline/')
+
+    def column(self, data, status):
+        return next(column for column in data['columns'] if column['status'] == status)
+
+    def test_columns_have_counts_and_the_newest_applications(self):
+        data = self.pipeline().data
+
+        self.assertEqual(data['total'], 4)
+        pending = self.column(data, Application.PENDING)
+        self.assertEqual(pending['count'], 3)
+        self.assertEqual([card['id'] for card in pending['applications']], [self.pending[2], self.pending[1]])
+        self.assertEqual([card['id'] for card in self.column(data, Application.REJECTED)['applications']], [self.rejected])
+        self.assertEqual(self.column(data, Application.OFFERED), {
+            'status': Application.OFFERED, 'label': 'Offered', 'count': 0, 'applications': [],
+        })
+
+    def test_only_the_jobs_employer_can_see_it(self):
+        self.client = self.client_for(self.other_employer)
+
+        self.assertEqual(self.pipeline().status_code, 403)
+
+    def test_cached_until_an_application_of_the_job_changes(self):
+        self.pipeline()
+        with self.assertNumQueries(1):
+            self.pipeline()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(f'/api/v1/applications/{self.pending[0]}/', {'status': Application.OFFERED}, format='json')
+        self.assertEqual(self.column(self.pipeline().data, Application.OFFERED)['count'], 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                '/api/v1/applications/bulk-status/', {'ids': self.pending[1:], 'status': Application.REVIEWED},
+                format='json',
+            )
+        self.assertEqual(self.column(self.pipeline().data, Application.PENDING)['count'], 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Application.objects.get(pk=self.rejected).delete()
+        self.assertEqual(self.pipeline().data['total'], 3)
+
+    def test_other_jobs_keep_their_cache(self):
+        self.pipeline()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_application(self.other_job, self.seeker)
+
+        with self.assertNumQueries(1):
+            self.pipeline()
+
+
+class ResumeStorageTests(ApplicationAPITestCase):
+
+    def setUp(self):
+        # The backend is built once from RESUME_STORAGE; rebuild it per test.
+        get_resume_backend.cache_clear()
+        self.addCleanup(get_resume_backend.cache_clear)
+
+    def use_filesystem(self):
+        location = tempfile.TemporaryDirectory()
+        self.addCleanup(location.cleanup)
+        storage = override_settings(RESUME_STORAGE={
+            'BACKEND': 'applications.resumes.FileSystemResumeBackend', 'OPTIONS': {'location': location.name},
+        })
+        storage.enable()
+        self.addCleanup(storage.disable)
+        return get_resume_backend()
+
+    def test_the_same_resume_is_stored_once(self):
+        first, second = self.apply(self.job), self.apply(self.other_job)
+
+        digest = hashlib.sha256(b'Python developer').hexdigest()
+        self.assertEqual(list(ResumeBlob.objects.values_list('pk', 'size', 'content')), [(digest, 16, 'Python developer')])
+        self.assertEqual(
+            set(Application.objects.filter(pk__in=[first.data['id'], second.data['id']]).values_list('resume_blob', flat=True)),
+            {digest},
+        )
+        detail = self.client_for(self.seeker).get(f"/api/v1/applications/{first.data['id']}/")
+        self.assertEqual(detail.data['resume'], 'Python developer')
+
+    def test_filesystem_backend_keeps_only_the_digest_in_the_database(self):
+        backend = self.use_filesystem()
+
+        digest = store_resume('Designer')
+
+        self.assertEqual(store_resume('Designer'), digest)
+        self.assertEqual(ResumeBlob.objects.get().content, '')
+        self.assertEqual(backend.path(digest).read_text(), 'Designer')
+        self.assertEqual(load_resumes([digest]), {digest: 'Designer'})
+
+    def test_prune_deletes_old_unreferenced_resumes_only(self):
+        backend = self.use_filesystem()
+        referenced = self.create_application(self.job, self.seeker).resume_blob_id
+        orphan, recent = store_resume('Orphan'), store_resume('Recent')
+        ResumeBlob.objects.exclude(pk=recent).update(created_at=timezone.now() - timedelta(days=2))
+
+        call_command('prune_resume_blobs', stdout=io.StringIO())
+
+        self.assertEqual(set(ResumeBlob.objects.values_list('pk', flat=True)), {referenced, recent})
+        self.assertFalse(backend.path(orphan).exists())
+        self.assertTrue(backend.path(referenced).exists())
+
+
+class ApplicantSearchTests(ApplicationAPITestCase):
+    payload = '<script>alert("x")</script> Python & Django'
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.application = cls.create_application(cls.job, cls.seeker)
+        Application.objects.filter(pk=cls.application.pk).update(cover_letter=cls.payload)
+
+    def test_headline_text_is_html_escaped(self):
+        escaped = Application.objects.annotate(text=html_escaped(F('cover_letter'))).get(pk=self.application.pk).text
+
+        self.assertEqual(escaped, '&lt;script&gt;alert(&quot;x&quot;)&lt;/script&gt; Python &amp; Django')
+
+    @skipUnless(connection.vendor == 'postgresql', "Headlines are only built on PostgreSQL.")
+    def test_headline_contains_no_applicant_markup(self):
+        response = self.client_for(self.employer).get('/api/v1/applications/?q=script')
+
+        self.assertEqual(response.status_code, 200, response.data)
+        headline = response.data[0]['search_headline']
+        self.assertIn('&lt;<b>script</b>&gt;', headline)
+        self.assertNotIn('<script', headline)
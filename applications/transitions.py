@@ -0,0 +1,100 @@
+from rest_framework.exceptions import ValidationError
+
+from applications.models import Application, ApplicationStatusChange
+from applications.pipeline import bump_pipeline_versions
+from applications.signals import adjust_counts_for_status_change
+
+ALL_STATUSES = frozenset(status for status, _ in Application.STATUS_CHOICES)
+
+# An applicant can withdraw until the application is closed.
+WITHDRAWABLE_STATUSES = {Application.PENDING, Application.REVIEWED, Application.INTERVIEWED, Application.OFFERED}
+
+# Statuses each role may move an application to, keyed by its current status.
+# Employers and admins may set any status, so a mistaken rejection can be
+# undone; applicants may only withdraw, and only while the application is open.
+TRANSITIONS = {
+    'employer': {status: ALL_STATUSES - {status} for status in ALL_STATUSES},
+    'admin': {status: ALL_STATUSES - {status} for status in ALL_STATUSES},
+    'seeker': {status: {Application.WITHDRAWN} for status in WITHDRAWABLE_STATUSES},
+}
+
+
+def transition_error(previous, status, user):
+    """Why `user` may not move an application from `previous` to `status`, or None."""
+    role = getattr(user, 'role', '').lower()
+    if role == 'seeker' and status != Application.WITHDRAWN:
+        return "Job seekers can only withdraw their applications."
+    if status not in TRANSITIONS.get(role, {}).get(previous, ()):
+        return f"Cannot move an application from '{previous}' to '{status}'."
+    return None
+
+
+def check_transition(previous, status, user):
+    error = transition_error(previous, status, user)
+    if error:
+        raise ValidationError({'status': [error]})
+
+
+def lock_status(application):
+    """
+    Lock `application`'s row until the current transaction ends and refresh
+    its status from it, so concurrent moves are checked, counted and logged
+    one after the other.
+    """
+    application.status = application._loaded_status = (
+        Application.objects.select_for_update().values_list('status', flat=True).get(pk=application.pk)
+    )
+    return application.status
+
+
+def log_status_change(application, user, previous=''):
+    """
+    Append `application`'s current status to its history; `previous` is
+    left empty for a newly submitted application.
+    """
+    ApplicationStatusChange.objects.create(
+        application=application, job_id=application.job_id, applicant_id=application.applicant_id,
+        from_status=previous, to_status=application.status, changed_by=user,
+    )
+
+
+def transition(application, status, user):
+    """
+    Move one application to `status` and log it. Call inside a transaction;
+    raises ValidationError if the move is not allowed.
+    """
+    previous = lock_status(application)
+    check_transition(previous, status, user)
+    application.status = status
+    application.save(update_fields=['status'])
+    log_status_change(application, user, previous)
+    return application
+
+
+def bulk_transition(rows, status, user):
+    """
+    Move many applications to `status` with one UPDATE and one log INSERT.
+
+    `rows` are `(pk, job_id, applicant_id, previous_status)` read under a row
+    lock; rows already in `status` are skipped. Returns the changed rows, or
+    raises ValidationError with `{pk: [message]}` for moves that are not
+    allowed, in which case nothing is written.
+    """
+    changed = [row for row in rows if row[3] != status]
+    errors = {pk: [error] for pk, _, _, previous in changed if (error := transition_error(previous, status, user))}
+    if errors:
+        raise ValidationError(errors)
+    if not changed:
+        return changed
+
+    Application.objects.filter(pk__in=[pk for pk, *_ in changed]).update(status=status)
+    adjust_counts_for_status_change([(job_id, previous) for _, job_id, _, previous in changed], status)
+    bump_pipeline_versions(job_id for _, job_id, _, _ in changed)
+    ApplicationStatusChange.objects.bulk_create(
+        ApplicationStatusChange(
+            application_id=pk, job_id=job_id, applicant_id=applicant_id,
+            from_status=previous, to_status=status, changed_by=user,
+        )
+        for pk, job_id, applicant_id, previous in changed
+    )
+    return changed
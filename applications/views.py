@@ -1,27 +1,40 @@
-from django.forms import ValidationError
+from django.db import IntegrityError, transaction
 from rest_framework.viewsets import ModelViewSet
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.exceptions import PermissionDenied, ValidationError
+from api.exports import StreamingExportMixin
+from api.fastpath import ValuesListMixin
+from api.fieldsets import SparseFieldsetViewMixin
 from applications.models import Application
-from applications.serializers import ApplicationSerializer
+from applications.serializers import (
+    ApplicationBulkStatusSerializer, ApplicationSerializer, ApplicationStatusChangeSerializer,
+)
 from applications.permissions import IsJobSeekerOrReadOnly
+from applications.transitions import check_transition, lock_status, log_status_change, transition
+from applications.paginations import ApplicationKeysetPagination
+from applications.search import ApplicationSearchFilter
 from jobs.models import Job
 from drf_yasg.utils import swagger_auto_schema
 
 # Create your views here.
 
-class ApplicationViewSet(ModelViewSet):
+class ApplicationViewSet(StreamingExportMixin, SparseFieldsetViewMixin, ValuesListMixin, ModelViewSet):
     """
     ViewSet for applications.
     - Job seekers see only their own applications.
     - Employers see applications to their own jobs.
     - Admins see everything.
+    `?q=` ranks them by a full-text search of resume, cover letter and the
+    applicant's skills and experience (see applications/search.py).
     """
     serializer_class = ApplicationSerializer
     permission_classes = [IsAuthenticated, IsJobSeekerOrReadOnly]
+    filter_backends = [ApplicationSearchFilter]
+    search_fields = ['resume_blob__content', 'cover_letter', 'applicant__skills', 'applicant__experience']
     ordering = ['-applied_at']
+    sparse_required_columns = ['applied_at']
 
     def get_queryset(self):
         if getattr(self, "swagger_fake_view", False):
@@ -33,7 +46,7 @@ class ApplicationViewSet(ModelViewSet):
             'applicant', 
             'job', 
             'job__employer'
-        )
+        ).defer('search_vector')
 
         if not user.is_authenticated:
             return Application.objects.none()
@@ -61,6 +74,18 @@ class ApplicationViewSet(ModelViewSet):
 
         return queryset.filter(**filters)
 
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['search'] = self.action == 'list' and ApplicationSearchFilter.is_requested(self.request)
+        return context
+
+    @property
+    def paginator(self):
+        # Unpaginated by default; `?cursor=` opts into keyset pagination.
+        if not hasattr(self, '_paginator') and ApplicationKeysetPagination.is_requested(getattr(self, 'request', None)):
+            self._paginator = ApplicationKeysetPagination()
+        return super().paginator
+
     def paginate_queryset(self, queryset):
         if 'no_pagination' in self.request.query_params:
             return None
@@ -77,25 +102,77 @@ class ApplicationViewSet(ModelViewSet):
         if not job_id:
             raise ValidationError("Missing job id in URL.")
 
-        if Application.objects.filter(job_id=job_id, applicant=user).exists():
-            raise ValidationError("You have already applied for this job.")
-
+        # A single INSERT: duplicates are rejected by the (job, applicant)
+        # unique constraint, so concurrent submissions cannot both get in.
         # Using job_id=job_id directly avoids an extra 'Job.objects.get' query.
-        serializer.save(job_id=job_id, applicant=user)
+        # The job's applications_count is bumped, and the submission logged,
+        # in the same transaction.
+        try:
+            with transaction.atomic():
+                application = serializer.save(job_id=job_id, applicant=user)
+                log_status_change(application, user)
+        except IntegrityError:
+            if not Application.objects.filter(job_id=job_id, applicant=user).exists():
+                raise
+            raise ValidationError("You have already applied for this job.")
 
     @swagger_auto_schema(operation_summary="Update an application (status)")
     def perform_update(self, serializer):
         user = self.request.user
-        application = self.get_object()
+        application = serializer.instance
         user_role = getattr(user, "role", "").lower()
 
         # Security check
-        if user_role == "employer" and application.job.employer != user:
+        if user_role == "employer" and application.job.employer_id != user.id:
             raise PermissionDenied("You can only update applications for your own jobs.")
         elif user_role not in ["employer", "admin"]:
             raise PermissionDenied("Only employers or admins can update application status.")
-        
-        serializer.save()
+
+        with transaction.atomic():
+            # Checked against the locked row: concurrent updates cannot both pass.
+            previous = lock_status(application)
+            status = serializer.validated_data.get("status", previous)
+            if status != previous:
+                check_transition(previous, status, user)
+            serializer.save()
+            if status != previous:
+                log_status_change(application, user, previous)
+
+    @swagger_auto_schema(
+        operation_summary="Move many applications to one status",
+        request_body=ApplicationBulkStatusSerializer,
+    )
+    @action(detail=False, methods=["post"], url_path="bulk-status")
+    def bulk_status(self, request, job_pk=None):
+        """
+        Set `status` on every application in `ids` (up to
+        APPLICATION_BULK_MAX_ITEMS) with one ownership check and one UPDATE.
+        """
+        user = request.user
+        user_role = getattr(user, "role", "").lower()
+        if user_role not in ["employer", "admin"]:
+            raise PermissionDenied("Only employers or admins can update application status.")
+
+        applications = Application.objects.all()
+        if user_role == "employer":
+            applications = applications.filter(job__employer=user)
+        if job_pk is not None:
+            applications = applications.filter(job_id=job_pk)
+
+        serializer = ApplicationBulkStatusSerializer(
+            data=request.data, context={**self.get_serializer_context(), "applications": applications}
+        )
+        serializer.is_valid(raise_exception=True)
+        with transaction.atomic():
+            changed = serializer.save()
+        return Response({"status": serializer.validated_data["status"], "updated": len(changed)})
+
+    @swagger_auto_schema(operation_summary="Status history of an application, oldest first")
+    @action(detail=True, methods=["get"])
+    def history(self, request, pk=None, job_pk=None):
+        application = self.get_object()
+        changes = application.status_changes.order_by("changed_at", "id")
+        return Response(ApplicationStatusChangeSerializer(changes, many=True).data)
 
     @swagger_auto_schema(
         operation_summary="Check if user can review this job",
@@ -133,9 +210,10 @@ class ApplicationViewSet(ModelViewSet):
         if user_role != "seeker" or application.applicant != user:
             return Response({"detail": "You can only withdraw your own applications."}, status=403)
 
-        if application.status in ["accepted", "rejected", "withdrawn"]:
+        try:
+            with transaction.atomic():
+                transition(application, Application.WITHDRAWN, user)
+        except ValidationError:
+            # `transition` refreshed the status from the locked row.
             return Response({"detail": f"Cannot withdraw application with status '{application.status}'."}, status=400)
-
-        application.status = "withdrawn"
-        application.save()
         return Response({"detail": "Application successfully withdrawn."})
\ No newline at end of file
@@ -0,0 +1,18 @@
+import time
+
+
+def time_ms(func, repeat=1):
+    """Wall-clock milliseconds of each of `repeat` calls of `func`."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def latency_summary(timings):
+    """`p50 …ms, p95 …ms, max …ms` over a list of millisecond timings."""
+    timings = sorted(timings)
+    p50, p95 = timings[len(timings) // 2], timings[min(int(len(timings) * 0.95), len(timings) - 1)]
+    return f"p50 {p50:.1f}ms, p95 {p95:.1f}ms, max {timings[-1]:.1f}ms"
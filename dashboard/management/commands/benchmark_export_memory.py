@@ -0,0 +1,93 @@
+# dashboard/management/commands/benchmark_export_memory.py
+import tracemalloc
+
+from django.core.management.base import CommandError
+from django.db import transaction
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from dashboard.management.commands.check_query_plans import Command as QueryPlanCommand
+
+EXPORTS = [
+    ("json (?no_pagination)", "no_pagination"),
+    ("ndjson", "export=ndjson"),
+    ("csv", "export=csv"),
+]
+# An eighth of the seeded jobs, which are spread over "City 0" to "City 199".
+SAMPLE_FILTER = "location__in=" + ",".join(f"City {i}" for i in range(25))
+
+
+def current_rss_mb():
+    """Resident set size of this process in MB, or None off Linux."""
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+class Command(QueryPlanCommand):
+    help = (
+        "Stream every job through each export format and report size, peak Python heap "
+        "and RSS growth. Fails when the peak heap of a full export exceeds --tolerance "
+        "times that of an export of an eighth of the rows, i.e. when memory grows with "
+        "the number of rows. Seeds a throwaway dataset (rolled back)."
+    )
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.set_defaults(jobs=100000, applications=0)
+        # Peaks move with garbage collection from chunk to chunk; an export
+        # that buffered its rows would peak at about eight times the sample's.
+        parser.add_argument(
+            '--tolerance', type=float, default=3.0,
+            help="Allowed ratio between the peak heap of the full and the sample export.",
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            _, seeker = self.seed(options['jobs'], options['applications'], options['batch_size'])
+            client = APIClient()
+            client.force_authenticate(seeker)
+            growing = []
+            for name, query in EXPORTS:
+                sample = self.measure(client, f"{query}&{SAMPLE_FILTER}")
+                full = self.measure(client, query)
+                flat = full['peak'] <= sample['peak'] * options['tolerance']
+                if not flat:
+                    growing.append(name)
+                self.report(name, sample, full, flat)
+            transaction.set_rollback(True)
+
+        if growing:
+            raise CommandError("Memory grows with the number of rows for: " + ", ".join(growing))
+        self.stdout.write(self.style.SUCCESS("✅ Every export streams in flat memory."))
+
+    def measure(self, client, query):
+        tracemalloc.start()
+        rss_before = rss_peak = current_rss_mb()
+        response = client.get(f"{reverse('jobs-list')}?{query}")
+        if response.status_code != 200:
+            tracemalloc.stop()
+            raise CommandError(f"?{query} answered {response.status_code}.")
+
+        # One piece per row, plus the CSV header or the JSON brackets.
+        pieces, size = 0, 0
+        for piece in response.streaming_content:
+            pieces += 1
+            size += len(piece)
+            if pieces % 1000 == 0 and rss_before is not None:
+                rss_peak = max(rss_peak, current_rss_mb())
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        rss = rss_peak - rss_before if rss_before is not None else None
+        return {'pieces': pieces, 'size': size, 'peak': peak, 'rss': rss}
+
+    def report(self, name, sample, full, flat):
+        def describe(run):
+            rss = f", RSS +{run['rss']:.1f}MB" if run['rss'] is not None else ""
+            return f"{run['pieces']} pieces, {run['size'] / 2 ** 20:.1f}MB, peak heap {run['peak'] / 2 ** 20:.1f}MB{rss}"
+        self.stdout.write(f"{'✔️' if flat else '❌'} {name}: {describe(full)} (an eighth: {describe(sample)})")
@@ -0,0 +1,72 @@
+# dashboard/management/commands/benchmark_job_filters.py
+from datetime import timedelta
+from urllib.parse import urlencode
+
+from django.core.management.base import CommandError
+from django.db import transaction
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from dashboard.benchmarks import latency_summary, time_ms
+from dashboard.management.commands.check_query_plans import Command as QueryPlanCommand
+from jobs.models import Job
+
+
+def filter_cases():
+    # Every combination matches some of the rows check_query_plans seeds.
+    today = timezone.now().date()
+    return [
+        ("employment type + remote + location", {
+            'employment_type': Job.Contract, 'remote_option': Job.REMOTE, 'location': 'City 2',
+        }),
+        ("types + levels (__in)", {
+            'employment_type__in': f'{Job.Full_Time},{Job.Contract}',
+            'experience_level__in': f'{Job.SENIOR_LEVEL},{Job.DIRECTOR}',
+        }),
+        ("locations + featured", {'location__in': 'City 0,City 20,City 40', 'is_featured': 'true'}),
+        ("salary range + remote", {'salary__gt': 100000, 'salary__lt': 110000, 'remote_option': Job.HYBRID}),
+        ("deadline window + type", {
+            'application_deadline__gte': today.isoformat(),
+            'application_deadline__lte': (today + timedelta(days=7)).isoformat(),
+            'employment_type': Job.Contract,
+        }),
+        ("everything, by salary", {
+            'employment_type__in': f'{Job.Full_Time},{Job.Contract}', 'remote_option': Job.REMOTE,
+            'salary__gt': 50000, 'application_deadline__gte': today.isoformat(), 'ordering': '-salary',
+        }),
+    ]
+
+
+class Command(QueryPlanCommand):
+    help = (
+        "Time combined JobFilter queries (`/jobs/?employment_type=…&location=…`) end to "
+        "end over a seeded table of jobs: the page and its count. All seeded rows are "
+        "rolled back."
+    )
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.set_defaults(jobs=200000, applications=0)
+        parser.add_argument('--repeat', type=int, default=20, help="Requests per filter combination.")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            _, seeker = self.seed(options['jobs'], options['applications'], options['batch_size'])
+            self.benchmark(seeker, options['repeat'])
+            transaction.set_rollback(True)
+        self.stdout.write(self.style.SUCCESS("✅ Filter benchmark finished."))
+
+    def benchmark(self, seeker, repeat):
+        # Authenticated, so responses come from the database rather than the
+        # anonymous response cache.
+        client = APIClient()
+        client.force_authenticate(seeker)
+        url = reverse('jobs-list')
+        for name, params in filter_cases():
+            query = f"{url}?{urlencode(params)}"
+            response = client.get(query)
+            if response.status_code != 200:
+                raise CommandError(f"{query} answered {response.status_code}: {response.data}")
+            timings = time_ms(lambda: client.get(query), repeat)
+            self.stdout.write(f"⏱️ {name}: {response.data['count']} matches, {latency_summary(timings)}")
@@ -0,0 +1,72 @@
+# dashboard/management/commands/benchmark_job_search.py
+from urllib.parse import urlencode
+
+from django.core.management.base import CommandError
+from django.db import connection, transaction
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from dashboard.benchmarks import latency_summary, time_ms
+from dashboard.management.commands.check_query_plans import Command as QueryPlanCommand
+
+# (name, search terms); the seeded rows are "Job <i>" at "Company <i % 500>"
+# in "City <i % 200>", so each case matches a known share of them.
+SEARCH_CASES = [
+    ("one job", ["Job 4242", "Job 90001", "Job 777"]),
+    ("one company (~0.2%)", ["Company 17", "Company 230", "Company 499"]),
+    ("one city (~0.5%)", ["City 42", "City 7", "City 199"]),
+    ("every job", ["seeded checks", "query plan"]),
+    ("no match", ["blockchain astronaut", "zyzzyva"]),
+]
+
+
+class Command(QueryPlanCommand):
+    help = (
+        "Time ranked full-text job search (`/jobs/?search=`) end to end over a seeded "
+        "table of 1,000,000 jobs: ranking, the page and its count. All seeded rows "
+        "are rolled back unless --no-seed is given."
+    )
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.set_defaults(jobs=1000000, applications=0)
+        parser.add_argument('--repeat', type=int, default=5, help="Requests per search term.")
+        parser.add_argument('--no-seed', action='store_true', help="Search the jobs already in the database.")
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            self.stdout.write("⚠️ Not PostgreSQL: timing the icontains fallback, not the ranked search.")
+        with transaction.atomic():
+            if options['no_seed']:
+                seeker = User.objects.filter(role=User.ROLE_SEEKER).first()
+            else:
+                _, seeker = self.seed(options['jobs'], options['applications'], options['batch_size'])
+            empty = self.benchmark(seeker, options['repeat'])
+            transaction.set_rollback(True)
+
+        if empty:
+            raise CommandError("Searches that should match returned nothing: " + ", ".join(empty))
+        self.stdout.write(self.style.SUCCESS("✅ Search benchmark finished."))
+
+    def benchmark(self, seeker, repeat):
+        # Authenticated, so responses come from the database rather than the
+        # anonymous response cache.
+        client = APIClient()
+        if seeker is not None:
+            client.force_authenticate(seeker)
+        url = reverse('jobs-list')
+        empty = []
+        for name, terms in SEARCH_CASES:
+            timings, matched = [], 0
+            for term in terms:
+                query = f"{url}?{urlencode({'search': term})}"
+                response = client.get(query)
+                if response.status_code != 200:
+                    raise CommandError(f"{query} answered {response.status_code}.")
+                matched += response.data['count']
+                timings += time_ms(lambda: client.get(query), repeat)
+            if not matched and name != "no match":
+                empty.append(name)
+            self.stdout.write(f"⏱️ {name}: {matched // len(terms)} matches per term, {latency_summary(timings)}")
+        return empty
@@ -0,0 +1,92 @@
+# dashboard/management/commands/benchmark_job_views.py
+import threading
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Sum
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from dashboard.benchmarks import latency_summary, time_ms
+from jobs.models import Job
+from jobs.tracking import job_views
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        "Fetch a few hot job details from many threads at once, first with buffered "
+        "view counting and then writing every view to its job row as it happens, and "
+        "report the latency of both. Checks that every view reached views_count. "
+        "Creates a throwaway employer, seeker and jobs, and deletes them afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=20, help="Parallel clients.")
+        parser.add_argument('--requests', type=int, default=50, help="Requests per client and mode.")
+        parser.add_argument('--jobs', type=int, default=3, help="Hot jobs the requests are spread over.")
+
+    def handle(self, *args, **options):
+        threads, requests = options['threads'], options['requests']
+        employer = User.objects.create(email="views-employer@example.com", role=User.ROLE_EMPLOYER)
+        seeker = User.objects.create(email="views-seeker@example.com", role=User.ROLE_SEEKER)
+        try:
+            jobs = [
+                Job.objects.create(
+                    employer=employer, title=f"View check {i}", company_name="View check", description="View check."
+                )
+                for i in range(options['jobs'])
+            ]
+            # One flush per `max_pending` views, then one UPDATE per view.
+            for mode, max_pending in (("buffered", job_views.max_pending), ("unbuffered", 1)):
+                started = time.perf_counter()
+                timings = self.fetch(jobs, seeker, threads, requests, max_pending)
+                elapsed = time.perf_counter() - started
+                self.stdout.write(
+                    f"⏱️ {mode}: {len(timings)} requests, {len(timings) / elapsed:.0f} req/s, {latency_summary(timings)}"
+                )
+            job_views.flush()
+            counted = Job.objects.filter(pk__in=[job.pk for job in jobs]).aggregate(total=Sum('views_count'))['total']
+        finally:
+            User.objects.filter(pk__in=[employer.pk, seeker.pk]).delete()
+
+        expected = 2 * threads * requests
+        self.stdout.write(f"👁️ Views counted: {counted} of {expected}")
+        if counted != expected:
+            raise CommandError("Some job views were not counted.")
+        self.stdout.write(self.style.SUCCESS("✅ Every job view was counted."))
+
+    def fetch(self, jobs, seeker, threads, requests, max_pending):
+        urls = [reverse('jobs-detail', kwargs={'pk': job.pk}) for job in jobs]
+        barrier, timings, lock = threading.Barrier(threads), [], threading.Lock()
+
+        def browse(offset):
+            # Authenticated, so details come from the database rather than
+            # the anonymous response cache.
+            client = APIClient()
+            client.force_authenticate(seeker)
+            mine = []
+            try:
+                barrier.wait()
+                for i in range(requests):
+                    url = urls[(offset + i) % len(urls)]
+                    mine += time_ms(lambda: client.get(url))
+            finally:
+                connection.close()
+            with lock:
+                timings.extend(mine)
+
+        job_views.flush()
+        previous, job_views.max_pending = job_views.max_pending, max_pending
+        try:
+            workers = [threading.Thread(target=browse, args=(i,)) for i in range(threads)]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+        finally:
+            job_views.max_pending = previous
+        return timings
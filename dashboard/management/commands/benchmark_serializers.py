@@ -0,0 +1,95 @@
+# dashboard/management/commands/benchmark_serializers.py
+import json
+import time
+
+from django.core.management.base import CommandError
+from django.db import transaction
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from rest_framework.utils.encoders import JSONEncoder
+
+from api.fastpath import compile_representation
+from applications.models import Application
+from applications.serializers import ApplicationSerializer
+from dashboard.management.commands.check_query_plans import Command as QueryPlanCommand
+from jobs.models import Job
+from jobs.serializers import JobSerializer
+
+
+class Command(QueryPlanCommand):
+    help = (
+        "Check that the values() fast path (api.fastpath) renders exactly what the "
+        "serializers render, and time both per 1,000 rows. Seeds a throwaway dataset "
+        "(rolled back) unless --no-seed is given."
+    )
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument('--rows', type=int, default=1000, help="Rows per list.")
+        parser.add_argument('--repeat', type=int, default=5, help="Timing runs per case; the best one counts.")
+        parser.add_argument('--no-seed', action='store_true', help="Use the rows already in the database.")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            if not options['no_seed']:
+                self.seed(options['jobs'], options['applications'], options['batch_size'])
+            failures = self.compare(options['rows'], options['repeat'])
+            transaction.set_rollback(True)
+
+        if failures:
+            raise CommandError("Fast path output differs for: " + ", ".join(failures))
+        self.stdout.write(self.style.SUCCESS("✅ Fast path output matches the serializers."))
+
+    def cases(self):
+        jobs = Job.objects.select_related("category", "employer").defer("search_vector").order_by("-created_at")
+        applications = Application.objects.select_related("applicant", "job", "job__employer").order_by("-applied_at")
+        return [
+            ("jobs (compact list)", JobSerializer, jobs, '', True),
+            ("jobs (all fields)", JobSerializer, jobs, 'fields=*', True),
+            ("applications (compact list)", ApplicationSerializer, applications, '', True),
+            ("applications (all fields)", ApplicationSerializer, applications, 'fields=*', True),
+        ]
+
+    def compare(self, rows, repeat):
+        failures = []
+        for name, serializer_class, queryset, query, compact in self.cases():
+            context = {'request': Request(APIRequestFactory().get(f'/?{query}')), 'compact': compact}
+            compiled = compile_representation(serializer_class(context=context), queryset)
+            if compiled is None:
+                failures.append(name)
+                self.stdout.write(self.style.ERROR(f"❌ {name}: serializer cannot be compiled"))
+                continue
+
+            def slow():
+                return serializer_class(list(queryset[:rows]), many=True, context=context).data
+
+            def fast():
+                return compiled.render(queryset.values(*compiled.paths)[:rows])
+
+            expected, actual = slow(), fast()
+            if self.dumps(expected) != self.dumps(actual):
+                failures.append(name)
+                self.stdout.write(self.style.ERROR(f"❌ {name}: output differs"))
+                continue
+
+            per_thousand = 1000 / max(len(actual), 1)
+            slow_ms = self.best(slow, repeat) * per_thousand
+            fast_ms = self.best(fast, repeat) * per_thousand
+            self.stdout.write(
+                f"✔️ {name}: serializer {slow_ms:.1f}ms, fast path {fast_ms:.1f}ms "
+                f"per 1,000 rows ({slow_ms / fast_ms:.1f}x)"
+            )
+        return failures
+
+    @staticmethod
+    def dumps(data):
+        return json.dumps(data, cls=JSONEncoder)
+
+    @staticmethod
+    def best(func, repeat):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - started) * 1000)
+        return min(timings)
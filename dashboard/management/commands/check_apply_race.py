@@ -0,0 +1,66 @@
+# dashboard/management/commands/check_apply_race.py
+import threading
+from collections import Counter
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from applications.models import Application
+from jobs.models import Job
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        "Submit the same application from many threads at once and check that exactly one "
+        "is stored, with every other submission rejected as already applied. Creates a "
+        "throwaway employer, seeker and job, and deletes them afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=20, help="Parallel submissions.")
+
+    def handle(self, *args, **options):
+        employer = User.objects.create(email="race-employer@example.com", role=User.ROLE_EMPLOYER)
+        seeker = User.objects.create(email="race-seeker@example.com", role=User.ROLE_SEEKER)
+        try:
+            job = Job.objects.create(
+                employer=employer, title="Race check", company_name="Race check", description="Race check."
+            )
+            statuses = self.submit(job, seeker, options['threads'])
+            stored = Application.objects.filter(job=job, applicant=seeker).count()
+            job.refresh_from_db(fields=['applications_count'])
+        finally:
+            User.objects.filter(pk__in=[employer.pk, seeker.pk]).delete()
+
+        self.stdout.write(f"📨 Responses: {dict(sorted(statuses.items()))}")
+        self.stdout.write(f"🗃️ Stored applications: {stored}, applications_count: {job.applications_count}")
+        if stored != 1 or job.applications_count != 1 or statuses != {201: 1, 400: options['threads'] - 1}:
+            raise CommandError("Concurrent submissions were not deduplicated.")
+        self.stdout.write(self.style.SUCCESS("✅ Exactly one application was created."))
+
+    def submit(self, job, seeker, threads):
+        url = reverse('job-applications-list', kwargs={'job_pk': job.pk})
+        barrier, statuses, lock = threading.Barrier(threads), Counter(), threading.Lock()
+
+        def apply():
+            client = APIClient()
+            client.force_authenticate(seeker)
+            try:
+                barrier.wait()
+                status = client.post(url, {'resume': "Race check resume."}, format='json').status_code
+            finally:
+                connection.close()
+            with lock:
+                statuses[status] += 1
+
+        workers = [threading.Thread(target=apply) for _ in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        return statuses
@@ -0,0 +1,181 @@
+# dashboard/management/commands/check_query_plans.py
+import re
+from datetime import timedelta
+
+from django.contrib.postgres.search import SearchQuery
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from accounts.models import User
+from applications.models import Application, ApplicationStatusChange
+from applications.resumes import store_resume
+from jobs.models import Job, JobCategory
+from jobs.search import SEARCH_CONFIG
+from reviews.models import EmployerReview
+
+HOT_TABLES = {
+    Job._meta.db_table,
+    Application._meta.db_table,
+    ApplicationStatusChange._meta.db_table,
+    EmployerReview._meta.db_table,
+}
+
+# PostgreSQL: "Seq Scan on jobs_job". SQLite: a bare "SCAN jobs_job" (an
+# index walk shows up as "SCAN jobs_job USING INDEX ...").
+SEQ_SCAN_PATTERNS = [
+    re.compile(r'Seq Scan on (\w+)'),
+    re.compile(r'\bSCAN (\w+)\s*$', re.MULTILINE),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a large throwaway dataset, EXPLAIN the querysets behind the hot "
+        "endpoints and fail if any of them sequentially scans a hot table. "
+        "All seeded rows are rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--jobs', type=int, default=50000, help="Number of jobs to seed.")
+        parser.add_argument('--applications', type=int, default=200000, help="Number of applications to seed.")
+        parser.add_argument('--batch-size', type=int, default=5000)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            employer, seeker = self.seed(options['jobs'], options['applications'], options['batch_size'])
+            failures = self.check_plans(employer, seeker)
+            transaction.set_rollback(True)
+
+        if failures:
+            raise CommandError("Sequential scans on hot tables: " + ", ".join(failures))
+        self.stdout.write(self.style.SUCCESS("✅ No sequential scans on hot tables."))
+
+    def seed(self, job_count, application_count, batch_size):
+        self.stdout.write(f"🌱 Seeding {job_count} jobs and {application_count} applications...")
+        employers = User.objects.bulk_create(
+            User(email=f"plan-employer{i}@example.com", role=User.ROLE_EMPLOYER) for i in range(50)
+        )
+        seekers = User.objects.bulk_create(
+            User(email=f"plan-seeker{i}@example.com", role=User.ROLE_SEEKER) for i in range(500)
+        )
+        category = JobCategory.objects.create(name="Query plan check")
+        now = timezone.now()
+        employment_types = [value for value, _ in Job.EMPLOYMENT_TYPE_CHOICES]
+        experience_levels = [value for value, _ in Job.EXPERIENCE_LEVEL_CHOICES]
+        remote_options = [value for value, _ in Job.REMOTE_OPTION_CHOICES]
+
+        for start in range(0, job_count, batch_size):
+            Job.objects.bulk_create(
+                Job(
+                    employer=employers[i % len(employers)],
+                    title=f"Job {i}",
+                    company_name=f"Company {i % 500}",
+                    description="Seeded for query plan checks.",
+                    category=category,
+                    location=f"City {i % 200}",
+                    is_featured=i % 20 == 0,
+                    is_active=i % 10 != 0,
+                    employment_type=employment_types[i % len(employment_types)],
+                    experience_level=experience_levels[(i // 7) % len(experience_levels)],
+                    remote_option=remote_options[(i // 3) % len(remote_options)],
+                    salary=20000 + (i * 37) % 150000,
+                    application_deadline=(now + timedelta(days=i % 120)).date(),
+                )
+                for i in range(start, min(start + batch_size, job_count))
+            )
+        Job.objects.filter(category=category).update(created_at=now - timedelta(days=1))
+
+        job_ids = list(Job.objects.filter(category=category).values_list('id', flat=True))
+        statuses = [value for value, _ in Application.STATUS_CHOICES]
+        resume = store_resume("Seeded resume.")
+        for start in range(0, application_count, batch_size):
+            Application.objects.bulk_create(
+                Application(
+                    job_id=job_ids[i % len(job_ids)],
+                    applicant=seekers[(i // len(job_ids)) % len(seekers)],
+                    resume_blob_id=resume,
+                    status=statuses[i % len(statuses)],
+                )
+                for i in range(start, min(start + batch_size, application_count))
+            )
+        ApplicationStatusChange.objects.bulk_create(
+            (
+                ApplicationStatusChange(application_id=pk, job_id=job_id, applicant_id=applicant_id, to_status=status)
+                for pk, job_id, applicant_id, status in Application.objects.filter(job__category=category)
+                .values_list('pk', 'job_id', 'applicant_id', 'status').iterator()
+            ),
+            batch_size=batch_size,
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+        return employers[0], seekers[0]
+
+    def hot_querysets(self, employer, seeker):
+        job = Job.objects.filter(employer=employer).first()
+        querysets = {
+            "jobs list": Job.objects.select_related("category", "employer").order_by("-created_at")[:12],
+            "jobs keyset page": Job.objects.filter(created_at__lt=timezone.now()).order_by("-created_at", "-id")[:13],
+            "employer jobs": Job.objects.filter(employer=employer).order_by("-created_at")[:12],
+            "employer featured count": Job.objects.filter(employer=employer, is_featured=True),
+            "recommended jobs fallback": Job.objects.filter(is_active=True).exclude(pk__in=[job.pk]).order_by("-created_at")[:6],
+            "filter employment type": Job.objects.filter(employment_type=Job.Contract).order_by("-created_at")[:12],
+            "filter location": Job.objects.filter(location__in=["City 1", "City 2"]).order_by("-created_at")[:12],
+            "filter featured": Job.objects.filter(is_featured=True).order_by("-created_at")[:12],
+            "filter salary range": Job.objects.filter(salary__gt=100000, salary__lt=101000).order_by("salary")[:12],
+            "filter deadline range": Job.objects.filter(
+                application_deadline__gte=timezone.now().date(),
+                application_deadline__lte=timezone.now().date() + timedelta(days=1),
+            )[:12],
+            "filter combined": Job.objects.filter(
+                employment_type=Job.Contract, remote_option=Job.REMOTE, location="City 3",
+            ).order_by("-created_at")[:12],
+            "closing soon": Job.objects.filter(
+                is_active=True,
+                application_deadline__gte=timezone.now().date(),
+                application_deadline__lte=timezone.now().date() + timedelta(days=7),
+            ).order_by("application_deadline", "id")[:12],
+            "expire overdue batch": Job.objects.filter(
+                is_active=True, application_deadline__lt=timezone.now().date(),
+            ).order_by("application_deadline", "id").values_list("id", "category_id")[:1000],
+            "has applied": Application.objects.filter(job=job, applicant=seeker),
+            "can review": Application.objects.filter(job=job, applicant=seeker, status=Application.ACCEPTED),
+            "seeker status counts": Application.objects.filter(applicant=seeker, status=Application.INTERVIEWED),
+            "seeker recent applications": Application.objects.filter(applicant=seeker).order_by("-applied_at")[:5],
+            "employer applications": Application.objects.filter(job__employer=employer).order_by("-applied_at")[:20],
+            "job applications": Application.objects.filter(job=job).order_by("-applied_at")[:20],
+            "job status funnel": ApplicationStatusChange.objects.filter(job=job, to_status=Application.OFFERED)
+            .order_by("changed_at"),
+            "seeker status timeline": ApplicationStatusChange.objects.filter(applicant=seeker).order_by("-changed_at")[:20],
+            "application history": ApplicationStatusChange.objects.filter(
+                application=Application.objects.filter(job=job).first(),
+            ).order_by("changed_at"),
+            "job pipeline counts": Application.objects.filter(job=job).order_by().values_list("status")
+            .annotate(total=Count("id")),
+            "job reviews": EmployerReview.objects.filter(job=job),
+        }
+        if connection.vendor == 'postgresql':
+            # Elsewhere `?q=` falls back to LIKE, which always scans.
+            querysets["applicant search"] = Application.objects.filter(
+                search_vector=SearchQuery("seeded resume", config=SEARCH_CONFIG, search_type="websearch"),
+            )
+        return querysets
+
+    def check_plans(self, employer, seeker):
+        failures = []
+        for name, queryset in self.hot_querysets(employer, seeker).items():
+            plan = queryset.explain()
+            scanned = {
+                table
+                for pattern in SEQ_SCAN_PATTERNS
+                for table in pattern.findall(plan)
+                if table in HOT_TABLES
+            }
+            if scanned:
+                failures.append(f"{name} ({', '.join(sorted(scanned))})")
+                self.stdout.write(self.style.ERROR(f"❌ {name}\n{plan}"))
+            else:
+                self.stdout.write(f"✔️ {name}")
+        return failures
@@ -6,6 +6,7 @@ from django.utils import timezone
 from accounts.models import User
 from jobs.models import JobCategory, Job
 from applications.models import Application
+from applications.resumes import store_resume
 from reviews.models import EmployerReview 
 
 from datetime import timedelta
@@ -275,7 +276,7 @@ class Command(BaseCommand):
                 app = Application.objects.create(
                     job=job, 
                     applicant=seeker_obj, 
-                    resume=mock_resume_text, 
+                    resume_blob_id=store_resume(mock_resume_text),
                     cover_letter=mock_cover_letter_text,
                     portfolio_link=mock_portfolio_link,
                     status=status
@@ -283,9 +284,6 @@ class Command(BaseCommand):
                 
                 _set_timestamp_if_field_exists(app, applied_dt)
                 applications.append(app)
-                # Manually update job applications_count 
-                job.applications_count = Application.objects.filter(job=job).count()
-                job.save()
 
 
         # -----------------------
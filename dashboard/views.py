@@ -2,6 +2,7 @@ from rest_framework.viewsets import ViewSet
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from jobs.models import Job
+from jobs.recommendations import recommended_job_ids
 from applications.models import Application
 from accounts.models import User
 from dashboard.serializers import AdminDashboardSerializer, EmployerDashboardSerializer, SeekerDashboardSerializer
@@ -10,7 +11,7 @@ from rest_framework.decorators import action
 from django.utils import timezone
 from datetime import timedelta
 from drf_yasg.utils import swagger_auto_schema
-from django.db.models import Count
+from django.db.models import F
 
 # Create your views here.
 
@@ -77,11 +78,8 @@ class DashboardViewSet(ViewSet):
         # 4. Filtered Job QuerySet (For recent and top-performing lists)
 
         top_jobs = list(
-            jobs_qs_all_time.annotate(live_applications_count=Count('applications'))
-            .order_by('-views_count') 
-            .order_by('-live_applications_count') # Added application count as secondary sort
-            [:5]
-            .values('id', 'title', 'views_count', 'live_applications_count')
+            jobs_qs_all_time.order_by('-applications_count', '-views_count')[:5]
+            .values('id', 'title', 'views_count', live_applications_count=F('applications_count'))
         )
         
         payload = {
@@ -106,12 +104,14 @@ class DashboardViewSet(ViewSet):
             .values('id', 'job_id', 'applied_at', 'status')
         )
 
-        recommended_jobs = list(
-            Job.objects.exclude(applications__applicant=user)
-            .filter(is_active=True)
-            .order_by('-created_at')[:6]
+        # Ranked by profile similarity; applied-to jobs are excluded by id.
+        recommended_ids = recommended_job_ids(user)[:6]
+        recommended_by_id = {
+            job['id']: job
+            for job in Job.objects.filter(pk__in=recommended_ids, is_active=True)
             .values('id', 'title', 'company_name', 'location')
-        )
+        }
+        recommended_jobs = [recommended_by_id[pk] for pk in recommended_ids if pk in recommended_by_id]
 
         payload = {
             'seeker_id': user.id,
@@ -0,0 +1,156 @@
+import heapq
+import re
+from bisect import bisect_left
+
+import numpy as np
+from django.db.models import Count
+
+from jobs.indexing import SyncedJobIndex
+from jobs.models import Job
+
+FIELDS = ('title', 'company_name', 'location')
+# Longest prefix looked up; longer input is truncated.
+MAX_PREFIX_LENGTH = 64
+# Memoized prefixes kept per field between changes.
+MAX_MEMOIZED_PREFIXES = 10000
+
+SPACE_RE = re.compile(r"\s+")
+
+
+def normalize(value):
+    return SPACE_RE.sub(' ', (value or '').strip().lower())
+
+
+class PrefixIndex:
+    """
+    Distinct values of one field with their active job counts.
+
+    Values with a positive count are kept sorted, so the values starting with
+    a prefix are one `bisect` range. New values are collected and merged in
+    with one sort before the next lookup. The most popular values of a range
+    are memoized per prefix until the next change, which keeps short, broad
+    prefixes cheap.
+    """
+
+    def __init__(self):
+        self.ids = {}
+        self.labels = []
+        self.counts = []
+        self.sorted = []
+        self._unsorted = []
+        self._top = {}
+
+    def _merge(self):
+        if self._unsorted:
+            self.sorted.extend(self._unsorted)
+            self.sorted.sort()
+            self._unsorted = []
+
+    def add(self, label):
+        """Count one more active job with `label`; returns the value's id."""
+        key = normalize(label)
+        value_id = self.ids.get(key)
+        if value_id is None:
+            value_id = self.ids[key] = len(self.labels)
+            self.labels.append(label.strip())
+            self.counts.append(0)
+        if not self.counts[value_id]:
+            self._unsorted.append(key)
+        self.counts[value_id] += 1
+        self._top.clear()
+        return value_id
+
+    def remove(self, value_id):
+        self.counts[value_id] -= 1
+        if not self.counts[value_id]:
+            key = normalize(self.labels[value_id])
+            position = bisect_left(self.sorted, key)
+            if position < len(self.sorted) and self.sorted[position] == key:
+                del self.sorted[position]
+            else:
+                self._unsorted.remove(key)
+        self._top.clear()
+
+    def top(self, prefix, limit):
+        """`(label, count)` of the most common values starting with `prefix`."""
+        cached = self._top.get(prefix)
+        if cached is None or len(cached) < limit:
+            self._merge()
+            lo = bisect_left(self.sorted, prefix)
+            hi = bisect_left(self.sorted, prefix[:-1] + chr(ord(prefix[-1]) + 1), lo)
+            ids = (self.ids[key] for key in self.sorted[lo:hi])
+            best = heapq.nlargest(limit, ids, key=self.counts.__getitem__)
+            if len(self._top) >= MAX_MEMOIZED_PREFIXES:
+                self._top.clear()
+            cached = self._top[prefix] = [(self.labels[i], self.counts[i]) for i in best]
+        return cached[:limit]
+
+
+class AutocompleteIndex(SyncedJobIndex):
+    """
+    Prefix index over the titles, companies and locations of active jobs.
+
+    `job_values` holds, for every job id, the value id it contributed to each
+    field (-1 for none), so a changed or deleted job can be subtracted again
+    without keeping its text around.
+    """
+    fields = FIELDS
+
+    def _reset(self):
+        self.indexes = {field: PrefixIndex() for field in FIELDS}
+        self.job_values = np.full((1024, len(FIELDS)), -1, dtype=np.int32)
+
+    def _add(self, job):
+        job_id = job['id']
+        if job_id >= len(self.job_values):
+            grown = np.full((max(job_id + 1, 2 * len(self.job_values)), len(FIELDS)), -1, dtype=np.int32)
+            grown[:len(self.job_values)] = self.job_values
+            self.job_values = grown
+        for column, field in enumerate(FIELDS):
+            if normalize(job[field]):
+                self.job_values[job_id, column] = self.indexes[field].add(job[field])
+
+    def _remove(self, job_id):
+        if job_id >= len(self.job_values):
+            return
+        for column, field in enumerate(FIELDS):
+            value_id = self.job_values[job_id, column]
+            if value_id >= 0:
+                self.indexes[field].remove(int(value_id))
+                self.job_values[job_id, column] = -1
+
+    def suggest(self, prefix, limit=5, fields=FIELDS):
+        """
+        `{field: [{"value", "count"}]}` for the most common values starting
+        with `prefix`, or None while the index is still being built.
+        """
+        prefix = normalize(prefix)[:MAX_PREFIX_LENGTH]
+        if not self.sync():
+            return None
+        with self._lock:
+            return {
+                field: [
+                    {'value': label, 'count': count}
+                    for label, count in (self.indexes[field].top(prefix, limit) if prefix else [])
+                ]
+                for field in fields
+            }
+
+
+autocomplete_index = AutocompleteIndex()
+
+
+def database_suggestions(prefix, limit=5, fields=FIELDS):
+    """`AutocompleteIndex.suggest()` answered from the jobs table, while the index warms up."""
+    prefix = normalize(prefix)[:MAX_PREFIX_LENGTH]
+    if not prefix:
+        return {field: [] for field in fields}
+    active = Job.objects.filter(is_active=True)
+    return {
+        field: [
+            {'value': value, 'count': count}
+            for value, count in active.filter(**{f'{field}__istartswith': prefix})
+            .values_list(field).annotate(count=Count('id')).order_by('-count', field)[:limit]
+        ]
+        for field in fields
+    }
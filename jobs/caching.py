@@ -0,0 +1,127 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.http import parse_http_date_safe
+from rest_framework import status
+from rest_framework.response import Response
+
+from api.conditional import ConditionalGetMixin
+
+VERSION_KEY = 'jobs:cache-version'
+HITS_KEY = 'jobs:response-cache:hits'
+MISSES_KEY = 'jobs:response-cache:misses'
+# Stored with the cached data, so hits answer conditional requests too.
+VALIDATOR_HEADERS = ('ETag', 'Last-Modified')
+
+
+def get_cache_version():
+    """
+    Current version of the job board data.
+
+    Every cached response key embeds this version, so bumping it invalidates
+    all of them at once without scanning keys. A missing version is seeded
+    from the clock so it never repeats an earlier one after an eviction.
+    """
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, time.time_ns(), None)
+        version = cache.get(VERSION_KEY, time.time_ns())
+    return version
+
+
+def bump_cache_version():
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, time.time_ns(), None)
+
+
+def normalized_query(params, ignore=()):
+    """
+    Query string with keys and values sorted and `page=1` dropped.
+
+    Blank values are kept: flags such as `?cursor=` change the response.
+    """
+    items = []
+    for key in sorted(params.keys()):
+        if key in ignore:
+            continue
+        values = sorted(value.strip() for value in params.getlist(key))
+        if key == 'page' and values == ['1']:
+            continue
+        items.extend(f'{key}={value}' for value in values)
+    return '&'.join(items)
+
+
+def response_cache_key(request):
+    raw = f"{request.get_host()}{request.path}?{normalized_query(request.query_params)}"
+    digest = hashlib.md5(raw.encode()).hexdigest()
+    return f'jobs:cached-response:{get_cache_version()}:{digest}'
+
+
+def _incr(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, None):
+            cache.incr(key)
+
+
+def response_cache_stats():
+    hits = cache.get(HITS_KEY, 0)
+    misses = cache.get(MISSES_KEY, 0)
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_ratio': round(hits / total, 4) if total else None,
+    }
+
+
+class AnonymousResponseCacheMixin:
+    """
+    Serve anonymous `list`/`retrieve` responses from the shared cache.
+
+    Keys are built from the host, path and normalized query string plus the
+    job board version (see `get_cache_version`), which `jobs.signals` bumps
+    whenever a Job or JobCategory is saved or deleted. Authenticated requests
+    and non-200 or streamed responses are never cached. Each response carries
+    an `X-Cache: HIT|MISS` header and hits/misses are counted for
+    `response_cache_stats()`.
+
+    The ETag and Last-Modified headers of a cached response are kept with it,
+    and hits answer `If-None-Match`/`If-Modified-Since` with a `304`. List
+    this mixin before `ConditionalGetMixin`, so hits skip its queries.
+    """
+    response_cache_timeout = getattr(settings, 'JOB_RESPONSE_CACHE_TIMEOUT', 300)
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(super().retrieve, request, *args, **kwargs)
+
+    def cached_response(self, handler, request, *args, **kwargs):
+        if request.user.is_authenticated:
+            return handler(request, *args, **kwargs)
+
+        key = response_cache_key(request)
+        cached = cache.get(key)
+        if cached is not None:
+            _incr(HITS_KEY)
+            data, headers = cached
+            if 'ETag' in headers and ConditionalGetMixin.is_not_modified(
+                request, headers['ETag'], parse_http_date_safe(headers.get('Last-Modified', '')),
+            ):
+                return Response(status=status.HTTP_304_NOT_MODIFIED, headers={**headers, 'X-Cache': 'HIT'})
+            return Response(data, headers={**headers, 'X-Cache': 'HIT'})
+
+        response = handler(request, *args, **kwargs)
+        if isinstance(response, Response) and response.status_code == 200:
+            _incr(MISSES_KEY)
+            headers = {name: response[name] for name in VALIDATOR_HEADERS if response.has_header(name)}
+            cache.set(key, (response.data, headers), self.response_cache_timeout)
+            response['X-Cache'] = 'MISS'
+        return response
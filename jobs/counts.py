@@ -0,0 +1,47 @@
+from django.db.models import Count, F, Q
+from django.db.models.functions import Greatest
+
+from jobs.models import Job, JobCategory, JobCategoryCount
+
+
+def adjust_category_counts(category_id, total_delta, active_delta):
+    """Atomically shift one category's materialized counts."""
+    if category_id is None or not (total_delta or active_delta):
+        return
+    updated = JobCategoryCount.objects.filter(category_id=category_id).update(
+        total_jobs=Greatest(F('total_jobs') + total_delta, 0),
+        active_jobs=Greatest(F('active_jobs') + active_delta, 0),
+    )
+    if not updated:
+        recount_categories([category_id])
+
+
+def recount_categories(category_ids=None):
+    """Rebuild the counts of the given categories (all of them by default) from the jobs table."""
+    categories = JobCategory.objects.all()
+    if category_ids is not None:
+        categories = categories.filter(pk__in=[pk for pk in category_ids if pk is not None])
+
+    counts = (
+        Job.objects.filter(category__in=categories)
+        .order_by()
+        .values('category')
+        .annotate(total=Count('pk'), active=Count('pk', filter=Q(is_active=True)))
+    )
+    by_category = {row['category']: row for row in counts}
+
+    rows = [
+        JobCategoryCount(
+            category_id=pk,
+            total_jobs=by_category.get(pk, {}).get('total', 0),
+            active_jobs=by_category.get(pk, {}).get('active', 0),
+        )
+        for pk in categories.values_list('pk', flat=True)
+    ]
+    JobCategoryCount.objects.bulk_create(
+        rows,
+        update_conflicts=True,
+        unique_fields=['category'],
+        update_fields=['total_jobs', 'active_jobs'],
+    )
+    return len(rows)
@@ -0,0 +1,111 @@
+from decimal import Decimal
+
+from django.db.models import Count, Q
+
+from jobs.models import Job, JobCategory
+
+# (value, lower bound inclusive, upper bound exclusive)
+SALARY_BANDS = [
+    ('0-30000', None, 30000),
+    ('30000-60000', 30000, 60000),
+    ('60000-90000', 60000, 90000),
+    ('90000-120000', 90000, 120000),
+    ('120000-150000', 120000, 150000),
+    ('150000+', 150000, None),
+]
+
+CHOICE_FACETS = {
+    'employment_type': Job.EMPLOYMENT_TYPE_CHOICES,
+    'experience_level': Job.EXPERIENCE_LEVEL_CHOICES,
+    'remote_option': Job.REMOTE_OPTION_CHOICES,
+}
+
+# Query parameters that select values of each facet. They are left out of the
+# base filter so every facet is counted with OR semantics within itself and
+# AND semantics across the other facets.
+FACET_PARAMS = {
+    **{name: (name, f'{name}__in') for name in CHOICE_FACETS},
+    'category': ('category_id', 'category_id__in'),
+    'salary': ('salary__gt', 'salary__lt'),
+}
+
+
+def _selected(params, name):
+    single, multiple = FACET_PARAMS[name]
+    values = [value for value in params.getlist(single) if value]
+    for value in params.getlist(multiple):
+        values.extend(item for item in value.split(',') if item)
+    return values
+
+
+def facet_condition(params, name):
+    """The Q() a request's selection for one facet adds to the other facets' counts."""
+    if name == 'salary':
+        condition = Q()
+        for lookup in FACET_PARAMS['salary']:
+            if params.get(lookup):
+                condition &= Q(**{lookup: Decimal(params[lookup])})
+        return condition
+
+    values = _selected(params, name)
+    if not values:
+        return Q()
+    if name == 'category':
+        return Q(category_id__in=values)
+    return Q(**{f'{name}__in': values})
+
+
+def salary_band_condition(low, high):
+    condition = Q(salary__isnull=False)
+    if low is not None:
+        condition &= Q(salary__gte=low)
+    if high is not None:
+        condition &= Q(salary__lt=high)
+    return condition
+
+
+def compute_facets(queryset, params):
+    """
+    Count every facet value over `queryset` in a single aggregate query.
+
+    `params` must already have passed JobFilter validation. `queryset` must
+    carry every filter except the facet selections themselves (see
+    FACET_PARAMS); those are applied here per facet, so a facet's own
+    selection never narrows its own counts.
+    """
+    conditions = {name: facet_condition(params, name) for name in FACET_PARAMS}
+
+    def others(name):
+        combined = Q()
+        for other, condition in conditions.items():
+            if other != name:
+                combined &= condition
+        return combined
+
+    categories = list(JobCategory.objects.order_by('name').values_list('id', 'name'))
+    buckets = {
+        name: [(value, label, Q(**{name: value})) for value, label in choices]
+        for name, choices in CHOICE_FACETS.items()
+    }
+    buckets['category'] = [(pk, label, Q(category_id=pk)) for pk, label in categories]
+    buckets['salary'] = [
+        (value, value, salary_band_condition(low, high)) for value, low, high in SALARY_BANDS
+    ]
+
+    aggregates = {'total': Count('pk', filter=others(None))}
+    for name, values in buckets.items():
+        scope = others(name)
+        for index, (_, _, condition) in enumerate(values):
+            aggregates[f'{name}_{index}'] = Count('pk', filter=scope & condition)
+
+    counts = queryset.order_by().aggregate(**aggregates)
+    return {
+        'total': counts['total'],
+        'facets': {
+            name: [
+                {'value': value, 'label': label, 'count': counts[f'{name}_{index}']}
+                for index, (value, label, _) in enumerate(values)
+            ]
+            for name, values in buckets.items()
+        },
+    }
@@ -1,4 +1,5 @@
 from django_filters.rest_framework import FilterSet, NumberFilter
+from rest_framework.filters import OrderingFilter
 from jobs.models import Job
 
 
@@ -7,7 +8,34 @@ class JobFilter(FilterSet):
 
     class Meta:
         model = Job
+        # `__in` variants take comma-separated values, e.g. ?remote_option__in=remote,hybrid
         fields = {
-            'category_id': ['exact'],
-            'salary': ['gt', 'lt']
-        }
\ No newline at end of file
+            'category_id': ['exact', 'in'],
+            'salary': ['gt', 'lt'],
+            'employment_type': ['exact', 'in'],
+            'experience_level': ['exact', 'in'],
+            'remote_option': ['exact', 'in'],
+            'location': ['exact', 'in'],
+            'is_featured': ['exact'],
+            'application_deadline': ['gte', 'lte'],
+        }
+
+
+class JobOrderingFilter(OrderingFilter):
+    """
+    OrderingFilter that expands public aliases listed in `ordering_fields`.
+
+    `?ordering=-trending` sorts by the precomputed `trending_score`, with the
+    id as tie-breaker so pages are stable (and served by job_trending_idx).
+    """
+    aliases = {'trending': ['trending_score', 'id']}
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        if not ordering:
+            return ordering
+        expanded = []
+        for term in ordering:
+            descending, name = term.startswith('-'), term.lstrip('-')
+            expanded.extend(f"{'-' if descending else ''}{field}" for field in self.aliases.get(name, [name]))
+        return expanded
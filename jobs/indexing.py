@@ -0,0 +1,155 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import Q
+from django.utils import timezone
+
+from jobs.models import Job
+
+# Every index created in this process, for warm_up_job_indexes().
+_indexes = []
+
+
+class SyncedJobIndex(ABC):
+    """
+    Base for in-process indexes over the text of active jobs.
+
+    The index is built once per process in a background thread (see
+    `warm_up_job_indexes`), never inside a request: until it is ready
+    `sync()` returns False and callers fall back to the database. It is then
+    kept current incrementally, at most every `sync_interval` seconds:
+
+    - jobs whose `updated_at` falls within `JOB_INDEX_SYNC_OVERLAP` seconds
+      before the last sync are re-read, so a transaction that commits after
+      the sync started is still picked up by a later one;
+    - jobs saved or deleted through this process are queued by
+      `mark_changed()` when their transaction commits and re-read by id,
+      which also covers deletions and writes that leave `updated_at` alone.
+
+    Re-read jobs whose `updated_at` matches what is indexed are skipped.
+    Subclasses set `fields` (and the name of their sync interval setting)
+    and implement `_reset`, `_add` and `_remove`.
+    """
+    fields = ()
+    sync_interval_setting = 'JOB_INDEX_SYNC_INTERVAL'
+
+    def __init__(self, sync_interval=None):
+        self.sync_interval = sync_interval or getattr(settings, self.sync_interval_setting, 10)
+        self.sync_overlap = timedelta(seconds=getattr(settings, 'JOB_INDEX_SYNC_OVERLAP', 300))
+        self._lock = threading.RLock()
+        self._built = False
+        self._builder = None
+        self._changed = set()
+        self._changed_lock = threading.Lock()
+        self._indexed_at = {}
+        self._synced_until = None
+        self._last_sync = 0.0
+        _indexes.append(self)
+
+    @abstractmethod
+    def _reset(self):
+        """Empty the index."""
+
+    @abstractmethod
+    def _add(self, job):
+        """Index one active job, given as a dict of `id` and `fields`."""
+
+    @abstractmethod
+    def _remove(self, job_id):
+        """Forget a job; a no-op for jobs that are not indexed."""
+
+    @property
+    def ready(self):
+        return self._built
+
+    def build(self):
+        with self._lock:
+            self._reset()
+            self._indexed_at = {}
+            started = timezone.now()
+            jobs = Job.objects.filter(is_active=True).values('id', 'updated_at', *self.fields)
+            for job in jobs.iterator(chunk_size=2000):
+                self._add(job)
+                self._indexed_at[job['id']] = job['updated_at']
+            self._synced_until = started
+            self._last_sync = time.monotonic()
+            self._built = True
+
+    def warm_up(self):
+        """Start building the index in a background thread, unless it is built or being built."""
+        with self._changed_lock:
+            if self._built or (self._builder is not None and self._builder.is_alive()):
+                return
+            self._builder = threading.Thread(target=self._build_in_background, daemon=True)
+            self._builder.start()
+
+    def _build_in_background(self):
+        try:
+            self.build()
+        finally:
+            connections.close_all()
+
+    def sync(self, force=False):
+        """
+        Re-index jobs changed since the last sync (at most every
+        `sync_interval` seconds, or at once for jobs queued by
+        `mark_changed()`). Returns False while the index is not built yet.
+        """
+        if not self._built:
+            # Not waiting for the lock a background build holds.
+            self.warm_up()
+            return False
+        with self._lock:
+            if not force and not self._changed and time.monotonic() - self._last_sync < self.sync_interval:
+                return True
+            started = timezone.now()
+            with self._changed_lock:
+                queued, self._changed = self._changed, set()
+            window = Q(updated_at__gte=self._synced_until - self.sync_overlap)
+            if queued:
+                window |= Q(pk__in=queued)
+            changed = Job.objects.filter(window).values('id', 'is_active', 'updated_at', *self.fields)
+            seen = set()
+            for job in changed.iterator(chunk_size=2000):
+                job_id = job['id']
+                seen.add(job_id)
+                if job_id not in queued and self._indexed_at.get(job_id) == job['updated_at']:
+                    continue
+                self._remove(job_id)
+                self._indexed_at.pop(job_id, None)
+                if job['is_active']:
+                    self._add(job)
+                    self._indexed_at[job_id] = job['updated_at']
+            # Queued jobs that are gone were deleted.
+            for job_id in queued - seen:
+                self._remove(job_id)
+                self._indexed_at.pop(job_id, None)
+            self._synced_until = started
+            self._last_sync = time.monotonic()
+            return True
+
+    def mark_changed(self, job_ids):
+        """Re-read these jobs on the next query; call once their transaction has committed."""
+        with self._changed_lock:
+            self._changed.update(job_ids)
+
+    def mark_stale(self):
+        """Sync on the next query instead of waiting for `sync_interval`."""
+        self._last_sync = 0.0
+
+
+def warm_up_job_indexes():
+    """
+    Build every in-process job index in the background. Called once per
+    process at startup (talent_bridge/wsgi.py and asgi.py), so no request
+    pays for a build. Does nothing when JOB_INDEX_WARM_UP is off; each index
+    then starts building on first use.
+    """
+    if not getattr(settings, 'JOB_INDEX_WARM_UP', True):
+        return
+    for index in _indexes:
+        index.warm_up()
@@ -0,0 +1,49 @@
+# jobs/management/commands/expire_jobs.py
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from jobs.models import Job
+from jobs.signals import jobs_bulk_changed
+
+
+class Command(BaseCommand):
+    help = (
+        "Deactivate active jobs whose application_deadline has passed, in small "
+        "batched UPDATEs so no long-running lock is held. Meant to run on a schedule."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help="Jobs per UPDATE statement.")
+        parser.add_argument('--pause', type=float, default=0, help="Seconds to sleep between batches.")
+        parser.add_argument('--dry-run', action='store_true', help="Only report how many jobs are overdue.")
+
+    def handle(self, *args, **options):
+        today = timezone.localdate()
+        # Served by job_active_deadline_idx.
+        overdue = Job.objects.filter(is_active=True, application_deadline__lt=today)
+
+        if options['dry_run']:
+            self.stdout.write(f"🔎 {overdue.count()} jobs are past their application deadline.")
+            return
+
+        expired, category_ids = 0, set()
+        while True:
+            batch = list(
+                overdue.order_by('application_deadline', 'id').values_list('id', 'category_id')[:options['batch_size']]
+            )
+            if not batch:
+                break
+            with transaction.atomic():
+                expired += Job.objects.filter(pk__in=[pk for pk, _ in batch], is_active=True).update(
+                    is_active=False, updated_at=timezone.now()
+                )
+            category_ids.update(category_id for _, category_id in batch)
+            if options['pause']:
+                time.sleep(options['pause'])
+
+        if expired:
+            jobs_bulk_changed.send(sender=Job, category_ids=category_ids)
+        self.stdout.write(self.style.SUCCESS(f"✅ Expired {expired} jobs past their application deadline."))
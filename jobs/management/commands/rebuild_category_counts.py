@@ -0,0 +1,16 @@
+# jobs/management/commands/rebuild_category_counts.py
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from jobs.caching import bump_cache_version
+from jobs.counts import recount_categories
+
+
+class Command(BaseCommand):
+    help = "Rebuild the materialized active/total job counts of every category from the jobs table."
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            rebuilt = recount_categories()
+        bump_cache_version()
+        self.stdout.write(self.style.SUCCESS(f"✅ Rebuilt job counts for {rebuilt} categories."))
@@ -0,0 +1,54 @@
+# jobs/management/commands/rebuild_job_signatures.py
+import random
+import time
+
+from django.core.management.base import BaseCommand
+
+from jobs.models import Job
+from jobs.similarity import similar_jobs, update_signatures
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the MinHash signatures and LSH buckets behind /jobs/{id}/similar/, "
+        "reporting the build time, and optionally time a sample of similarity queries."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=2000, help="Jobs re-indexed per transaction.")
+        parser.add_argument('--benchmark', type=int, default=0, metavar='N', help="Time N queries on random active jobs.")
+        parser.add_argument('--skip-build', action='store_true', help="Only run the benchmark.")
+
+    def handle(self, *args, **options):
+        if not options['skip_build']:
+            self.build(options['batch_size'])
+        if options['benchmark']:
+            self.benchmark(options['benchmark'])
+
+    def build(self, batch_size):
+        started = time.perf_counter()
+        last_id, indexed = 0, 0
+        while True:
+            ids = list(Job.objects.filter(pk__gt=last_id).order_by('pk').values_list('pk', flat=True)[:batch_size])
+            if not ids:
+                break
+            indexed += update_signatures(ids)
+            last_id = ids[-1]
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f"✅ Indexed {indexed} jobs in {elapsed:.1f}s."))
+
+    def benchmark(self, samples):
+        ids = list(Job.objects.filter(is_active=True).values_list('pk', flat=True))
+        if not ids:
+            self.stdout.write("⚠️ No active jobs to benchmark.")
+            return
+        timings = []
+        for job in Job.objects.filter(pk__in=random.sample(ids, min(samples, len(ids)))).only('pk'):
+            started = time.perf_counter()
+            similar_jobs(job)
+            timings.append((time.perf_counter() - started) * 1000)
+        timings.sort()
+        p50, p95 = timings[len(timings) // 2], timings[int(len(timings) * 0.95)]
+        self.stdout.write(
+            f"⏱️ {len(timings)} queries: p50 {p50:.1f}ms, p95 {p95:.1f}ms, max {timings[-1]:.1f}ms"
+        )
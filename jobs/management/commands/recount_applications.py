@@ -0,0 +1,41 @@
+# jobs/management/commands/recount_applications.py
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from applications.models import Application
+from jobs.models import Job
+
+
+class Command(BaseCommand):
+    help = "Recount Job.applications_count (non-withdrawn applications) in bulk, batch by batch."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=10000, help="Jobs per UPDATE statement.")
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        live_count = (
+            Application.objects.filter(job=OuterRef('pk'))
+            .exclude(status=Application.WITHDRAWN)
+            .order_by()
+            .values('job')
+            .annotate(total=Count('id'))
+            .values('total')
+        )
+
+        last_id, updated = 0, 0
+        while True:
+            ids = list(
+                Job.objects.filter(pk__gt=last_id).order_by('pk').values_list('pk', flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+            with transaction.atomic():
+                updated += Job.objects.filter(pk__gte=ids[0], pk__lte=ids[-1]).update(
+                    applications_count=Coalesce(Subquery(live_count), 0)
+                )
+            last_id = ids[-1]
+
+        self.stdout.write(self.style.SUCCESS(f"✅ Recounted applications for {updated} jobs."))
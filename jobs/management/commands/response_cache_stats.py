@@ -0,0 +1,19 @@
+# jobs/management/commands/response_cache_stats.py
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+
+from jobs.caching import HITS_KEY, MISSES_KEY, response_cache_stats
+
+
+class Command(BaseCommand):
+    help = "Show hit/miss counters of the anonymous job board response cache."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reset', action='store_true', help="Reset the counters after printing them.")
+
+    def handle(self, *args, **options):
+        stats = response_cache_stats()
+        ratio = "n/a" if stats['hit_ratio'] is None else f"{stats['hit_ratio']:.2%}"
+        self.stdout.write(f"Hits: {stats['hits']}  Misses: {stats['misses']}  Hit ratio: {ratio}")
+        if options['reset']:
+            cache.delete_many([HITS_KEY, MISSES_KEY])
@@ -0,0 +1,40 @@
+# jobs/management/commands/update_trending_scores.py
+import time
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from jobs.caching import bump_cache_version
+from jobs.models import Job
+from jobs.trending import update_trending_scores
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute Job.trending_score for active jobs in one set-based UPDATE. Meant to run "
+        "on a schedule; --backfill also scores inactive jobs, in id-range batches."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--backfill', action='store_true', help="Score every job, including inactive ones.")
+        parser.add_argument('--batch-size', type=int, default=10000, help="Jobs per UPDATE statement with --backfill.")
+
+    def handle(self, *args, **options):
+        # One `now` for every batch, so all scores decay to the same instant.
+        now, started = timezone.now(), time.perf_counter()
+
+        if not options['backfill']:
+            updated = update_trending_scores(now=now)
+        else:
+            updated, last_id, batch_size = 0, 0, options['batch_size']
+            while True:
+                ids = list(Job.objects.filter(pk__gt=last_id).order_by('pk').values_list('pk', flat=True)[:batch_size])
+                if not ids:
+                    break
+                updated += update_trending_scores(Job.objects.filter(pk__gte=ids[0], pk__lte=ids[-1]), now=now)
+                last_id = ids[-1]
+                self.stdout.write(f"🔄 Scored {updated} jobs...")
+
+        bump_cache_version()
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f"✅ Updated trending scores for {updated} jobs in {elapsed:.2f}s."))
@@ -0,0 +1,64 @@
+# Generated by Django 5.2.7 on 2026-10-17 19:21
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+# Weights: title (A) > company name (B) > requirements/description (C) > location (D).
+SEARCH_VECTOR_SQL = """
+    setweight(to_tsvector('english', coalesce({row}title, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce({row}company_name, '')), 'B') ||
+    setweight(to_tsvector('english', coalesce({row}requirements, '') || ' ' || coalesce({row}description, '')), 'C') ||
+    setweight(to_tsvector('english', coalesce({row}location, '')), 'D')
+"""
+
+CREATE_SEARCH_VECTOR_SQL = [
+    """
+    CREATE OR REPLACE FUNCTION jobs_job_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector := {vector};
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql;
+    """.format(vector=SEARCH_VECTOR_SQL.format(row='NEW.')),
+    """
+    CREATE TRIGGER jobs_job_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, company_name, requirements, description, location
+    ON jobs_job FOR EACH ROW EXECUTE FUNCTION jobs_job_search_vector_update();
+    """,
+    "UPDATE jobs_job SET search_vector = {vector};".format(vector=SEARCH_VECTOR_SQL.format(row='')),
+    "CREATE INDEX jobs_job_search_vector_gin ON jobs_job USING gin (search_vector);",
+]
+
+DROP_SEARCH_VECTOR_SQL = [
+    "DROP INDEX IF EXISTS jobs_job_search_vector_gin;",
+    "DROP TRIGGER IF EXISTS jobs_job_search_vector_trigger ON jobs_job;",
+    "DROP FUNCTION IF EXISTS jobs_job_search_vector_update();",
+]
+
+
+def _run_on_postgres(statements):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != 'postgresql':
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(
+            _run_on_postgres(CREATE_SEARCH_VECTOR_SQL),
+            _run_on_postgres(DROP_SEARCH_VECTOR_SQL),
+        ),
+    ]
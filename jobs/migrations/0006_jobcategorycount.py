@@ -0,0 +1,44 @@
+# Generated by Django 5.2.7 on 2026-10-17 19:29
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def populate_category_counts(apps, schema_editor):
+    Job = apps.get_model('jobs', 'Job')
+    JobCategory = apps.get_model('jobs', 'JobCategory')
+    JobCategoryCount = apps.get_model('jobs', 'JobCategoryCount')
+
+    counts = {
+        row['category']: row
+        for row in Job.objects.filter(category__isnull=False).order_by().values('category')
+        .annotate(total=Count('pk'), active=Count('pk', filter=Q(is_active=True)))
+    }
+    JobCategoryCount.objects.bulk_create(
+        JobCategoryCount(
+            category_id=pk,
+            total_jobs=counts.get(pk, {}).get('total', 0),
+            active_jobs=counts.get(pk, {}).get('active', 0),
+        )
+        for pk in JobCategory.objects.values_list('pk', flat=True)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0005_jobcategory_updated_at_job_updated_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobCategoryCount',
+            fields=[
+                ('category', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='counts', serialize=False, to='jobs.jobcategory')),
+                ('active_jobs', models.PositiveIntegerField(default=0)),
+                ('total_jobs', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(populate_category_counts, migrations.RunPython.noop),
+    ]
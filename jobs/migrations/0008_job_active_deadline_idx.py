@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-17 19:34
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0007_job_filter_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(condition=models.Q(('application_deadline__isnull', False), ('is_active', True)), fields=['application_deadline', 'id'], name='job_active_deadline_idx'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.7 on 2026-10-17 19:49
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0009_jobsignature_joblshbucket'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='trending_score',
+            field=models.FloatField(default=1.0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['-trending_score', '-id'], name='job_trending_idx'),
+        ),
+    ]
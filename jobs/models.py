@@ -1,11 +1,13 @@
 from django.conf import settings
-from django.db import models
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models, router, transaction
 
 # Create your models here.
 
 class JobCategory(models.Model):
     name = models.CharField(max_length=100)
     description = models.TextField(max_length=500, blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.name
@@ -67,6 +69,135 @@ class Job(models.Model):
     views_count = models.PositiveIntegerField(default=0)
     applications_count = models.PositiveIntegerField(default=0)
     is_active = models.BooleanField(default=True)
+    # Engagement decayed by age, recomputed in bulk by `update_trending_scores`
+    # (see jobs/trending.py). 1.0 is the score of a new job nobody has seen.
+    trending_score = models.FloatField(default=1.0, editable=False)
+    # Weighted tsvector kept up to date by a database trigger on PostgreSQL
+    # (GIN-indexed, see migration 0002). Left empty on other databases.
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            # Listing / keyset pagination order.
+            models.Index(fields=['-created_at', '-id'], name='job_created_idx'),
+            # Recommendations: newest active jobs only.
+            models.Index(fields=['-created_at'], condition=models.Q(is_active=True), name='job_active_created_idx'),
+            # Employer dashboard and `?employer=` listings.
+            models.Index(fields=['employer', '-created_at'], name='job_employer_created_idx'),
+            models.Index(fields=['employer', 'is_featured'], name='job_employer_featured_idx'),
+            # Top jobs / `?ordering=-applications_count`.
+            models.Index(fields=['employer', '-applications_count'], name='job_employer_apps_idx'),
+            models.Index(fields=['-applications_count', '-id'], name='job_applications_count_idx'),
+            # MAX(updated_at) validators for conditional GETs.
+            models.Index(fields=['updated_at'], name='job_updated_idx'),
+            # JobFilter fields, each paired with the default newest-first order.
+            # PostgreSQL combines them with bitmap scans for multi-filter queries.
+            models.Index(fields=['category', '-created_at'], name='job_category_created_idx'),
+            models.Index(fields=['employment_type', '-created_at'], name='job_employment_created_idx'),
+            models.Index(fields=['experience_level', '-created_at'], name='job_experience_created_idx'),
+            models.Index(fields=['remote_option', '-created_at'], name='job_remote_created_idx'),
+            models.Index(fields=['location', '-created_at'], name='job_location_created_idx'),
+            models.Index(fields=['-created_at'], condition=models.Q(is_featured=True), name='job_featured_created_idx'),
+            # Range filters and `?ordering=` on salary / application_deadline.
+            models.Index(fields=['salary'], name='job_salary_idx'),
+            models.Index(fields=['application_deadline'], name='job_deadline_idx'),
+            # Open jobs by deadline: `closing_soon` and the `expire_jobs` sweep.
+            models.Index(
+                fields=['application_deadline', 'id'],
+                condition=models.Q(is_active=True, application_deadline__isnull=False),
+                name='job_active_deadline_idx',
+            ),
+            # `?ordering=-trending`.
+            models.Index(fields=['-trending_score', '-id'], name='job_trending_idx'),
+        ]
+
+    # Maintained only through set-based updates (and the search trigger), so a
+    # regular save() must never write back possibly stale in-memory values.
+    DB_MAINTAINED_FIELDS = ('views_count', 'applications_count', 'search_vector', 'trending_score')
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember what the category counts were based on (see jobs.signals).
+        if 'category_id' in instance.__dict__ and 'is_active' in instance.__dict__:
+            instance._loaded_category_state = (instance.category_id, instance.is_active)
+        return instance
+
+    def save(self, *args, **kwargs):
+        if self._state.adding:
+            return super().save(*args, **kwargs)
+        if kwargs.get('update_fields') is None:
+            skipped = self.get_deferred_fields() | set(self.DB_MAINTAINED_FIELDS)
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in skipped
+            ]
+        if not {'category', 'category_id', 'is_active'} & set(kwargs['update_fields']):
+            return super().save(*args, **kwargs)
+        # The category counts move by the difference from the stored state, so
+        # read it under a row lock and let post_save adjust them before the
+        # lock is released: concurrent saves then apply one change each.
+        using = kwargs.get('using') or router.db_for_write(type(self), instance=self)
+        with transaction.atomic(using=using):
+            stored = self._stored_category_state(using)
+            if stored is not None:
+                self._loaded_category_state = stored
+            super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        using = kwargs.get('using') or router.db_for_write(type(self), instance=self)
+        with transaction.atomic(using=using):
+            stored = self._stored_category_state(using)
+            if stored is None:
+                # Already deleted by a concurrent request, which has
+                # adjusted the counts.
+                return 0, {}
+            self._loaded_category_state = stored
+            return super().delete(*args, **kwargs)
+
+    def _stored_category_state(self, using):
+        return (
+            type(self)._base_manager.using(using).select_for_update()
+            .filter(pk=self.pk).values_list('category_id', 'is_active').first()
+        )
+
+    def __str__(self):
+        return f"{self.title} at {self.company_name}"
+
+
+class JobCategoryCount(models.Model):
+    """Materialized job counts per category, maintained incrementally by jobs.signals."""
+    category = models.OneToOneField(JobCategory, on_delete=models.CASCADE, primary_key=True, related_name='counts')
+    active_jobs = models.PositiveIntegerField(default=0)
+    total_jobs = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.category}: {self.active_jobs} active / {self.total_jobs} total"
+
+
+class JobSignature(models.Model):
+    """MinHash signature of a job's text (see jobs/similarity.py), maintained by jobs.signals."""
+    job = models.OneToOneField(Job, on_delete=models.CASCADE, primary_key=True, related_name='signature')
+    # NUM_PERM little-endian uint32 values.
+    minhash = models.BinaryField()
+
+    def __str__(self):
+        return f"Signature of job {self.job_id}"
+
+
+class JobLshBucket(models.Model):
+    """One LSH band of a job's signature; jobs sharing any bucket are similarity candidates."""
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='lsh_buckets')
+    band = models.PositiveSmallIntegerField()
+    bucket = models.BigIntegerField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['job', 'band'], name='job_lsh_band_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['band', 'bucket'], name='job_lsh_bucket_idx'),
+        ]
 
     def __str__(self):
-        return f"{self.title} at {self.company_name}"
\ No newline at end of file
+        return f"Job {self.job_id} band {self.band}: {self.bucket}"
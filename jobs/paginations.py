@@ -1,4 +1,119 @@
-from rest_framework.pagination import PageNumberPagination
+import base64
+import json
+from datetime import datetime
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 
 class DefaultPagination(PageNumberPagination):
-    page_size = 12
\ No newline at end of file
+    page_size = 12
+
+
+class KeysetPagination(BasePagination):
+    """
+    Opt-in cursor pagination keyed on (timestamp, id), newest first.
+
+    Pages are fetched with a seek predicate on the (timestamp, id) pair
+    instead of OFFSET, and no COUNT(*) is issued, so every page costs the
+    same no matter how deep the client goes. Clients opt in by sending
+    `?cursor=` (empty for the first page) and then follow `next`/`previous`.
+    """
+    page_size = 12
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Invalid cursor'
+    timestamp_field = None
+
+    @classmethod
+    def is_requested(cls, request):
+        return request is not None and cls.cursor_query_param in request.query_params
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        position = self.decode_cursor(request)
+        ts = self.timestamp_field
+
+        if position is None:
+            reverse = False
+            queryset = queryset.order_by(f'-{ts}', '-pk')
+        else:
+            timestamp, pk, reverse = position
+            if reverse:
+                queryset = queryset.filter(
+                    Q(**{f'{ts}__gt': timestamp}) | Q(**{ts: timestamp, 'pk__gt': pk})
+                ).order_by(ts, 'pk')
+            else:
+                queryset = queryset.filter(
+                    Q(**{f'{ts}__lt': timestamp}) | Q(**{ts: timestamp, 'pk__lt': pk})
+                ).order_by(f'-{ts}', '-pk')
+
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+        if reverse:
+            results.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+
+        self.page = results
+        return results
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def encode_cursor(self, instance, reverse):
+        # Rows are model instances or, on the values() fast path, dicts.
+        if isinstance(instance, dict):
+            timestamp, pk = instance[self.timestamp_field], instance['pk']
+        else:
+            timestamp, pk = getattr(instance, self.timestamp_field), instance.pk
+        payload = {
+            't': timestamp.isoformat(),
+            'i': pk,
+            'r': int(reverse),
+        }
+        token = base64.urlsafe_b64encode(json.dumps(payload, separators=(',', ':')).encode()).decode()
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, token)
+
+    def decode_cursor(self, request):
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token.encode()).decode())
+            return datetime.fromisoformat(payload['t']), int(payload['i']), bool(payload['r'])
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+
+
+class JobKeysetPagination(KeysetPagination):
+    timestamp_field = 'created_at'
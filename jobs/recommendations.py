@@ -0,0 +1,223 @@
+import hashlib
+import math
+import re
+from collections import Counter
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+
+from jobs.caching import get_cache_version
+from jobs.indexing import SyncedJobIndex
+from jobs.models import Job
+
+# Terms are hashed into a fixed vocabulary, so new jobs never force a rebuild.
+DIMENSIONS = 2 ** 18
+# Only the strongest terms of each job are kept, which bounds memory per job.
+MAX_TERMS_PER_JOB = 64
+# Rows scored per batch, which bounds the temporary arrays of one query.
+SCORE_BATCH_ROWS = 50000
+
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*")
+STOP_WORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has', 'have', 'in', 'is', 'it',
+    'of', 'on', 'or', 'our', 'the', 'to', 'we', 'will', 'with', 'you', 'your', 'role', 'job', 'work',
+}
+
+# How much each text field counts towards a document's term frequencies.
+JOB_FIELD_WEIGHTS = (('title', 3), ('requirements', 2), ('description', 1))
+PROFILE_FIELD_WEIGHTS = (('skills', 3), ('experience', 1), ('education', 1))
+
+
+def term_frequencies(fields):
+    """Hash `(text, weight)` pairs into `(term ids, log-scaled tf)` arrays."""
+    counts = Counter()
+    for text, weight in fields:
+        for token in TOKEN_RE.findall((text or '').lower()):
+            if token not in STOP_WORDS and len(token) > 1:
+                counts[token] += weight
+    top = counts.most_common(MAX_TERMS_PER_JOB)
+
+    buckets = Counter()
+    for token, count in top:
+        digest = hashlib.blake2b(token.encode(), digest_size=4).digest()
+        buckets[int.from_bytes(digest, 'little') % DIMENSIONS] += count
+    terms = np.fromiter(buckets.keys(), dtype=np.int32, count=len(buckets))
+    tf = np.fromiter((1 + math.log(count) for count in buckets.values()), dtype=np.float32, count=len(buckets))
+    return terms, tf
+
+
+def job_terms(job):
+    return term_frequencies((job[field], weight) for field, weight in JOB_FIELD_WEIGHTS)
+
+
+def profile_terms(user):
+    return term_frequencies((getattr(user, field), weight) for field, weight in PROFILE_FIELD_WEIGHTS)
+
+
+class RecommendationIndex(SyncedJobIndex):
+    """
+    In-memory TF-IDF index over active jobs, stored as compact NumPy arrays.
+
+    Jobs are kept in CSR layout: `indptr` delimits each row's slice of the
+    `terms`/`tf` arrays and `row_ids` maps every stored term back to its row.
+    A seeker is scored against all rows with a sparse matrix-vector product
+    (a weighted `bincount`) in batches of SCORE_BATCH_ROWS rows. Replaced
+    rows are masked out and compacted away once they make up half the index.
+    """
+    fields = tuple(field for field, _ in JOB_FIELD_WEIGHTS)
+    sync_interval_setting = 'RECOMMENDATIONS_SYNC_INTERVAL'
+
+    def _reset(self):
+        self.job_ids = np.zeros(0, dtype=np.int64)
+        self.alive = np.zeros(0, dtype=bool)
+        self.indptr = np.zeros(1, dtype=np.int64)
+        self.terms = np.zeros(0, dtype=np.int32)
+        self.tf = np.zeros(0, dtype=np.float32)
+        self.row_ids = np.zeros(0, dtype=np.int32)
+        self.df = np.zeros(DIMENSIONS, dtype=np.int32)
+        self.row_of = {}
+        self._pending = []
+        self._weights = None
+
+    def _add(self, job):
+        terms, tf = job_terms(job)
+        self._pending.append((job['id'], terms, tf))
+        self.row_of[job['id']] = ('pending', len(self._pending) - 1)
+        np.add.at(self.df, terms, 1)
+        self._weights = None
+
+    def _remove(self, job_id):
+        location = self.row_of.pop(job_id, None)
+        if location is None:
+            return
+        kind, row = location
+        if kind == 'pending':
+            _, terms, _ = self._pending[row]
+            self._pending[row] = None
+        else:
+            terms = self.terms[self.indptr[row]:self.indptr[row + 1]]
+            self.alive[row] = False
+        np.subtract.at(self.df, terms, 1)
+        self._weights = None
+
+    def _merge_pending(self):
+        pending = [item for item in self._pending if item is not None]
+        self._pending = []
+        if pending:
+            lengths = np.array([len(terms) for _, terms, _ in pending], dtype=np.int64)
+            first_row = len(self.job_ids)
+            self.job_ids = np.concatenate([self.job_ids, np.array([job_id for job_id, _, _ in pending], dtype=np.int64)])
+            self.alive = np.concatenate([self.alive, np.ones(len(pending), dtype=bool)])
+            self.indptr = np.concatenate([self.indptr, self.indptr[-1] + np.cumsum(lengths)])
+            self.terms = np.concatenate([self.terms] + [terms for _, terms, _ in pending])
+            self.tf = np.concatenate([self.tf] + [tf for _, _, tf in pending])
+            new_rows = np.repeat(np.arange(first_row, first_row + len(pending), dtype=np.int32), lengths)
+            self.row_ids = np.concatenate([self.row_ids, new_rows])
+            for offset, (job_id, _, _) in enumerate(pending):
+                self.row_of[job_id] = ('row', first_row + offset)
+
+        if len(self.alive) and self.alive.sum() * 2 < len(self.alive):
+            self._compact()
+
+    def _compact(self):
+        keep = self.alive
+        lengths = np.diff(self.indptr)[keep]
+        mask = np.repeat(keep, np.diff(self.indptr))
+        self.job_ids = self.job_ids[keep]
+        self.alive = np.ones(len(self.job_ids), dtype=bool)
+        self.indptr = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+        self.terms = self.terms[mask]
+        self.tf = self.tf[mask]
+        self.row_ids = np.repeat(np.arange(len(self.job_ids), dtype=np.int32), lengths)
+        self.row_of = {int(job_id): ('row', row) for row, job_id in enumerate(self.job_ids)}
+
+    def _prepare(self):
+        """Refresh the TF-IDF weights and row norms after the index changed."""
+        if self._pending or self._weights is None:
+            self._merge_pending()
+            documents = max(int(self.alive.sum()), 1)
+            self._idf = (np.log((1 + documents) / (1 + self.df.clip(min=0))) + 1).astype(np.float32)
+            self._weights = self.tf * self._idf[self.terms]
+            norms = np.bincount(self.row_ids, weights=self._weights ** 2, minlength=len(self.job_ids))
+            self._norms = np.sqrt(norms).astype(np.float32)
+
+    def top_jobs(self, terms, tf, limit, exclude=()):
+        """
+        Job ids ranked by cosine similarity to the `(terms, tf)` profile, or
+        None while the index is still being built.
+        """
+        if not self.sync():
+            return None
+        with self._lock:
+            self._prepare()
+            if not len(terms) or not len(self.job_ids):
+                return []
+
+            query = np.zeros(DIMENSIONS, dtype=np.float32)
+            query[terms] = tf * self._idf[terms]
+            query /= np.linalg.norm(query) or 1.0
+
+            scores = np.zeros(len(self.job_ids), dtype=np.float32)
+            for start in range(0, len(self.job_ids), SCORE_BATCH_ROWS):
+                stop = min(start + SCORE_BATCH_ROWS, len(self.job_ids))
+                lo, hi = self.indptr[start], self.indptr[stop]
+                contributions = self._weights[lo:hi] * query[self.terms[lo:hi]]
+                scores[start:stop] = np.bincount(
+                    self.row_ids[lo:hi] - start, weights=contributions, minlength=stop - start
+                )
+
+            scores /= np.where(self._norms > 0, self._norms, 1)
+            scores[~self.alive] = 0
+            if exclude:
+                scores[np.isin(self.job_ids, np.fromiter(exclude, dtype=np.int64))] = 0
+
+            candidates = np.flatnonzero(scores > 0)
+            if len(candidates) > limit:
+                candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+            ranked = candidates[np.argsort(-scores[candidates], kind='stable')]
+            return [int(job_id) for job_id in self.job_ids[ranked]]
+
+
+recommendation_index = RecommendationIndex()
+
+
+def profile_fingerprint(user):
+    raw = '|'.join(getattr(user, field) or '' for field, _ in PROFILE_FIELD_WEIGHTS)
+    return hashlib.md5(raw.encode()).hexdigest()
+
+
+def recommended_job_ids(user, limit=None):
+    """
+    Ranked ids of active jobs the seeker has not applied to yet.
+
+    Rankings are cached per seeker, keyed on their profile text and the job
+    board version, so profile edits and job changes both produce fresh
+    results. Seekers without a usable profile get the newest jobs instead, as
+    does everyone while the index is still warming up after a restart.
+    """
+    limit = limit or getattr(settings, 'RECOMMENDATIONS_LIMIT', 100)
+    from applications.models import Application
+
+    applied = set(Application.objects.filter(applicant=user).values_list('job_id', flat=True))
+    key = f"jobs:recommended:{user.pk}:{profile_fingerprint(user)}:{get_cache_version()}"
+    ranked = cache.get(key)
+    if ranked is None:
+        terms, tf = profile_terms(user)
+        ranked = recommendation_index.top_jobs(terms, tf, limit + len(applied), exclude=applied)
+        if ranked is None:
+            # The index is still warming up: newest jobs for now, not cached.
+            ranked = []
+        else:
+            cache.set(key, ranked, getattr(settings, 'RECOMMENDATIONS_CACHE_TIMEOUT', 600))
+
+    ranked = [job_id for job_id in ranked if job_id not in applied][:limit]
+    if len(ranked) < limit:
+        newest = (
+            Job.objects.filter(is_active=True)
+            .exclude(pk__in=applied | set(ranked))
+            .order_by('-created_at')
+            .values_list('id', flat=True)[:limit - len(ranked)]
+        )
+        ranked += list(newest)
+    return ranked
@@ -0,0 +1,34 @@
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connections
+from django.db.models import F
+from rest_framework.filters import SearchFilter
+
+# Text search configuration used both by the trigger that maintains
+# Job.search_vector (see migration 0002) and by the queries below.
+SEARCH_CONFIG = 'english'
+
+
+class JobSearchFilter(SearchFilter):
+    """
+    Relevance-ranked full-text search over the weighted Job.search_vector.
+
+    Title matches rank above company name, which ranks above
+    requirements/description, which rank above location. On databases other
+    than PostgreSQL it falls back to DRF's portable `icontains` search over
+    the view's `search_fields`.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        search_terms = self.get_search_terms(request)
+        if not search_terms:
+            return queryset
+
+        if connections[queryset.db].vendor != 'postgresql':
+            return super().filter_queryset(request, queryset, view)
+
+        query = SearchQuery(' '.join(search_terms), config=SEARCH_CONFIG, search_type='websearch')
+        return (
+            queryset.filter(search_vector=query)
+            .annotate(search_rank=SearchRank(F('search_vector'), query))
+            .order_by('-search_rank', '-created_at', '-id')
+        )
@@ -1,5 +1,8 @@
+from django.utils import timezone
 from rest_framework import serializers
+from api.fieldsets import SparseFieldsetSerializerMixin
 from jobs.models import Job, JobCategory
+from jobs.signals import jobs_bulk_changed
 
 class JobCategorySerializer(serializers.ModelSerializer):
     job_count = serializers.IntegerField(read_only=True)
@@ -9,7 +12,7 @@ class JobCategorySerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'description', 'job_count']
         read_only_fields = ['id', 'job_count']
 
-class JobSerializer(serializers.ModelSerializer):
+class JobSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     category = JobCategorySerializer(read_only=True)
     employer_name = serializers.ReadOnlyField(source='employer.get_full_name')
     
@@ -28,6 +31,13 @@ class JobSerializer(serializers.ModelSerializer):
             'employment_type', 'experience_level', 'remote_option', 'salary'
         ]
         read_only_fields = ['id', 'created_at', 'employer_name']
+        # List default: everything but the long description and requirements.
+        compact_fields = [
+            'id', 'employer', 'employer_name', 'title', 'company_name', 'location', 'category',
+            'is_featured', 'is_active', 'created_at', 'employment_type', 'experience_level',
+            'remote_option', 'salary',
+        ]
+        field_columns = {'employer_name': ['employer__first_name', 'employer__last_name']}
 
     def update(self, instance, validated_data):
         request = self.context.get('request')
@@ -37,6 +47,81 @@ class JobSerializer(serializers.ModelSerializer):
             validated_data.pop('is_featured', None)
         return super().update(instance, validated_data)
 
+class JobBulkListSerializer(serializers.ListSerializer):
+    """
+    Validates a list of jobs in one pass and writes it with one statement.
+
+    All `category_id`s are resolved with a single JobCategory query up front.
+    For updates, `instance` is a `{pk: Job}` dict and every item carries the
+    `id` of the job it changes. Errors come back as a list aligned with the
+    input, so each one points at its item.
+    """
+
+    def to_internal_value(self, data):
+        if isinstance(data, list):
+            ids = {item.get('category_id') for item in data if isinstance(item, dict)}
+            self.categories = JobCategory.objects.in_bulk([pk for pk in ids if str(pk).isdigit()])
+        return super().to_internal_value(data)
+
+    def run_child_validation(self, data):
+        if self.instance is not None:
+            job = self.instance.get(data.get('id')) if isinstance(data, dict) else None
+            if job is None:
+                raise serializers.ValidationError({'id': ["Job not found."]})
+            self.child.instance = job
+            self.child.initial_data = data
+        return super().run_child_validation(data)
+
+    def create(self, validated_data):
+        employer = self.context['request'].user
+        jobs = Job.objects.bulk_create(
+            Job(employer=employer, category=self.categories[attrs.pop('category_id')], **attrs)
+            for attrs in validated_data
+        )
+        jobs_bulk_changed.send(
+            sender=Job, category_ids={job.category_id for job in jobs}, job_ids=[job.pk for job in jobs]
+        )
+        return jobs
+
+    def update(self, instance, validated_data):
+        request = self.context.get('request')
+        is_admin = getattr(request.user, 'role', '').lower() == 'admin'
+        jobs, fields, category_ids = [], {'updated_at'}, set()
+        now = timezone.now()
+
+        for item, attrs in zip(self.initial_data, validated_data):
+            job = instance[item['id']]
+            if not is_admin:
+                attrs.pop('is_active', None)
+                attrs.pop('is_featured', None)
+            category_ids.add(job.category_id)
+            if 'category_id' in attrs:
+                job.category = self.categories[attrs.pop('category_id')]
+                category_ids.add(job.category_id)
+                fields.add('category')
+            for name, value in attrs.items():
+                setattr(job, name, value)
+            fields.update(attrs)
+            job.updated_at = now
+            jobs.append(job)
+
+        Job.objects.bulk_update(jobs, sorted(fields))
+        jobs_bulk_changed.send(sender=Job, category_ids=category_ids, job_ids=[job.pk for job in jobs])
+        return jobs
+
+class JobBulkSerializer(JobSerializer):
+    """JobSerializer for `/jobs/bulk/`; the employer is always the requesting user."""
+    category_id = serializers.IntegerField(write_only=True)
+
+    class Meta(JobSerializer.Meta):
+        read_only_fields = JobSerializer.Meta.read_only_fields + ['employer']
+        list_serializer_class = JobBulkListSerializer
+
+    def validate_category_id(self, value):
+        if value not in self.parent.categories:
+            raise serializers.ValidationError(f'Invalid pk "{value}" - object does not exist.')
+        return value
+
 class SimpleJobDetailSerializer(serializers.ModelSerializer):
     """Serializer used for nesting inside ApplicationSerializer."""
     employer_name = serializers.ReadOnlyField(source='employer.get_full_name')
@@ -45,4 +130,5 @@ class SimpleJobDetailSerializer(serializers.ModelSerializer):
         model = Job
         fields = (
             'id', 'title', 'company_name', 'employer_name', 'location', 'employment_type', 'remote_option'
-        )
\ No newline at end of file
+        )
+        field_columns = {'employer_name': ['employer__first_name', 'employer__last_name']}
\ No newline at end of file
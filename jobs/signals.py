@@ -0,0 +1,102 @@
+from django.core.signals import request_finished
+from django.db import DatabaseError, transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import Signal, receiver
+
+from jobs.autocomplete import autocomplete_index
+from jobs.caching import bump_cache_version
+from jobs.counts import adjust_category_counts, recount_categories
+from jobs.models import Job, JobCategory, JobCategoryCount
+from jobs.recommendations import recommendation_index
+from jobs.similarity import TEXT_FIELDS, refresh_signature, update_signatures
+from jobs.tracking import job_views
+
+# Sent after bulk writes that bypass post_save (`QuerySet.update()`,
+# `bulk_create()`), with `category_ids` set to the categories they touched
+# and, when job text may have changed, `job_ids` set to the jobs written.
+jobs_bulk_changed = Signal()
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+@receiver(post_save, sender=JobCategory)
+@receiver(post_delete, sender=JobCategory)
+def invalidate_job_board_cache(sender, **kwargs):
+    bump_cache_version()
+
+
+@receiver(post_save, sender=JobCategory)
+def create_category_counts(sender, instance, created, **kwargs):
+    if created:
+        JobCategoryCount.objects.get_or_create(category=instance)
+
+
+@receiver(post_save, sender=Job)
+def update_category_counts_on_save(sender, instance, created, **kwargs):
+    previous = None if created else getattr(instance, '_loaded_category_state', None)
+    if previous is None and not created:
+        return
+    current = (instance.category_id, instance.is_active)
+    instance._loaded_category_state = current
+    if previous == current:
+        return
+
+    if previous is not None:
+        adjust_category_counts(previous[0], -1, -int(bool(previous[1])))
+    adjust_category_counts(current[0], 1, int(current[1]))
+
+
+@receiver(post_delete, sender=Job)
+def update_category_counts_on_delete(sender, instance, **kwargs):
+    category_id, is_active = getattr(instance, '_loaded_category_state', (instance.category_id, instance.is_active))
+    adjust_category_counts(category_id, -1, -int(bool(is_active)))
+
+
+def refresh_job_indexes(job_ids):
+    """Have the in-process job indexes re-read `job_ids` once the transaction commits."""
+    job_ids = list(job_ids)
+
+    def mark_changed():
+        recommendation_index.mark_changed(job_ids)
+        autocomplete_index.mark_changed(job_ids)
+    transaction.on_commit(mark_changed)
+
+
+@receiver(post_save, sender=Job)
+def refresh_job_indexes_on_save(sender, instance, **kwargs):
+    refresh_job_indexes([instance.pk])
+
+
+@receiver(post_save, sender=Job)
+def update_similarity_signature(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not set(update_fields) & set(TEXT_FIELDS):
+        return
+    refresh_signature(instance)
+
+
+@receiver(post_delete, sender=Job)
+def refresh_job_indexes_on_delete(sender, instance, **kwargs):
+    refresh_job_indexes([instance.pk])
+
+
+@receiver(jobs_bulk_changed)
+def refresh_after_bulk_change(sender, category_ids, job_ids=(), **kwargs):
+    recount_categories(category_ids)
+    if job_ids:
+        update_signatures(job_ids)
+    bump_cache_version()
+    if job_ids:
+        refresh_job_indexes(job_ids)
+    else:
+        recommendation_index.mark_stale()
+        autocomplete_index.mark_stale()
+
+
+@receiver(request_finished)
+def flush_job_views(sender, **kwargs):
+    """Flush buffered job views after the response has been sent, never during it."""
+    try:
+        job_views.flush_if_due()
+    except DatabaseError:
+        # The views were put back into the buffer and go out with the next flush.
+        pass
@@ -0,0 +1,132 @@
+import hashlib
+import re
+
+import numpy as np
+from django.db import transaction
+from django.db.models import Count, Q
+
+from jobs.models import Job, JobLshBucket, JobSignature
+
+# 20 bands of 3 rows: jobs whose shingle sets have a Jaccard similarity of
+# about 0.37 or more share at least one bucket with probability > 1/2.
+NUM_PERM = 60
+BANDS = 20
+ROWS_PER_BAND = NUM_PERM // BANDS
+SHINGLE_SIZE = 2
+# Candidates re-ranked by signature per query, most shared buckets first.
+MAX_CANDIDATES = 200
+
+TEXT_FIELDS = ('title', 'requirements', 'description')
+WORD_RE = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+
+def _hash64(data):
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'little')
+
+
+# Multiply-shift hash family. Derived from fixed labels rather than an RNG so
+# every process and every NumPy version produces the same signatures.
+_A = np.array([_hash64(f'minhash-a-{i}'.encode()) | 1 for i in range(NUM_PERM)], dtype=np.uint64)
+_B = np.array([_hash64(f'minhash-b-{i}'.encode()) for i in range(NUM_PERM)], dtype=np.uint64)
+
+
+def shingles(job):
+    """Hashes of the word `SHINGLE_SIZE`-grams of a job's title, requirements and description."""
+    words = []
+    for field in TEXT_FIELDS:
+        words.extend(WORD_RE.findall((job[field] or '').lower()))
+    if len(words) < SHINGLE_SIZE:
+        grams = {' '.join(words)} if words else set()
+    else:
+        grams = {' '.join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)}
+    return np.fromiter((_hash64(gram.encode()) for gram in grams), dtype=np.uint64, count=len(grams))
+
+
+def minhash(hashes):
+    """The NUM_PERM-value MinHash signature of a set of shingle hashes, or None when it is empty."""
+    if not len(hashes):
+        return None
+    with np.errstate(over='ignore'):
+        permuted = (_A[:, None] * hashes[None, :] + _B[:, None]) >> np.uint64(32)
+    return permuted.min(axis=1).astype('<u4')
+
+
+def band_buckets(signature):
+    """One signed 64-bit bucket key per band."""
+    return [
+        _hash64(bytes([band]) + signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND].tobytes()) - 2 ** 63
+        for band in range(BANDS)
+    ]
+
+
+def update_signatures(job_ids):
+    """(Re)compute the signatures and LSH buckets of the given jobs in bulk."""
+    jobs = Job.objects.filter(pk__in=job_ids).values('id', *TEXT_FIELDS)
+    signatures, buckets = [], []
+    for job in jobs:
+        signature = minhash(shingles(job))
+        if signature is None:
+            continue
+        signatures.append(JobSignature(job_id=job['id'], minhash=signature.tobytes()))
+        buckets.extend(
+            JobLshBucket(job_id=job['id'], band=band, bucket=bucket)
+            for band, bucket in enumerate(band_buckets(signature))
+        )
+
+    with transaction.atomic():
+        JobSignature.objects.filter(job_id__in=job_ids).delete()
+        JobLshBucket.objects.filter(job_id__in=job_ids).delete()
+        JobSignature.objects.bulk_create(signatures)
+        JobLshBucket.objects.bulk_create(buckets)
+    return len(signatures)
+
+
+def refresh_signature(job):
+    """Re-index one saved job, skipping the writes when its text did not change."""
+    signature = minhash(shingles({field: getattr(job, field) for field in TEXT_FIELDS}))
+    stored = JobSignature.objects.filter(job=job).values_list('minhash', flat=True).first()
+    if signature is None and stored is None:
+        return
+    if signature is not None and stored is not None and bytes(stored) == signature.tobytes():
+        return
+    update_signatures([job.pk])
+
+
+def similar_jobs(job, limit=10):
+    """
+    `(job_id, estimated Jaccard similarity)` pairs of the active jobs most like
+    `job`, best first.
+
+    Candidates come from the LSH buckets the job shares with others (an
+    indexed lookup per band) and are re-ranked by the fraction of equal
+    signature values, so the cost depends on the bucket sizes, not on the
+    number of jobs.
+    """
+    stored = JobSignature.objects.filter(job=job).values_list('minhash', flat=True).first()
+    if stored is None:
+        update_signatures([job.pk])
+        stored = JobSignature.objects.filter(job=job).values_list('minhash', flat=True).first()
+        if stored is None:
+            return []
+    signature = np.frombuffer(bytes(stored), dtype='<u4')
+
+    shared = Q()
+    for band, bucket in enumerate(band_buckets(signature)):
+        shared |= Q(band=band, bucket=bucket)
+    candidates = list(
+        JobLshBucket.objects.filter(shared, job__is_active=True)
+        .exclude(job=job)
+        .values('job')
+        .annotate(hits=Count('id'))
+        .order_by('-hits', 'job')
+        .values_list('job', flat=True)[:MAX_CANDIDATES]
+    )
+    if not candidates:
+        return []
+
+    rows = list(JobSignature.objects.filter(job_id__in=candidates).values_list('job_id', 'minhash'))
+    ids = np.fromiter((job_id for job_id, _ in rows), dtype=np.int64)
+    matrix = np.frombuffer(b''.join(bytes(value) for _, value in rows), dtype='<u4').reshape(len(ids), NUM_PERM)
+    scores = (matrix == signature).mean(axis=1)
+    order = np.lexsort((ids, -scores))[:limit]
+    return [(int(ids[i]), float(scores[i])) for i in order]
@@ -1,3 +1,687 @@
-from django.test import TestCase
+import csv
+import io
+import json
+from datetime import timedelta
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from applications.models import Application
+from applications.resumes import store_resume
+from jobs.autocomplete import autocomplete_index, database_suggestions
+from jobs.caching import response_cache_stats
+from jobs.indexing import warm_up_job_indexes
+from jobs.models import Job, JobCategory, JobCategoryCount
+from jobs.recommendations import recommendation_index
+
+
+class JobKeysetPaginationTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        employer = User.objects.create_user(email='employer@example.com', password='p', role='employer')
+        cls.category = JobCategory.objects.create(name='Engineering')
+        jobs = [
+            Job.objects.create(
+                employer=employer, title=f'Developer {index}', company_name='Acme', description='Build APIs.',
+                category=cls.category, remote_option=Job.REMOTE if index % 3 else Job.ON_SITE,
+            )
+            for index in range(15)
+        ]
+        # Ties on created_at are broken by id.
+        Job.objects.filter(pk__in=[job.pk for job in jobs[4:10]]).update(created_at=jobs[4].created_at)
+        cls.newest_first = list(Job.objects.order_by('-created_at', '-pk').values_list('pk', flat=True))
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def ids(self, response):
+        return [job['id'] for job in response.data['results']]
+
+    def test_walks_forward_and_back_without_counting(self):
+        first = self.client.get('/api/v1/jobs/?cursor=')
+        self.assertNotIn('count', first.data)
+        self.assertIsNone(first.data['previous'])
+        self.assertEqual(self.ids(first), self.newest_first[:12])
+
+        second = self.client.get(first.data['next'])
+        self.assertIsNone(second.data['next'])
+        self.assertEqual(self.ids(second), self.newest_first[12:])
+
+        back = self.client.get(second.data['previous'])
+        self.assertEqual(self.ids(back), self.newest_first[:12])
+        self.assertIsNone(back.data['previous'])
+
+    def test_cursor_pages_respect_filters(self):
+        response = self.client.get('/api/v1/jobs/?cursor=&remote_option=remote')
+
+        expected = list(
+            Job.objects.filter(remote_option=Job.REMOTE).order_by('-created_at', '-pk').values_list('pk', flat=True)
+        )
+        self.assertEqual(self.ids(response), expected)
+        self.assertIsNone(response.data['next'])
+
+    def test_page_numbers_stay_the_default(self):
+        response = self.client.get('/api/v1/jobs/?page=2')
+
+        self.assertEqual(response.data['count'], 15)
+        self.assertEqual(len(response.data['results']), 3)
+
+    def test_invalid_cursor_is_not_found(self):
+        self.assertEqual(self.client.get('/api/v1/jobs/?cursor=bogus').status_code, 404)
+
+
+class JobExportTests(TestCase):
+    """
+    Lists are rendered from values() rows (api.fastpath), `?no_pagination`
+    and `?export=` downloads by the serializer; all of them must agree.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        employer = User.objects.create_user(email='employer@example.com', password='p', role='employer')
+        category = JobCategory.objects.create(name='Engineering')
+        for index in range(3):
+            Job.objects.create(
+                employer=employer, title=f'Developer {index}', company_name='Acme', description='Build APIs.',
+                requirements='Python', location='Dhaka', category=category, salary=Decimal(1000 + index),
+            )
+
+    def setUp(self):
+        # Anonymous list responses are cached; every test starts cold.
+        cache.clear()
+        self.client = APIClient()
+
+    def get(self, query):
+        return self.client.get(f'/api/v1/jobs/{query}')
+
+    def stream(self, query):
+        return b''.join(self.get(query).streaming_content).decode()
+
+    def test_streamed_list_matches_the_paginated_list(self):
+        listed = json.loads(self.get('').content)['results']
+
+        self.assertEqual(len(listed), 3)
+        self.assertEqual(json.loads(self.stream('?no_pagination')), listed)
+
+    def test_downloads_keep_every_field(self):
+        listed = json.loads(self.get('?fields=*').content)['results']
+
+        self.assertIn('description', listed[0])
+        self.assertEqual([json.loads(line) for line in self.stream('?export=ndjson').splitlines()], listed)
+
+    def test_csv_export_flattens_nested_fields(self):
+        rows = list(csv.DictReader(io.StringIO(self.stream('?export=csv'))))
+        listed = json.loads(self.get('').content)['results']
+
+        self.assertEqual([row['id'] for row in rows], [str(job['id']) for job in listed])
+        self.assertEqual(rows[0]['category.name'], 'Engineering')
+
+    def test_unknown_formats_are_rejected(self):
+        self.assertEqual(self.get('?export=xml').status_code, 400)
+
+    def test_sparse_fieldsets_apply_to_list_detail_and_export(self):
+        listed = json.loads(self.get('?fields=id,title').content)['results']
+
+        self.assertEqual([set(row) for row in listed], [{'id', 'title'}] * 3)
+        self.assertEqual([json.loads(line) for line in self.stream('?export=ndjson&fields=id,title').splitlines()], listed)
+        self.assertEqual(json.loads(self.get(f"{listed[0]['id']}/?fields=title").content), {'title': listed[0]['title']})
+
+        omitted = json.loads(self.get('?omit=category,employer_name').content)['results'][0]
+        self.assertNotIn('category', omitted)
+        self.assertIn('title', omitted)
+
+    def test_unknown_fields_are_rejected(self):
+        self.assertEqual(self.get('?fields=nope').status_code, 400)
+
+
+class AnonymousResponseCacheTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.employer = User.objects.create_user(email='employer@example.com', password='p', role='employer')
+        cls.category = JobCategory.objects.create(name='Engineering')
+        cls.job = Job.objects.create(
+            employer=cls.employer, title='Developer', company_name='Acme', description='Build APIs.',
+            category=cls.category, remote_option=Job.REMOTE,
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def test_repeated_lists_are_hits_whatever_the_parameter_order(self):
+        first = self.client.get('/api/v1/jobs/?remote_option=remote&page=1&ordering=-created_at')
+        second = self.client.get('/api/v1/jobs/?ordering=-created_at&remote_option=remote')
+
+        self.assertEqual(first['X-Cache'], 'MISS')
+        self.assertEqual(second['X-Cache'], 'HIT')
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(response_cache_stats(), {'hits': 1, 'misses': 1, 'hit_ratio': 0.5})
+
+    def test_job_save_and_delete_invalidate_lists_and_details(self):
+        detail = f'/api/v1/jobs/{self.job.pk}/'
+        self.client.get('/api/v1/jobs/')
+        self.client.get(detail)
+
+        self.job.title = 'Senior Developer'
+        self.job.save()
+
+        listed = self.client.get('/api/v1/jobs/')
+        self.assertEqual(listed['X-Cache'], 'MISS')
+        self.assertEqual(listed.data['results'][0]['title'], 'Senior Developer')
+        self.assertEqual(self.client.get(detail)['X-Cache'], 'MISS')
+
+        self.job.delete()
+
+        self.assertEqual(self.client.get('/api/v1/jobs/').data['count'], 0)
+        self.assertEqual(self.client.get(detail).status_code, 404)
+
+    def test_category_save_invalidates_categories_and_jobs(self):
+        self.client.get('/api/v1/job-categories/')
+        self.client.get('/api/v1/jobs/')
+
+        self.category.name = 'Software'
+        self.category.save()
+
+        categories = self.client.get('/api/v1/job-categories/')
+        self.assertEqual(categories['X-Cache'], 'MISS')
+        self.assertEqual(categories.data[0]['name'], 'Software')
+        self.assertEqual(self.client.get('/api/v1/jobs/').data['results'][0]['category']['name'], 'Software')
+
+    def test_authenticated_requests_are_never_cached(self):
+        self.client.force_authenticate(self.employer)
+
+        self.client.get('/api/v1/jobs/')
+        response = self.client.get('/api/v1/jobs/')
+
+        self.assertFalse(response.has_header('X-Cache'))
+        self.assertEqual(response_cache_stats()['hit_ratio'], None)
+
+
+class JobConditionalGetTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.employer = User.objects.create_user(email='employer@example.com', password='p', role='employer')
+        cls.seeker = User.objects.create_user(email='seeker@example.com', password='p', role='seeker')
+        category = JobCategory.objects.create(name='Engineering')
+        cls.jobs = [
+            Job.objects.create(
+                employer=cls.employer, title=f'Developer {index}', company_name='Acme', description='Build APIs.',
+                requirements='Python', category=category,
+            )
+            for index in range(2)
+        ]
+
+    def setUp(self):
+        cache.clear()
+
+    def assert_revalidated_after_apply(self, client):
+        url = '/api/v1/jobs/?ordering=-applications_count'
+        etag = client.get(url)['ETag']
+        self.assertEqual(client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        Application.objects.create(job=self.jobs[0], applicant=self.seeker, resume_blob_id=store_resume('Resume'))
+
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['results'][0]['id'], self.jobs[0].pk)
+
+    def test_applications_count_ordering_is_revalidated_for_anonymous_clients(self):
+        self.assert_revalidated_after_apply(APIClient())
+
+    def test_applications_count_ordering_is_revalidated_for_authenticated_clients(self):
+        client = APIClient()
+        client.force_authenticate(self.employer)
+        self.assert_revalidated_after_apply(client)
+
+    def test_unchanged_list_is_not_modified(self):
+        client = APIClient()
+        etag = client.get('/api/v1/jobs/')['ETag']
+
+        self.assertEqual(client.get('/api/v1/jobs/', HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+
+class JobCategoryConditionalGetTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.employer = User.objects.create_user(email='employer@example.com', password='p', role='employer')
+        cls.category = JobCategory.objects.create(name='Engineering')
+        cls.job = Job.objects.create(
+            employer=cls.employer, title='Developer', company_name='Acme', description='Build APIs.',
+            requirements='Python', category=cls.category,
+        )
+
+    def setUp(self):
+        cache.clear()
+        # Authenticated, so every request computes its validators.
+        self.client = APIClient()
+        self.client.force_authenticate(self.employer)
+
+    def test_validators_do_not_scan_jobs(self):
+        etag = self.client.get('/api/v1/job-categories/')['ETag']
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/v1/job-categories/', HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertFalse([query for query in queries.captured_queries if '"jobs_job"' in query['sql']])
+
+    def test_job_changes_revalidate_list_and_detail(self):
+        urls = ['/api/v1/job-categories/', f'/api/v1/job-categories/{self.category.pk}/']
+        etags = [self.client.get(url)['ETag'] for url in urls]
+
+        self.job.is_active = False
+        self.job.save()
+
+        for url, etag in zip(urls, etags):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 200, url)
+        self.assertEqual(self.client.get(urls[1]).data['job_count'], 0)
+
+
+class JobFacetTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        employer = User.objects.create_user(email='employer@example.com', password='p', role='employer')
+        cls.engineering = JobCategory.objects.create(name='Engineering')
+        for employment_type, remote_option, salary, count in [
+            (Job.Full_Time, Job.REMOTE, 95000, 3),
+            (Job.Contract, Job.ON_SITE, 40000, 2),
+            (Job.Internship, Job.REMOTE, None, 1),
+        ]:
+            for _ in range(count):
+                Job.objects.create(
+                    employer=employer, title='Developer', company_name='Acme', description='Build APIs.',
+                    category=cls.engineering, employment_type=employment_type, remote_option=remote_option,
+                    salary=salary,
+                )
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def counts(self, data, facet):
+        return {bucket['value']: bucket['count'] for bucket in data['facets'][facet] if bucket['count']}
+
+    def test_counts_every_facet(self):
+        data = self.client.get('/api/v1/jobs/facets/').data
+
+        self.assertEqual(data['total'], 6)
+        self.assertEqual(self.counts(data, 'employment_type'), {Job.Full_Time: 3, Job.Contract: 2, Job.Internship: 1})
+        self.assertEqual(self.counts(data, 'remote_option'), {Job.REMOTE: 4, Job.ON_SITE: 2})
+        self.assertEqual(self.counts(data, 'category'), {self.engineering.pk: 6})
+        self.assertEqual(self.counts(data, 'salary'), {'30000-60000': 2, '90000-120000': 3})
+
+    def test_selections_never_narrow_their_own_facet(self):
+        data = self.client.get('/api/v1/jobs/facets/?employment_type__in=full_time,internship').data
+
+        self.assertEqual(data['total'], 4)
+        self.assertEqual(self.counts(data, 'employment_type'), {Job.Full_Time: 3, Job.Contract: 2, Job.Internship: 1})
+        self.assertEqual(self.counts(data, 'remote_option'), {Job.REMOTE: 4})
+        self.assertEqual(data['total'], self.client.get('/api/v1/jobs/?employment_type__in=full_time,internship').data['count'])
+
+    def test_invalid_filters_are_rejected_like_the_list(self):
+        for query in ('salary__gt=lots', 'category_id=oops', 'application_deadline__gte=someday'):
+            with self.subTest(query=query):
+                listed = self.client.get(f'/api/v1/jobs/?{query}')
+                faceted = self.client.get(f'/api/v1/jobs/facets/?{query}')
+
+                self.assertEqual(listed.status_code, 400)
+                self.assertEqual(faceted.status_code, 400)
+                self.assertEqual(set(faceted.data), set(listed.data))
+
+    def test_counts_are_cached_until_a_job_changes(self):
+        self.client.get('/api/v1/jobs/facets/')
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get('/api/v1/jobs/facets/')
+        self.assertEqual(len(queries), 0)
+
+        Job.objects.filter(employment_type=Job.Contract).first().delete()
+
+        self.assertEqual(self.client.get('/api/v1/jobs/facets/').data['total'], 5)
+
+
+class JobExpiryTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.employer = User.objects.create_user(email='employer@example.com', password='p', role='employer')
+        cls.category = JobCategory.objects.create(name='Engineering')
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.today = timezone.localdate()
+
+    def create_job(self, days, is_active=True):
+        return Job.objects.create(
+            employer=self.employer, title='Developer', company_name='Acme', description='Build APIs.',
+            category=self.category, is_active=is_active,
+            application_deadline=None if days is None else self.today + timedelta(days=days),
+        )
+
+    def closing_soon(self, query=''):
+        return self.client.get(f'/api/v1/jobs/closing-soon/{query}')
+
+    def test_closing_soon_lists_open_jobs_soonest_first(self):
+        later, sooner, today = self.create_job(3), self.create_job(1), self.create_job(0)
+        distant = self.create_job(10)
+        self.create_job(-1)
+        self.create_job(2, is_active=False)
+        self.create_job(None)
+
+        self.assertEqual([job['id'] for job in self.closing_soon().data['results']], [today.pk, sooner.pk, later.pk])
+        self.assertEqual(
+            [job['id'] for job in self.closing_soon('?days=30').data['results']],
+            [today.pk, sooner.pk, later.pk, distant.pk],
+        )
+
+    def test_closing_soon_rejects_bad_windows(self):
+        self.assertEqual(self.closing_soon('?days=soon').status_code, 400)
+        self.assertEqual(self.closing_soon('?days=366').status_code, 400)
+
+    def test_expire_jobs_deactivates_only_overdue_jobs(self):
+        overdue = [self.create_job(-days) for days in (1, 2, 30)]
+        open_jobs = [self.create_job(0), self.create_job(5), self.create_job(None)]
+        detail = f'/api/v1/jobs/{overdue[0].pk}/'
+        self.assertTrue(self.client.get(detail).data['is_active'])
+
+        call_command('expire_jobs', batch_size=2, stdout=io.StringIO())
+
+        self.assertFalse(Job.objects.filter(pk__in=[job.pk for job in overdue], is_active=True).exists())
+        self.assertEqual(Job.objects.filter(pk__in=[job.pk for job in open_jobs], is_active=True).count(), 3)
+        # The sweep bypasses post_save but still invalidates cached responses.
+        self.assertFalse(self.client.get(detail).data['is_active'])
+
+    def test_expire_jobs_dry_run_changes_nothing(self):
+        self.create_job(-1)
+        out = io.StringIO()
+
+        call_command('expire_jobs', dry_run=True, stdout=out)
+
+        self.assertIn('1 jobs', out.getvalue())
+        self.assertTrue(Job.objects.get().is_active)
+
+
+class JobAutocompleteTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.employer = User.objects.create_user(email='employer@example.com', password='p', role='employer')
+        cls.category = JobCategory.objects.create(name='Engineering')
+        cls.jobs = [
+            Job.objects.create(
+                employer=cls.employer, title=title, company_name=company, description='Build APIs.',
+                location='Dhaka', category=cls.category,
+            )
+            for title, company in [
+                ('Python Developer', 'Pathao'), ('Python Developer', 'Acme'),
+                ('Python Developer', 'Acme'), ('Product Manager', 'Pathao'), ('Designer', 'Acme'),
+            ]
+        ]
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        autocomplete_index.build()
+        # The index is per process; later tests must not see this one.
+        self.addCleanup(setattr, autocomplete_index, '_built', False)
+
+    def suggest(self, query):
+        return self.client.get(f'/api/v1/jobs/autocomplete/{query}')
+
+    def test_suggests_the_most_common_values_first(self):
+        data = self.suggest('?q=p').data
+
+        self.assertEqual(data['title'], [{'value': 'Python Developer', 'count': 3}, {'value': 'Product Manager', 'count': 1}])
+        self.assertEqual(data['company_name'], [{'value': 'Pathao', 'count': 2}])
+        self.assertEqual(data['location'], [])
+        self.assertEqual(self.suggest('?q=PY&field=title&limit=1').data, {'title': [{'value': 'Python Developer', 'count': 3}]})
+
+    def test_saved_and_deleted_jobs_update_cached_suggestions(self):
+        self.suggest('?q=py&field=title')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.jobs[0].title = 'Pylons Expert'
+            self.jobs[0].save()
+        self.assertEqual(
+            self.suggest('?q=py&field=title').data['title'],
+            [{'value': 'Python Developer', 'count': 2}, {'value': 'Pylons Expert', 'count': 1}],
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.jobs[1].is_active = False
+            self.jobs[1].save()
+            self.jobs[0].delete()
+        self.assertEqual(self.suggest('?q=py&field=title').data['title'], [{'value': 'Python Developer', 'count': 1}])
+
+    def test_bulk_changes_are_picked_up(self):
+        self.suggest('?q=des&field=title')
+        Job.objects.filter(pk=self.jobs[4].pk).update(application_deadline=timezone.localdate() - timedelta(days=1))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command('expire_jobs', stdout=io.StringIO())
+
+        self.assertEqual(self.suggest('?q=des&field=title').data['title'], [])
+
+    def test_answers_from_the_database_while_the_index_builds(self):
+        autocomplete_index._built = False
+
+        with mock.patch.object(autocomplete_index, 'warm_up') as warm_up:
+            response = self.suggest('?q=p')
+
+        warm_up.assert_called_once()
+        self.assertEqual(response.data, database_suggestions('p'))
+        self.assertEqual(response.data['title'][0], {'value': 'Python Developer', 'count': 3})
+
+    def test_unknown_field_is_rejected(self):
+        self.assertEqual(self.suggest('?q=p&field=salary').status_code, 400)
+
+
+class JobIndexWarmUpTests(TestCase):
+
+    @override_settings(JOB_INDEX_WARM_UP=False)
+    def test_warm_up_can_be_turned_off(self):
+        with mock.patch.object(autocomplete_index, 'warm_up') as warm_up:
+            warm_up_job_indexes()
+
+        warm_up.assert_not_called()
+
+    @override_settings(JOB_INDEX_WARM_UP=True)
+    def test_warm_up_starts_every_index(self):
+        with mock.patch.object(autocomplete_index, 'warm_up') as autocomplete, \
+                mock.patch.object(recommendation_index, 'warm_up') as recommendations:
+            warm_up_job_indexes()
+
+        autocomplete.assert_called_once()
+        recommendations.assert_called_once()
+
+
+@override_settings(TRENDING_VIEW_WEIGHT=1, TRENDING_APPLICATION_WEIGHT=10, TRENDING_HALF_LIFE_HOURS=24)
+class TrendingScoreTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        employer = User.objects.create_user(email='employer@example.com', password='p', role='employer')
+        category = JobCategory.objects.create(name='Engineering')
+        cls.fresh, cls.popular, cls.stale, cls.closed = [
+            Job.objects.create(
+                employer=employer, title=title, company_name='Acme', description='Build APIs.', category=category,
+            )
+            for title in ('Fresh', 'Popular', 'Stale', 'Closed')
+        ]
+        now = timezone.now()
+        # Engagement 1 + 9 views + 1 application * 10 = 20, one half-life old.
+        Job.objects.filter(pk=cls.popular.pk).update(
+            views_count=9, applications_count=1, created_at=now - timedelta(hours=24),
+        )
+        Job.objects.filter(pk=cls.stale.pk).update(views_count=9, applications_count=1, created_at=now - timedelta(days=30))
+        Job.objects.filter(pk=cls.closed.pk).update(is_active=False, trending_score=0)
+
+    def setUp(self):
+        cache.clear()
+
+    def scores(self):
+        return dict(Job.objects.values_list('title', 'trending_score'))
+
+    def test_scores_decay_with_age(self):
+        call_command('update_trending_scores', stdout=io.StringIO())
+
+        scores = self.scores()
+        self.assertAlmostEqual(scores['Fresh'], 1.0, places=3)
+        self.assertAlmostEqual(scores['Popular'], 10.0, places=3)
+        self.assertAlmostEqual(scores['Stale'], 20.0 / 2 ** 30, places=9)
+        # Inactive jobs are only scored by a backfill.
+        self.assertEqual(scores['Closed'], 0)
+
+    def test_backfill_scores_every_job_in_batches(self):
+        out = io.StringIO()
+
+        call_command('update_trending_scores', backfill=True, batch_size=3, stdout=out)
+
+        self.assertAlmostEqual(self.scores()['Closed'], 1.0, places=3)
+        self.assertIn('4 jobs', out.getvalue())
+
+    def test_ordering_by_trending_is_revalidated_after_an_update(self):
+        client = APIClient()
+        url = '/api/v1/jobs/?ordering=-trending'
+        before = [job['title'] for job in client.get(url).data['results']]
+
+        call_command('update_trending_scores', stdout=io.StringIO())
+
+        after = [job['title'] for job in client.get(url).data['results']]
+        self.assertNotEqual(before, after)
+        self.assertEqual(after, ['Popular', 'Fresh', 'Stale', 'Closed'])
+
+
+class CategoryCountTests(TestCase):
+    """JobCategoryCount follows every job write that can change a category's counts."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.employer = User.objects.create_user(email='employer@example.com', password='p', role='employer')
+        cls.admin = User.objects.create_user(email='admin@example.com', password='p', role='admin')
+        cls.engineering = JobCategory.objects.create(name='Engineering')
+        cls.design = JobCategory.objects.create(name='Design')
+
+    def setUp(self):
+        cache.clear()
+        self.job = self.create_job()
+
+    def create_job(self, **fields):
+        return Job.objects.create(
+            employer=self.employer, title='Developer', company_name='Acme', description='Build APIs.',
+            category=fields.pop('category', self.engineering), **fields,
+        )
+
+    def counts(self, category):
+        """(total, active) jobs of `category`."""
+        return tuple(JobCategoryCount.objects.values_list('total_jobs', 'active_jobs').get(category=category))
+
+    def client_for(self, user):
+        client = APIClient()
+        client.force_authenticate(user)
+        return client
+
+    def test_create_counts_active_and_inactive_jobs(self):
+        self.create_job(is_active=False)
+
+        self.assertEqual(self.counts(self.engineering), (2, 1))
+        self.assertEqual(self.counts(self.design), (0, 0))
+
+    def test_category_move_shifts_the_counts(self):
+        self.job.category = self.design
+        self.job.save()
+
+        self.assertEqual(self.counts(self.engineering), (0, 0))
+        self.assertEqual(self.counts(self.design), (1, 1))
+
+    def test_deactivation_and_reactivation(self):
+        self.job.is_active = False
+        self.job.save()
+        self.assertEqual(self.counts(self.engineering), (1, 0))
+
+        self.job.is_active = True
+        self.job.save(update_fields=['is_active'])
+        self.assertEqual(self.counts(self.engineering), (1, 1))
+
+    def test_saving_stale_instances_counts_each_change_once(self):
+        self.create_job()
+        first, stale = Job.objects.get(pk=self.job.pk), Job.objects.get(pk=self.job.pk)
+
+        first.is_active = False
+        first.save()
+        # Loaded as active, but the row lock shows it was deactivated already.
+        stale.is_active = False
+        stale.save()
+
+        self.assertEqual(self.counts(self.engineering), (2, 1))
+
+    def test_delete_uncounts_the_job_once(self):
+        self.create_job()
+        stale = Job.objects.get(pk=self.job.pk)
+
+        self.job.delete()
+        self.assertEqual(stale.delete(), (0, {}))
+
+        self.assertEqual(self.counts(self.engineering), (1, 1))
+
+    def test_cascade_delete_uncounts_the_employers_jobs(self):
+        other = User.objects.create_user(email='other@example.com', password='p', role='employer')
+        Job.objects.create(employer=other, title='Designer', company_name='Acme', description='Draw.', category=self.design)
+        self.assertEqual(self.counts(self.design), (1, 1))
+
+        other.delete()
+
+        self.assertEqual(self.counts(self.design), (0, 0))
+        self.assertEqual(self.counts(self.engineering), (1, 1))
+
+    def test_bulk_create_and_patch(self):
+        item = {'title': 'Designer', 'company_name': 'Acme', 'description': 'Draw.', 'category_id': self.design.pk}
+        response = self.client_for(self.employer).post('/api/v1/jobs/bulk/', [item, item], format='json')
+        self.assertEqual(response.status_code, 201, response.data)
+        self.assertEqual(self.counts(self.design), (2, 2))
+
+        created = [job['id'] for job in response.data]
+        response = self.client_for(self.admin).patch('/api/v1/jobs/bulk/', [
+            {'id': created[0], 'category_id': self.engineering.pk},
+            {'id': created[1], 'is_active': False},
+        ], format='json')
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(self.counts(self.engineering), (2, 2))
+        self.assertEqual(self.counts(self.design), (1, 0))
+
+    def test_expire_jobs_uncounts_expired_jobs(self):
+        self.create_job(application_deadline=timezone.localdate() - timedelta(days=1))
+
+        call_command('expire_jobs', stdout=io.StringIO())
+
+        self.assertEqual(self.counts(self.engineering), (2, 1))
+
+    def test_rebuild_repairs_drifted_counts(self):
+        JobCategoryCount.objects.update(total_jobs=9, active_jobs=9)
+
+        call_command('rebuild_category_counts', stdout=io.StringIO())
+
+        self.assertEqual(self.counts(self.engineering), (1, 1))
+        self.assertEqual(self.counts(self.design), (0, 0))
+
+    def test_list_reads_active_counts(self):
+        self.create_job(is_active=False)
+
+        response = APIClient().get('/api/v1/job-categories/')
+
+        self.assertEqual({row['name']: row['job_count'] for row in response.data}, {'Engineering': 1, 'Design': 0})
@@ -0,0 +1,79 @@
+import atexit
+import threading
+import time
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.db import DatabaseError, transaction
+from django.db.models import F
+
+from jobs.models import Job
+
+
+class JobViewBuffer:
+    """
+    In-process buffer for Job.views_count increments.
+
+    `record()` only bumps an in-memory counter, so job detail requests never
+    write to the (possibly hot) job row. Pending views are flushed with one
+    `UPDATE ... SET views_count = views_count + n` per distinct `n`.
+
+    Flushes are driven by requests, not by a timer: when a request finishes
+    (see `jobs.signals.flush_job_views`) the buffer is flushed if it holds
+    `max_pending` views or `max_age` seconds have passed since the last
+    flush, and once more at interpreter exit. An idle process keeps its
+    pending views until its next request, and loses them if it is killed,
+    or frozen and recycled as serverless platforms do, before then; atexit
+    handlers do not run in those cases. views_count is therefore a lower
+    bound, good for ranking but not for anything that must be exact.
+    """
+
+    def __init__(self, max_pending=None, max_age=None):
+        self.max_pending = max_pending or getattr(settings, 'JOB_VIEWS_FLUSH_THRESHOLD', 100)
+        self.max_age = max_age or getattr(settings, 'JOB_VIEWS_FLUSH_INTERVAL', 30)
+        self._lock = threading.Lock()
+        self._pending = Counter()
+        self._pending_total = 0
+        self._last_flush = time.monotonic()
+
+    def record(self, job_id):
+        with self._lock:
+            self._pending[job_id] += 1
+            self._pending_total += 1
+
+    def is_due(self):
+        return self._pending_total >= self.max_pending or (
+            self._pending_total and time.monotonic() - self._last_flush >= self.max_age
+        )
+
+    def flush_if_due(self):
+        if self.is_due():
+            self.flush()
+
+    def flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, Counter()
+            self._pending_total = 0
+            self._last_flush = time.monotonic()
+        if not pending:
+            return 0
+
+        job_ids_by_increment = defaultdict(list)
+        for job_id, views in pending.items():
+            job_ids_by_increment[views].append(job_id)
+
+        try:
+            with transaction.atomic():
+                for views, job_ids in job_ids_by_increment.items():
+                    Job.objects.filter(pk__in=job_ids).update(views_count=F('views_count') + views)
+        except DatabaseError:
+            # Put the views back so the next flush retries them.
+            with self._lock:
+                self._pending.update(pending)
+                self._pending_total += sum(pending.values())
+            raise
+        return len(pending)
+
+
+job_views = JobViewBuffer()
+atexit.register(job_views.flush)
@@ -0,0 +1,65 @@
+import math
+
+from django.conf import settings
+from django.db.models import DateTimeField, F, FloatField, Func, Value
+from django.db.models.functions import Exp, Greatest
+from django.utils import timezone
+
+from jobs.models import Job
+
+# EXP() of anything lower underflows a double, which PostgreSQL reports as an
+# error instead of returning 0.
+MIN_EXPONENT = -700.0
+
+
+class SecondsSince(Func):
+    """Seconds from `expression` (a datetime column) to the datetime `now`."""
+    template = 'EXTRACT(EPOCH FROM (%(now)s - %(expressions)s))::double precision'
+    output_field = FloatField()
+
+    def __init__(self, expression, now, **extra):
+        super().__init__(expression, Value(now, output_field=DateTimeField()), **extra)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        expression, now = self.source_expressions
+        now_sql, now_params = compiler.compile(now)
+        expression_sql, expression_params = compiler.compile(expression)
+        template = extra_context.pop('template', self.template)
+        sql = template % {'now': now_sql, 'expressions': expression_sql}
+        return sql, (*now_params, *expression_params)
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return self.as_sql(
+            compiler, connection, template='((julianday(%(now)s) - julianday(%(expressions)s)) * 86400.0)',
+            **extra_context,
+        )
+
+
+def trending_score(now=None):
+    """
+    SQL expression for a job's trending score as of `now`.
+
+    Engagement (`1 + views * TRENDING_VIEW_WEIGHT + applications *
+    TRENDING_APPLICATION_WEIGHT`) halves every `TRENDING_HALF_LIFE_HOURS` of
+    the job's age, so a new job with no engagement scores 1.0, the field
+    default.
+    """
+    now = now or timezone.now()
+    decay_rate = math.log(2) / (settings.TRENDING_HALF_LIFE_HOURS * 3600)
+    engagement = (
+        1.0
+        + F('views_count') * float(settings.TRENDING_VIEW_WEIGHT)
+        + F('applications_count') * float(settings.TRENDING_APPLICATION_WEIGHT)
+    )
+    exponent = Greatest(SecondsSince('created_at', now) * -decay_rate, Value(MIN_EXPONENT))
+    return engagement * Exp(exponent)
+
+
+def update_trending_scores(queryset=None, now=None):
+    """
+    Recompute `trending_score` for `queryset` (active jobs by default) in
+    one set-based UPDATE; returns the number of jobs updated.
+    """
+    if queryset is None:
+        queryset = Job.objects.filter(is_active=True)
+    return queryset.update(trending_score=trending_score(now))
@@ -1,21 +1,44 @@
+import hashlib
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
 from django.http import HttpResponseRedirect
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django_filters import utils as filter_utils
 from rest_framework.viewsets import ModelViewSet
 from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly, AllowAny
-from django.db.models import Count
+from django.db.models import Count, F, Max
+from django.db.models.functions import Coalesce
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework.filters import SearchFilter, OrderingFilter
 from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
 
+from api.conditional import ConditionalGetMixin
+from api.exports import StreamingExportMixin
+from api.fastpath import ValuesListMixin
+from api.fieldsets import SparseFieldsetViewMixin
+from jobs.autocomplete import FIELDS as AUTOCOMPLETE_FIELDS, autocomplete_index, database_suggestions
+from jobs.caching import AnonymousResponseCacheMixin, get_cache_version, normalized_query
+from jobs.facets import FACET_PARAMS, compute_facets
 from jobs.models import Job, JobCategory
-from jobs.serializers import JobSerializer, JobCategorySerializer
-from jobs.filters import JobFilter
-from jobs.paginations import DefaultPagination
+from jobs.serializers import JobBulkSerializer, JobSerializer, JobCategorySerializer
+from jobs.filters import JobFilter, JobOrderingFilter
+from jobs.paginations import DefaultPagination, JobKeysetPagination
+from jobs.recommendations import recommended_job_ids
 from jobs.permissions import IsAdminOrOwner
+from jobs.search import JobSearchFilter
+from jobs.similarity import similar_jobs
+from jobs.tracking import job_views
 
 try:
     from applications.models import Application
+    from applications.pipeline import job_pipeline
+    from applications.serializers import ApplicationSerializer
 except ImportError:
     Application = None
 
@@ -25,14 +48,20 @@ except ImportError:
 # Job ViewSet
 # -----------------------------
 
-class JobViewSet(ModelViewSet):
-    queryset = Job.objects.select_related("category", "employer").all().order_by("-created_at")
+class JobViewSet(
+    AnonymousResponseCacheMixin, ConditionalGetMixin, StreamingExportMixin, SparseFieldsetViewMixin, ValuesListMixin,
+    ModelViewSet,
+):
+    queryset = Job.objects.select_related("category", "employer").defer("search_vector").order_by("-created_at")
     serializer_class = JobSerializer
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    filter_backends = [DjangoFilterBackend, JobSearchFilter, JobOrderingFilter]
     filterset_class = JobFilter
     search_fields = ["title", "company_name", "description", "location"]
-    ordering_fields = ["created_at", "company_name", "title"]
+    ordering_fields = [
+        "created_at", "company_name", "title", "applications_count", "salary", "application_deadline", "trending",
+    ]
     pagination_class = DefaultPagination
+    sparse_required_columns = ["created_at", "updated_at"]
 
     def get_queryset(self):
         user = self.request.user
@@ -53,16 +82,222 @@ class JobViewSet(ModelViewSet):
 
         return queryset
 
+    @property
+    def paginator(self):
+        # `?cursor=` opts into keyset pagination; page numbers stay the default.
+        if not hasattr(self, '_paginator') and JobKeysetPagination.is_requested(getattr(self, 'request', None)):
+            self._paginator = JobKeysetPagination()
+        return super().paginator
+
     def paginate_queryset(self, queryset):
         if 'no_pagination' in self.request.query_params:
             return None
         return super().paginate_queryset(queryset)
 
+    def get_list_validators(self, queryset):
+        etag_source, last_modified = super().get_list_validators(queryset)
+        ordering = JobOrderingFilter().get_ordering(self.request, queryset, self) or []
+        if any(term.lstrip("-") in Job.DB_MAINTAINED_FIELDS for term in ordering):
+            # Counters and trending scores change without touching updated_at;
+            # whatever changes them bumps the cache version instead.
+            etag_source = f"{etag_source}:{get_cache_version()}"
+        return etag_source, last_modified
+
+    def retrieve(self, request, *args, **kwargs):
+        response = super().retrieve(request, *args, **kwargs)
+        # Buffered; written to views_count in batches (see jobs.tracking).
+        job_views.record(int(self.kwargs[self.lookup_field]))
+        return response
+
     def get_permissions(self):
-        if self.action in ["list", "retrieve", "has_applied"]:
+        if self.action in ["list", "retrieve", "has_applied", "facets", "closing_soon", "similar", "autocomplete"]:
             return [IsAuthenticatedOrReadOnly()]
         return [IsAuthenticated(), IsAdminOrOwner()]
 
+    @action(detail=False, methods=['get'])
+    def facets(self, request):
+        """
+        Facet counts for the job board sidebar, from one aggregate query.
+
+        Accepts the same filters and `?search=` as the list. Values selected
+        within a facet (e.g. `?employment_type__in=full_time,contract`) are
+        OR-ed and never narrow that facet's own counts.
+        """
+        params = request.query_params
+        scope = request.user.pk if 'employer' in params else ''
+        filter_set = normalized_query(params, ignore=('page', 'ordering', 'cursor', 'no_pagination', 'export', 'format'))
+        digest = hashlib.md5(f"{scope}|{filter_set}".encode()).hexdigest()
+        key = f"jobs:facets:{get_cache_version()}:{digest}"
+
+        data = cache.get(key)
+        if data is None:
+            # Same validation (and 400s) as the list, facet selections included.
+            filterset = JobFilter(params, queryset=self.get_queryset(), request=request)
+            if not filterset.is_valid():
+                raise filter_utils.translate_validation(filterset.errors)
+
+            base_params = params.copy()
+            for names in FACET_PARAMS.values():
+                for name in names:
+                    base_params.pop(name, None)
+            queryset = JobFilter(base_params, queryset=self.get_queryset(), request=request).qs
+            queryset = JobSearchFilter().filter_queryset(request, queryset, self)
+
+            data = compute_facets(queryset, params)
+            cache.set(key, data, getattr(settings, 'JOB_RESPONSE_CACHE_TIMEOUT', 300))
+        return Response(data)
+
+    @action(detail=False, methods=['post', 'patch'])
+    def bulk(self, request):
+        """
+        Create (POST) or partially update (PATCH, each item with its `id`) up to
+        JOB_BULK_MAX_ITEMS jobs in one request. Nothing is written unless every
+        item is valid; errors are returned as a list aligned with the input.
+        """
+        user = request.user
+        user_role = getattr(user, 'role', '').lower()
+        if user_role not in ('employer', 'admin'):
+            return Response({"detail": "Only employers can post jobs."}, status=status.HTTP_403_FORBIDDEN)
+
+        jobs = None
+        if request.method == 'PATCH':
+            items = request.data if isinstance(request.data, list) else []
+            ids = [item.get('id') for item in items if isinstance(item, dict) and isinstance(item.get('id'), int)]
+            jobs = Job.objects.select_related("category", "employer").defer("search_vector")
+            if user_role != 'admin':
+                jobs = jobs.filter(employer=user)
+            jobs = jobs.in_bulk(ids)
+
+        serializer = JobBulkSerializer(
+            jobs,
+            data=request.data,
+            many=True,
+            partial=jobs is not None,
+            allow_empty=False,
+            max_length=getattr(settings, 'JOB_BULK_MAX_ITEMS', 500),
+            context=self.get_serializer_context(),
+        )
+        serializer.is_valid(raise_exception=True)
+        with transaction.atomic():
+            serializer.save()
+        return Response(serializer.data, status=status.HTTP_200_OK if jobs is not None else status.HTTP_201_CREATED)
+
+    @action(detail=False, methods=['get'])
+    def autocomplete(self, request):
+        """
+        Typeahead suggestions: the most common titles, companies and locations
+        of active jobs starting with `?q=`, with job counts. `?field=` limits
+        the response to one of them and `?limit=` (default 5, max 20) sets the
+        number of suggestions per field.
+        """
+        prefix = request.query_params.get('q', '')
+        field = request.query_params.get('field')
+        if field is not None and field not in AUTOCOMPLETE_FIELDS:
+            raise ValidationError({'field': [f"Must be one of: {', '.join(AUTOCOMPLETE_FIELDS)}."]})
+        try:
+            limit = min(max(int(request.query_params.get('limit', '5')), 1), 20)
+        except ValueError:
+            raise ValidationError({'limit': ["Enter a whole number."]})
+
+        digest = hashlib.md5(f"{prefix.strip().lower()}|{field}|{limit}".encode()).hexdigest()
+        key = f"jobs:autocomplete:{get_cache_version()}:{digest}"
+        data = cache.get(key)
+        if data is None:
+            fields = [field] if field else AUTOCOMPLETE_FIELDS
+            data = autocomplete_index.suggest(prefix, limit, fields=fields)
+            if data is None:
+                # The index is still warming up in this process; not cached.
+                return Response(database_suggestions(prefix, limit, fields=fields))
+            cache.set(key, data, getattr(settings, 'JOB_RESPONSE_CACHE_TIMEOUT', 300))
+        return Response(data)
+
+    @action(detail=False, methods=['get'], url_path='closing-soon')
+    def closing_soon(self, request):
+        """
+        Open jobs whose application deadline falls within the next `?days=`
+        days (7 by default), soonest first. Served by job_active_deadline_idx.
+        """
+        try:
+            days = int(request.query_params.get('days', '7'))
+        except ValueError:
+            raise ValidationError({'days': ["Enter a whole number."]})
+        if not 0 <= days <= 365:
+            raise ValidationError({'days': ["Must be between 0 and 365."]})
+
+        today = timezone.localdate()
+        queryset = self.get_queryset().filter(
+            is_active=True,
+            application_deadline__gte=today,
+            application_deadline__lte=today + timedelta(days=days),
+        ).order_by('application_deadline', 'id')
+
+        # Always page numbers: keyset cursors follow created_at, not the deadline.
+        paginator = DefaultPagination()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        serializer = self.get_serializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
+
+    @action(detail=False, methods=['get'], permission_classes=[IsAuthenticated])
+    def recommended(self, request):
+        """
+        Active jobs ranked by how well they match the seeker's skills,
+        experience and education, excluding jobs they already applied to.
+        """
+        user = request.user
+        if getattr(user, "role", "").lower() != "seeker":
+            return Response({"detail": "Only job seekers get recommendations."}, status=status.HTTP_403_FORBIDDEN)
+
+        # Always page numbers: the ranking is a list of ids, not a keyset.
+        paginator = DefaultPagination()
+        job_ids = paginator.paginate_queryset(recommended_job_ids(user), request, view=self)
+        jobs = self.get_queryset().filter(is_active=True).in_bulk(job_ids)
+        serializer = self.get_serializer([jobs[pk] for pk in job_ids if pk in jobs], many=True)
+        return paginator.get_paginated_response(serializer.data)
+
+    @action(detail=True, methods=['get'])
+    def similar(self, request, pk=None):
+        """
+        Up to `?limit=` (default 10, max 50) active jobs most similar to this
+        one, best first, each with its estimated `similarity` (0-1).
+        """
+        try:
+            limit = min(max(int(request.query_params.get('limit', '10')), 1), 50)
+        except ValueError:
+            raise ValidationError({'limit': ["Enter a whole number."]})
+
+        job = self.get_object()
+        key = f"jobs:similar:{get_cache_version()}:{job.pk}:{limit}"
+        data = cache.get(key)
+        if data is None:
+            ranked = similar_jobs(job, limit)
+            # The cached rows are shared by every caller, so they come from the
+            # public queryset rather than the role-scoped get_queryset().
+            public = super().get_queryset().filter(is_active=True)
+            jobs = public.in_bulk([job_id for job_id, _ in ranked])
+            data = [
+                {**self.get_serializer(jobs[job_id]).data, 'similarity': round(score, 3)}
+                for job_id, score in ranked
+                if job_id in jobs
+            ]
+            cache.set(key, data, getattr(settings, 'JOB_RESPONSE_CACHE_TIMEOUT', 300))
+        return Response(data)
+
+    @action(detail=True, methods=['get'])
+    def pipeline(self, request, pk=None):
+        """
+        Applicant board for the job's employer (or an admin): every status
+        with its count and newest applications, which honour `?fields=`.
+        """
+        if not Application:
+            return Response({"detail": "Application model not loaded."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        # Not get_object(): `?fields=` here selects application fields.
+        job = get_object_or_404(Job.objects.only("id", "employer"), pk=pk)
+        if getattr(request.user, "role", "").lower() != "admin" and job.employer_id != request.user.id:
+            return Response({"detail": "Only the job's employer can view its pipeline."}, status=status.HTTP_403_FORBIDDEN)
+        context = {"request": request, "format": self.format_kwarg, "view": self}
+        return Response(job_pipeline(job, ApplicationSerializer, context))
+
     @action(detail=True, methods=['get'], url_path='has-applied', permission_classes=[IsAuthenticated])
     def has_applied(self, request, pk=None):
         user = request.user
@@ -95,11 +330,23 @@ class JobViewSet(ModelViewSet):
 # JobCategory ViewSet
 # -----------------------------
 
-class JobCategoryViewSet(ModelViewSet):
-    queryset = JobCategory.objects.annotate(job_count=Count("jobs")).all()
+class JobCategoryViewSet(AnonymousResponseCacheMixin, ConditionalGetMixin, ModelViewSet):
+    # Active jobs only, read from the materialized JobCategoryCount rows.
+    queryset = JobCategory.objects.annotate(job_count=Coalesce(F("counts__active_jobs"), 0)).order_by("pk")
     serializer_class = JobCategorySerializer
     pagination_class = None
 
+    # job_count moves with the jobs table, which every job write, bulk change
+    # and expiry sweep signals by bumping the cache version: the version stands
+    # in for the jobs' state, so validating never scans the jobs table. That
+    # state has no timestamp, so only an ETag is sent.
+    def get_list_validators(self, queryset):
+        categories = JobCategory.objects.aggregate(last_modified=Max("updated_at"), total=Count("pk"))
+        return f"{categories['total']}:{categories['last_modified']}:{get_cache_version()}", None
+
+    def get_object_validators(self, instance):
+        return f"{instance.pk}:{instance.updated_at}:{get_cache_version()}", None
+
     def get_permissions(self):
         if self.action in ["list", "retrieve"]:
             return [IsAuthenticatedOrReadOnly()]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.7 on 2026-10-17 19:23
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0003_job_indexes'),
+        ('reviews', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='employerreview',
+            index=models.Index(fields=['job', '-created_at'], name='review_job_created_idx'),
+        ),
+    ]
@@ -19,6 +19,9 @@ class EmployerReview(models.Model):
         constraints = [
             models.UniqueConstraint(fields=['employer', 'job_seeker', 'job'], name='unique_employer_review_per_job')
         ]
+        indexes = [
+            models.Index(fields=['job', '-created_at'], name='review_job_created_idx'),
+        ]
         ordering = ['-created_at']
 
     def __str__(self):
@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from api.conditional import ConditionalGetMixin
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.exceptions import PermissionDenied
 from reviews.models import EmployerReview
@@ -7,7 +8,7 @@ from reviews.permissions import CanReviewAcceptedJob
 from jobs.models import Job
 from drf_yasg.utils import swagger_auto_schema
 
-class EmployerReviewViewSet(ModelViewSet):
+class EmployerReviewViewSet(ConditionalGetMixin, ModelViewSet):
     """
     Reviews for an employer/job. Expects `job_pk` from nested route.
     """
@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 
 from decouple import config
 from pathlib import Path
+import os
 from datetime import timedelta
 import cloudinary
 
@@ -227,6 +228,93 @@ DJOSER = {
 }
 
 
+# Cache
+# Local memory by default; point this at a shared backend (Redis, Memcached,
+# database) in production so the anonymous job board cache is shared.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+# Anonymous job/category responses (see jobs/caching.py). Entries are also
+# invalidated immediately whenever a job or category changes.
+
+JOB_RESPONSE_CACHE_TIMEOUT = 300
+
+
+# Job view counting (see jobs/tracking.py): buffered views are flushed when a
+# request finishes after this many views or this many seconds. Nothing flushes
+# an idle process, so views it holds are lost if it is killed or recycled.
+
+JOB_VIEWS_FLUSH_THRESHOLD = 100
+JOB_VIEWS_FLUSH_INTERVAL = 30
+
+
+# Seeker recommendations (jobs/recommendations.py): how often each process
+# picks up edited jobs, how many ranked ids are kept per seeker, and for how long.
+
+RECOMMENDATIONS_SYNC_INTERVAL = 10
+RECOMMENDATIONS_LIMIT = 100
+RECOMMENDATIONS_CACHE_TIMEOUT = 600
+
+
+# Job autocomplete (jobs/autocomplete.py): how often each process picks up
+# edited jobs. Both in-process job indexes (jobs/indexing.py) also re-read
+# jobs updated this many seconds before their last sync, so transactions
+# that commit late are not missed.
+
+JOB_INDEX_SYNC_INTERVAL = 10
+JOB_INDEX_SYNC_OVERLAP = 300
+
+# Whether each server process starts building both job indexes when it boots
+# (talent_bridge/wsgi.py and asgi.py). A build reads every active job and
+# computes its TF-IDF vectors, so it is off by default on Vercel, where
+# functions cold-start often and are frozen between requests: there an index
+# starts building the first time it is queried, and requests fall back to
+# the database until it is ready. Set JOB_INDEX_WARM_UP in the environment to
+# override.
+JOB_INDEX_WARM_UP = config('JOB_INDEX_WARM_UP', default='VERCEL' not in os.environ, cast=bool)
+
+
+# Largest list accepted by POST/PATCH /jobs/bulk/, and most ids per
+# POST /applications/bulk-status/.
+
+JOB_BULK_MAX_ITEMS = 500
+APPLICATION_BULK_MAX_ITEMS = 1000
+
+
+# GET /jobs/{id}/pipeline/ (see applications/pipeline.py): applications shown
+# per status column, and how long a board is cached. Boards are also
+# invalidated whenever one of the job's applications changes.
+
+APPLICATION_PIPELINE_PAGE_SIZE = 10
+APPLICATION_PIPELINE_CACHE_TIMEOUT = 300
+
+
+# Resume text is stored once per SHA-256 digest (see applications/resumes.py).
+# The database backend keeps it in its own table; for local development and
+# tests use 'applications.resumes.FileSystemResumeBackend' with
+# 'OPTIONS': {'location': BASE_DIR / 'media' / 'resumes'}.
+# Applicant search (`/applications/?q=`) only indexes resume text kept by the
+# database backend.
+
+RESUME_STORAGE = {
+    'BACKEND': 'applications.resumes.DatabaseResumeBackend',
+    'OPTIONS': {},
+}
+
+
+# `?ordering=-trending` (see jobs/trending.py): engagement weights and how
+# many hours it takes a job's score to halve. Scores are refreshed by
+# `manage.py update_trending_scores`.
+
+TRENDING_VIEW_WEIGHT = 1
+TRENDING_APPLICATION_WEIGHT = 10
+TRENDING_HALF_LIFE_HOURS = 48
+
+
 # Swagger Configuration
 
 SWAGGER_SETTINGS = {
@@ -14,3 +14,10 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'talent_bridge.settings')
 
 app = get_wsgi_application()
+
+# Build the in-process job indexes (recommendations, autocomplete) now rather
+# than on the first request that needs them, unless JOB_INDEX_WARM_UP is off
+# (the default on Vercel, see settings).
+from jobs.indexing import warm_up_job_indexes  # noqa: E402
+
+warm_up_job_indexes()